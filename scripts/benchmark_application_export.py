@@ -0,0 +1,141 @@
+import argparse
+import time
+import tracemalloc
+import warnings
+from datetime import date, datetime, timedelta, timezone
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+from sqlalchemy import create_engine, insert, text
+from sqlalchemy.pool import StaticPool
+from sqlmodel import Session
+
+from src.common.config import settings
+from src.database.postgres.models.db_models import (
+    Application,
+    ApplicationStatus,
+    Business,
+    Market,
+)
+from src.module.market.service.market_service import MarketService
+
+APPLICATION_FORM = {
+    "questions": [
+        {"id": "q1", "type": "text", "label": "Tell us about your products"},
+        {"id": "q2", "type": "single_choice", "label": "Category"},
+        {"id": "q3", "type": "multiple_choice", "label": "Days attending"},
+    ]
+}
+
+
+def create_database(rows: int):
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    with engine.begin() as connection:
+        for table in (Application.__table__, Business.__table__, Market.__table__):
+            columns = ", ".join(column.name for column in table.columns)
+            connection.execute(text(f"CREATE TABLE {table.name} ({columns})"))
+        connection.execute(
+            text("CREATE UNIQUE INDEX businesses_pkey ON businesses (id)")
+        )
+
+    now = datetime.now(timezone.utc)
+    market = Market(
+        id=uuid4(),
+        organizer_user_id=uuid4(),
+        market_name="Summer Artisan Market",
+        email="organizer@example.com",
+        location_text="Trinity Bellwoods Park",
+        market_size="100-499",
+        description="A weekend market featuring local makers.",
+        start_date=date.today(),
+        end_date=date.today(),
+        application_form=APPLICATION_FORM,
+        created_at=now,
+    )
+    business_ids = [uuid4() for _ in range(rows)]
+    statuses = list(ApplicationStatus)
+    with engine.begin() as connection:
+        connection.execute(
+            insert(Business.__table__),
+            [
+                {
+                    "id": business_id,
+                    "owner_user_id": uuid4(),
+                    "shop_name": f"Jane's Ceramics #{index}",
+                    "email": f"vendor{index}@example.com",
+                    "category": "Ceramics",
+                }
+                for index, business_id in enumerate(business_ids)
+            ],
+        )
+        connection.execute(
+            insert(Application.__table__),
+            [
+                {
+                    "id": uuid4(),
+                    "market_id": market.id,
+                    "business_id": business_id,
+                    "status": statuses[index % len(statuses)].value,
+                    "applied_at": now + timedelta(seconds=index),
+                    "notes_for_org": "Looking forward to it",
+                    "answers": {
+                        "q1": "We make handmade mugs and bowls",
+                        "q2": "Home & Decor",
+                        "q3": ["Friday", "Saturday"],
+                    },
+                }
+                for index, business_id in enumerate(business_ids)
+            ],
+        )
+    return engine, market
+
+
+def export(service: MarketService, engine, market: Market) -> tuple[float, int, int]:
+    start = time.perf_counter()
+    first_chunk = None
+    lines = 0
+    size = 0
+    with Session(engine) as session:
+        for chunk in service.export_applications_csv(session, market):
+            if first_chunk is None:
+                first_chunk = time.perf_counter() - start
+            lines += chunk.count("\r\n")
+            size += len(chunk)
+    return first_chunk, lines, size
+
+
+def run(rows: int, chunk_size: int) -> None:
+    warnings.filterwarnings("ignore", category=UserWarning, module="pydantic")
+    settings.APPLICATION_STREAM_CHUNK_SIZE = chunk_size
+    engine, market = create_database(rows)
+    service = MarketService(MagicMock(), MagicMock())
+
+    print(f"Exporting {rows:,} applications in chunks of {chunk_size}")
+    start = time.perf_counter()
+    first_chunk, lines, size = export(service, engine, market)
+    elapsed = time.perf_counter() - start
+    assert lines == rows + 1
+
+    tracemalloc.start()
+    export(service, engine, market)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(f"  first chunk      {first_chunk * 1000:>8.3f} ms")
+    print(f"  total            {elapsed * 1000:>8.1f} ms ({size / 1024 / 1024:.1f} MB)")
+    print(f"  rows per second  {rows / elapsed:>8,.0f}")
+    print(f"  peak memory      {peak / 1024 / 1024:>8.2f} MB")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Benchmark the streaming CSV export of a market's applications"
+    )
+    parser.add_argument("--rows", type=int, default=20000)
+    parser.add_argument("--chunk-size", type=int, default=500)
+    args = parser.parse_args()
+    run(args.rows, args.chunk_size)
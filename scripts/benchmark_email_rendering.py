@@ -0,0 +1,82 @@
+import argparse
+import time
+from datetime import datetime, timezone
+from uuid import uuid4
+
+from src.database.postgres.models.db_models import (
+    Application,
+    Business,
+    EmailEventType,
+    Market,
+)
+from src.module.application.service.email_service import (
+    ApplicationEmailService,
+    template_environment,
+)
+
+
+class StaticEmailSupabaseClient:
+    def get_user(self, user_id):
+        return None
+
+
+def run(iterations: int) -> None:
+    email_service = ApplicationEmailService(None, StaticEmailSupabaseClient())
+    market = Market(
+        id=uuid4(),
+        organizer_user_id=uuid4(),
+        market_name="Summer Artisan Market <Downtown>",
+        email="organizer@example.com",
+    )
+    business = Business(
+        id=uuid4(),
+        owner_user_id=uuid4(),
+        shop_name="Jane's Ceramics & Co.",
+        email="vendor@example.com",
+    )
+    application = Application(
+        id=uuid4(),
+        market_id=market.id,
+        business_id=business.id,
+        rejection_reason="Category is full",
+        created_at=datetime.now(timezone.utc),
+    )
+    changes = {"status": "accepted", "payment_status": "paid", "answers": "updated"}
+
+    builders = {
+        "created": lambda: email_service.build_application_created_email(
+            application, market, business
+        ),
+        "rejected": lambda: email_service.build_application_rejected_email(
+            application, market, business
+        ),
+        "updated": lambda: email_service.build_application_updated_email(
+            application, market, business, changes
+        ),
+    }
+
+    print(f"Rendering {iterations} emails per template")
+    for name, build in builders.items():
+        start = time.perf_counter()
+        for _ in range(iterations):
+            build()
+        elapsed = time.perf_counter() - start
+        print(f"  {name:<20} {iterations / elapsed:>12,.0f} emails/s")
+
+    source = template_environment.loader.get_source(
+        template_environment, f"{EmailEventType.application_created.value}.html"
+    )[0]
+    start = time.perf_counter()
+    for _ in range(iterations):
+        template_environment.from_string(source).render(
+            market_name=market.market_name, shop_name=business.shop_name
+        )
+    elapsed = time.perf_counter() - start
+    print(f"  {'created (uncached)':<20} {iterations / elapsed:>12,.0f} emails/s")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark email template rendering")
+    parser.add_argument("--iterations", type=int, default=10000)
+    args = parser.parse_args()
+    run(args.iterations)
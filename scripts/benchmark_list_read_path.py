@@ -0,0 +1,182 @@
+import argparse
+import json
+import time
+import warnings
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.pool import StaticPool
+from sqlmodel import Session, select
+
+from src.common.utils.response import Response
+from src.common.utils.row_query import select_response_columns
+from src.database.postgres.models.db_models import (
+    Application,
+    ApplicationStatus,
+    MarketFavorite,
+)
+from src.module.application.schema.application_schema import (
+    ApplicationListResponse,
+    ApplicationSearchResponse,
+)
+from src.module.favorite.schema.favorite_schema import (
+    FavoriteListResponse,
+    FavoriteResponse,
+)
+
+
+def create_database(rows: int):
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    with engine.begin() as connection:
+        for table in (Application.__table__, MarketFavorite.__table__):
+            columns = ", ".join(column.name for column in table.columns)
+            connection.execute(text(f"CREATE TABLE {table.name} ({columns})"))
+
+    now = datetime.now(timezone.utc)
+    statuses = list(ApplicationStatus)
+    with Session(engine) as session:
+        for index in range(rows):
+            created_at = (now - timedelta(minutes=index)).isoformat()
+            session.add(
+                Application(
+                    id=uuid4(),
+                    market_id=uuid4(),
+                    business_id=uuid4(),
+                    status=statuses[index % len(statuses)],
+                    applied_at=created_at,
+                    notes_for_org="Looking forward to it " * 5,
+                    rejection_reason=None if index % 3 else "Category is full",
+                    answers={"1": "We make handmade mugs", "2": "Yes"},
+                    created_at=created_at,
+                )
+            )
+            session.add(
+                MarketFavorite(
+                    id=uuid4(),
+                    market_id=uuid4(),
+                    user_id=uuid4(),
+                    created_at=created_at,
+                )
+            )
+        session.commit()
+    return engine
+
+
+def orm_applications(session: Session, limit: int) -> ApplicationListResponse:
+    query = select(Application).order_by(Application.created_at.desc()).limit(limit)
+    applications = session.exec(query).all()
+    return ApplicationListResponse(
+        applications=[
+            ApplicationSearchResponse(
+                id=application.id,
+                market_id=application.market_id,
+                business_id=application.business_id,
+                status=application.status,
+                applied_at=application.applied_at,
+                rejection_reason=application.rejection_reason,
+                created_at=application.created_at,
+            )
+            for application in applications
+        ],
+        total=limit,
+        limit=limit,
+        offset=0,
+    )
+
+
+def core_applications(session: Session, limit: int) -> ApplicationListResponse:
+    query = (
+        select_response_columns(Application, ApplicationSearchResponse)
+        .order_by(Application.created_at.desc())
+        .limit(limit)
+    )
+    applications = session.exec(query).all()
+    return ApplicationListResponse(
+        applications=[
+            ApplicationSearchResponse(
+                id=application.id,
+                market_id=application.market_id,
+                business_id=application.business_id,
+                status=application.status,
+                applied_at=application.applied_at,
+                rejection_reason=application.rejection_reason,
+                created_at=application.created_at,
+            )
+            for application in applications
+        ],
+        total=limit,
+        limit=limit,
+        offset=0,
+    )
+
+
+def orm_favorites(session: Session, limit: int) -> FavoriteListResponse:
+    query = (
+        select(MarketFavorite).order_by(MarketFavorite.created_at.desc()).limit(limit)
+    )
+    favorites = session.exec(query).all()
+    return FavoriteListResponse(
+        favorites=[
+            FavoriteResponse.model_validate(favorite.model_dump())
+            for favorite in favorites
+        ],
+        total=limit,
+        limit=limit,
+        offset=0,
+    )
+
+
+def core_favorites(session: Session, limit: int) -> FavoriteListResponse:
+    query = (
+        select_response_columns(MarketFavorite, FavoriteResponse)
+        .order_by(MarketFavorite.created_at.desc())
+        .limit(limit)
+    )
+    favorites = session.exec(query).mappings().all()
+    return FavoriteListResponse(
+        favorites=[FavoriteResponse.model_validate(favorite) for favorite in favorites],
+        total=limit,
+        limit=limit,
+        offset=0,
+    )
+
+
+def run(iterations: int, page_size: int) -> None:
+    warnings.filterwarnings("ignore", category=UserWarning, module="pydantic")
+    engine = create_database(page_size)
+
+    print(f"Reading a {page_size}-row list page {iterations} times (SQLite in memory)")
+    for name, orm_path, core_path in (
+        ("applications", orm_applications, core_applications),
+        ("favorites", orm_favorites, core_favorites),
+    ):
+        with Session(engine) as session:
+            orm_body = Response.success(data=orm_path(session, page_size)).body
+        with Session(engine) as session:
+            core_body = Response.success(data=core_path(session, page_size)).body
+        assert json.loads(orm_body) == json.loads(core_body), name
+
+        for label, read in (("ORM entities", orm_path), ("Core rows", core_path)):
+            start = time.perf_counter()
+            for _ in range(iterations):
+                with Session(engine) as session:
+                    read(session, page_size)
+            elapsed = time.perf_counter() - start
+            print(
+                f"  {name:<13} {label:<13} {elapsed / iterations * 1000:>7.3f} ms/page"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Benchmark ORM entity loading against Core row reads"
+    )
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--page-size", type=int, default=100)
+    args = parser.parse_args()
+    run(args.iterations, args.page_size)
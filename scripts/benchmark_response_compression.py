@@ -0,0 +1,150 @@
+import argparse
+import gzip
+import time
+from datetime import date, datetime, timedelta, timezone
+from uuid import uuid4
+
+from src.common.utils.compression import brotli
+from src.common.utils.response import Response
+from src.database.postgres.models.db_models import (
+    Application,
+    ApplicationStatus,
+    Business,
+    Market,
+    PaymentMethod,
+    PaymentStatus,
+)
+from src.module.application.schema.application_schema import (
+    ApplicationListWithDetailsResponse,
+    ApplicationWithDetailsResponse,
+)
+from scripts.benchmark_response_serialization import build_market_page
+
+
+def build_rows(sparse: bool) -> dict:
+    now = datetime.now(timezone.utc)
+    market = Market(
+        id=uuid4(),
+        organizer_user_id=uuid4(),
+        market_name="Summer Artisan Market",
+        contact_first_name=None if sparse else "Jane",
+        contact_last_name=None if sparse else "Doe",
+        email="organizer@example.com",
+        location_text="Trinity Bellwoods Park",
+        city=None if sparse else "Toronto",
+        latitude=None if sparse else 43.6479,
+        longitude=None if sparse else -79.4135,
+        market_size="100-499",
+        description="A weekend market featuring local makers.",
+        start_date=date.today(),
+        end_date=date.today() + timedelta(days=2),
+        application_deadline=None if sparse else now + timedelta(days=7),
+        application_form={"questions": [{"id": 1, "label": "Tell us about you"}]},
+        logo_url=None if sparse else "https://example.com/logo.png",
+        is_free=sparse,
+        cost_amount=None if sparse else 75.5,
+        cost_currency=None if sparse else "CAD",
+        created_at=now,
+    )
+    business = Business(
+        id=uuid4(),
+        owner_user_id=uuid4(),
+        shop_name="Jane's Ceramics & Co.",
+        email=None if sparse else "vendor@example.com",
+        category=None if sparse else "Ceramics",
+        logo_url=None if sparse else "https://example.com/shop.png",
+        created_at=now,
+    )
+    application = Application(
+        id=uuid4(),
+        market_id=market.id,
+        business_id=business.id,
+        status=ApplicationStatus.accepted,
+        applied_at=now,
+        accepted_at=None if sparse else now,
+        notes_for_org=None if sparse else "Looking forward to it",
+        payment_method=None if sparse else PaymentMethod.credit_card,
+        payment_status=None if sparse else PaymentStatus.paid,
+        answers=None if sparse else {"1": "We make mugs"},
+        created_at=now,
+    )
+    return {"market": market, "business": business, "application": application}
+
+
+def build_applications_page(size: int) -> ApplicationListWithDetailsResponse:
+    statuses = list(ApplicationStatus)
+    applications = []
+    for index in range(size):
+        rows = build_rows(sparse=index % 4 == 0)
+        market = rows["market"].model_dump()
+        market["id"] = uuid4()
+        business = rows["business"].model_dump()
+        business["id"] = uuid4()
+        applications.append(
+            ApplicationWithDetailsResponse(
+                id=uuid4(),
+                market_id=market["id"],
+                business_id=business["id"],
+                status=statuses[index % len(statuses)],
+                applied_at=rows["application"].applied_at,
+                created_at=rows["application"].created_at,
+                market=market,
+                business=business,
+            )
+        )
+    return ApplicationListWithDetailsResponse(
+        applications=applications, total=size, limit=size, offset=0
+    )
+
+
+def build_codecs() -> list[tuple[str, object]]:
+    codecs = [
+        (f"gzip level {level}", lambda body, level=level: gzip.compress(body, level))
+        for level in (1, 6, 9)
+    ]
+    if brotli is not None:
+        codecs.extend(
+            (
+                f"brotli quality {quality}",
+                lambda body, quality=quality: brotli.compress(body, quality=quality),
+            )
+            for quality in (1, 4, 11)
+        )
+    return codecs
+
+
+def run(iterations: int, page_size: int) -> None:
+    payloads = {
+        "market search": build_market_page(page_size),
+        "my-markets-applications": build_applications_page(page_size),
+    }
+    codecs = build_codecs()
+    if brotli is None:
+        print("brotli is not installed, only gzip is measured")
+
+    for name, data in payloads.items():
+        body = Response.success(data=data).body
+        print(f"{name}: {page_size} rows, {len(body) / 1024:.1f} KB uncompressed")
+        for label, compress in codecs:
+            compressed = compress(body)
+            start = time.perf_counter()
+            for _ in range(iterations):
+                compress(body)
+            elapsed = (time.perf_counter() - start) / iterations
+            saved = len(body) - len(compressed)
+            print(
+                f"  {label:<18} {len(compressed) / 1024:>7.1f} KB "
+                f"({len(compressed) / len(body):>5.1%})  "
+                f"{elapsed * 1000:>7.3f} ms CPU  "
+                f"{saved / 1024 / (elapsed * 1000):>7.1f} KB saved/ms"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Benchmark response compression CPU cost against bytes saved"
+    )
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--page-size", type=int, default=100)
+    args = parser.parse_args()
+    run(args.iterations, args.page_size)
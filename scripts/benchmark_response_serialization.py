@@ -0,0 +1,103 @@
+import argparse
+import json
+import time
+from datetime import date, datetime, timedelta, timezone
+from uuid import uuid4
+
+from fastapi.responses import JSONResponse
+
+from src.common.utils.response import Response, StandardResponse
+from src.module.market.schema.market_schema import (
+    MarketListResponse,
+    MarketSearchResponse,
+)
+
+IMAGE_URL = (
+    "https://example.storage.supabase.co/storage/v1/render/image/public/"
+    "monkeybun-public/market/{}.jpg?width=640&quality=75"
+)
+
+
+def build_market_page(size: int) -> MarketListResponse:
+    now = datetime.now(timezone.utc)
+    markets = [
+        MarketSearchResponse(
+            id=uuid4(),
+            market_name=f"Summer Artisan Market #{index}",
+            location_text="Trinity Bellwoods Park",
+            city="Toronto",
+            country="Canada",
+            latitude=43.6479 + index / 1000,
+            longitude=-79.4135 - index / 1000,
+            formatted_address="790 Queen St W, Toronto, ON M6J 1G3, Canada",
+            start_date=date.today() + timedelta(days=index),
+            end_date=date.today() + timedelta(days=index + 2),
+            logo_url=IMAGE_URL.format(uuid4()),
+            image_url=IMAGE_URL.format(uuid4()),
+            review_count=index,
+            average_rating=4.5,
+            aesthetic="Vintage & handmade — “cozy” vibes",
+            market_size="100-499",
+            is_free=index % 2 == 0,
+            description="A weekend market featuring local makers. " * 4,
+            cost_amount=None if index % 2 == 0 else 75.0,
+            cost_currency=None if index % 2 == 0 else "CAD",
+            application_deadline=now + timedelta(days=index),
+            images=[IMAGE_URL.format(uuid4()) for _ in range(3)],
+            is_favorited=index % 3 == 0,
+        )
+        for index in range(size)
+    ]
+    return MarketListResponse(
+        markets=markets,
+        total=size * 10,
+        limit=size,
+        offset=0,
+        applied_market_ids=[market.id for market in markets[:10]],
+    )
+
+
+def double_serialization(result: MarketListResponse) -> bytes:
+    response = StandardResponse(
+        success=True,
+        message="Markets retrieved successfully",
+        data=result.model_dump(mode="json"),
+    )
+    return JSONResponse(content=response.model_dump()).body
+
+
+def single_serialization(result: MarketListResponse) -> bytes:
+    return Response.success(message="Markets retrieved successfully", data=result).body
+
+
+def run(iterations: int, page_size: int) -> None:
+    result = build_market_page(page_size)
+
+    legacy_body = double_serialization(result)
+    fast_body = single_serialization(result)
+    assert json.loads(legacy_body) == json.loads(fast_body)
+
+    print(
+        f"Serializing a {page_size}-market search page "
+        f"({len(fast_body) / 1024:.1f} KB) {iterations} times"
+    )
+    for name, serialize in (
+        ("model_dump + json.dumps", double_serialization),
+        ("single pass to_json", single_serialization),
+    ):
+        start = time.perf_counter()
+        for _ in range(iterations):
+            serialize(result)
+        elapsed = time.perf_counter() - start
+        print(
+            f"  {name:<24} {elapsed / iterations * 1000:>8.3f} ms/response "
+            f"{iterations / elapsed:>10,.0f} responses/s"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark JSON response rendering")
+    parser.add_argument("--iterations", type=int, default=1000)
+    parser.add_argument("--page-size", type=int, default=100)
+    args = parser.parse_args()
+    run(args.iterations, args.page_size)
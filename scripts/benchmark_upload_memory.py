@@ -0,0 +1,99 @@
+import argparse
+import asyncio
+import multiprocessing
+import os
+import resource
+import tempfile
+import time
+
+MEGABYTE = 1024 * 1024
+
+
+class DiscardingS3Client:
+    def __init__(self, latency_seconds: float):
+        self.latency_seconds = latency_seconds
+
+    def put_object(self, Body, **kwargs):
+        time.sleep(self.latency_seconds)
+        return {"ETag": str(len(Body))}
+
+    def create_multipart_upload(self, **kwargs):
+        return {"UploadId": "benchmark"}
+
+    def upload_part(self, Body, **kwargs):
+        time.sleep(self.latency_seconds)
+        return {"ETag": str(len(Body))}
+
+    def complete_multipart_upload(self, **kwargs):
+        return {}
+
+    def abort_multipart_upload(self, **kwargs):
+        return {}
+
+
+def create_upload_file(size_mb: int) -> tempfile.SpooledTemporaryFile:
+    file = tempfile.SpooledTemporaryFile(max_size=MEGABYTE)
+    chunk = os.urandom(MEGABYTE)
+    for _ in range(size_mb):
+        file.write(chunk)
+    file.seek(0)
+    return file
+
+
+def measure(
+    mode: str, files: int, size_mb: int, latency_seconds: float, results
+) -> None:
+    from src.database.s3.s3_client import S3Client
+
+    s3_client = S3Client()
+    s3_client.s3_client = DiscardingS3Client(latency_seconds)
+    upload_files = [create_upload_file(size_mb) for _ in range(files)]
+    baseline = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    def buffered_upload(file, bucket, file_key, extra_args, max_size):
+        file.seek(0)
+        s3_client.s3_client.put_object(
+            Bucket=bucket, Key=file_key, Body=file.read(), **extra_args
+        )
+
+    if mode == "buffered":
+        s3_client._stream_upload = buffered_upload
+
+    async def upload_all():
+        await asyncio.gather(
+            *(
+                s3_client.upload_file(file, f"benchmark/{index}.jpg", "image/jpeg")
+                for index, file in enumerate(upload_files)
+            )
+        )
+
+    asyncio.run(upload_all())
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    results.put((mode, baseline / 1024, peak / 1024))
+
+
+def run(files: int, size_mb: int, latency_seconds: float) -> None:
+    context = multiprocessing.get_context("spawn")
+    results = context.Queue()
+
+    print(f"Uploading {files} files of {size_mb} MB concurrently")
+    for mode in ("buffered", "streaming"):
+        process = context.Process(
+            target=measure, args=(mode, files, size_mb, latency_seconds, results)
+        )
+        process.start()
+        process.join()
+        mode, baseline, peak = results.get()
+        print(
+            f"  {mode:<10} peak RSS {peak:>8.1f} MB "
+            f"(+{peak - baseline:.1f} MB over baseline)"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark peak RSS of S3 uploads")
+    parser.add_argument("--files", type=int, default=20)
+    parser.add_argument("--size-mb", type=int, default=10)
+    parser.add_argument("--latency-ms", type=int, default=200)
+    args = parser.parse_args()
+    run(args.files, args.size_mb, args.latency_ms / 1000)
@@ -14,6 +14,26 @@ class AppSettings(BaseSettings):
     S3_ACCESS_KEY_ID: str
     S3_SECRET_ACCESS_KEY_ID: str
     S3_ENDPOINT: str
+    S3_MAX_POOL_CONNECTIONS: int = 20
+    S3_UPLOAD_CONCURRENCY: int = 5
+    S3_MULTIPART_THRESHOLD_BYTES: int = 5 * 1024 * 1024
+    S3_MULTIPART_CHUNK_BYTES: int = 5 * 1024 * 1024
+    UPLOAD_MAX_IMAGE_BYTES: int = 10 * 1024 * 1024
+    UPLOAD_MAX_IMAGE_PIXELS: int = 40_000_000
+    UPLOAD_PRESIGNED_URL_EXPIRES_SECONDS: int = 900
+    UPLOAD_SESSION_CHUNK_BYTES: int = 5 * 1024 * 1024
+    UPLOAD_SESSION_EXPIRES_SECONDS: int = 86400
+    UPLOAD_SESSION_MAX_IMAGE_BYTES: int = 50 * 1024 * 1024
+    IMAGE_TRANSFORMATIONS_ENABLED: bool = False
+    IMAGE_RENDITION_QUALITY: int = 75
+    IMAGE_GC_ORPHAN_AGE_HOURS: int = 24
+    IMAGE_GC_BATCH_SIZE: int = 1000
+    IMAGE_GC_INTERVAL_SECONDS: int = 3600
+    PENDING_IMAGES_PARTITION_DAYS_AHEAD: int = 7
+    STORAGE_RECONCILE_MIN_AGE_HOURS: int = 48
+    STORAGE_RECONCILE_PAGE_SIZE: int = 1000
+    STORAGE_RECONCILE_INTERVAL_SECONDS: int = 86400
+    STORAGE_RECONCILE_PREFIXES: list[str] = ["market/", "business/", "review/"]
     SUPABASE_DEV_USERNAME: str
     SUPABASE_DEV_PASSWORD: str
     GOOGLE_PLACES_API_KEY: str
@@ -21,6 +41,25 @@ class AppSettings(BaseSettings):
     RESEND_FROM_EMAIL: str = "admin@monkeybun.co"
     RESEND_FROM_NAME: str = "Monkeybun"
     RESEND_ENABLED: bool = True
+    EMAIL_OUTBOX_BATCH_SIZE: int = 50
+    EMAIL_OUTBOX_POLL_INTERVAL_SECONDS: float = 2.0
+    EMAIL_OUTBOX_LEASE_SECONDS: int = 300
+    EMAIL_OUTBOX_MAX_ATTEMPTS: int = 8
+    EMAIL_OUTBOX_BACKOFF_BASE_SECONDS: int = 30
+    EMAIL_OUTBOX_BACKOFF_MAX_SECONDS: int = 3600
+    EMAIL_UPDATE_COALESCE_SECONDS: int = 300
+    HTTP_CLIENT_HTTP2_ENABLED: bool = True
+    HTTP_CLIENT_MAX_RETRIES: int = 2
+    HTTP_CLIENT_CIRCUIT_FAILURE_THRESHOLD: int = 5
+    HTTP_CLIENT_CIRCUIT_RECOVERY_SECONDS: float = 30.0
+    GOOGLE_PLACES_TIMEOUT_SECONDS: float = 10.0
+    SUPABASE_HTTP_TIMEOUT_SECONDS: float = 10.0
+    RESEND_HTTP_TIMEOUT_SECONDS: float = 30.0
+    APPLICATION_STREAM_CHUNK_SIZE: int = 500
+    MARKET_SEARCH_APPLIED_MARKET_IDS_ENABLED: bool = True
+    COMPRESSION_MIN_BYTES: int = 1024
+    COMPRESSION_GZIP_LEVEL: int = 6
+    COMPRESSION_BROTLI_QUALITY: int = 4
 
     model_config = SettingsConfigDict(env_file=".env", case_sensitive=True)
 
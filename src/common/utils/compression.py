@@ -0,0 +1,131 @@
+import zlib
+
+from starlette.datastructures import Headers
+from starlette.middleware.gzip import GZipResponder, IdentityResponder
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+UNCOMPRESSIBLE_CONTENT_TYPES = (
+    "text/event-stream",
+    "image/",
+    "video/",
+    "audio/",
+    "font/woff",
+    "application/gzip",
+    "application/zip",
+    "application/x-brotli",
+    "application/pdf",
+    "application/octet-stream",
+)
+
+
+def parse_accept_encoding(value: str) -> dict[str, float]:
+    encodings: dict[str, float] = {}
+    for item in value.split(","):
+        name, _, params = item.partition(";")
+        name = name.strip().lower()
+        if not name:
+            continue
+        quality = 1.0
+        for param in params.split(";"):
+            key, _, raw = param.strip().partition("=")
+            if key.lower() == "q":
+                try:
+                    quality = float(raw)
+                except ValueError:
+                    quality = 0.0
+        encodings[name] = quality
+    return encodings
+
+
+def select_encoding(accept_encoding: str, available: tuple[str, ...]) -> str | None:
+    encodings = parse_accept_encoding(accept_encoding)
+    wildcard = encodings.get("*", 0.0)
+    best: str | None = None
+    best_quality = 0.0
+    for name in available:
+        quality = encodings.get(name, wildcard)
+        if quality > best_quality:
+            best, best_quality = name, quality
+    return best
+
+
+class ContentAwareResponder(IdentityResponder):
+    async def send_with_compression(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            await super().send_with_compression(message)
+            content_type = Headers(raw=message["headers"]).get("content-type", "")
+            self.content_type_is_excluded = content_type.lower().startswith(
+                UNCOMPRESSIBLE_CONTENT_TYPES
+            )
+            return
+        await super().send_with_compression(message)
+
+
+class GZipContentResponder(ContentAwareResponder, GZipResponder):
+    def apply_compression(self, body: bytes, *, more_body: bool) -> bytes:
+        self.gzip_file.write(body)
+        if more_body:
+            self.gzip_file.flush(zlib.Z_SYNC_FLUSH)
+        else:
+            self.gzip_file.close()
+
+        compressed = self.gzip_buffer.getvalue()
+        self.gzip_buffer.seek(0)
+        self.gzip_buffer.truncate()
+        return compressed
+
+
+class BrotliResponder(ContentAwareResponder):
+    content_encoding = "br"
+
+    def __init__(self, app: ASGIApp, minimum_size: int, quality: int) -> None:
+        super().__init__(app, minimum_size)
+        self.compressor = brotli.Compressor(quality=quality)
+
+    def apply_compression(self, body: bytes, *, more_body: bool) -> bytes:
+        compressed = self.compressor.process(body)
+        if more_body:
+            return compressed + self.compressor.flush()
+        return compressed + self.compressor.finish()
+
+
+class CompressionMiddleware:
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1024,
+        gzip_level: int = 6,
+        brotli_quality: int = 4,
+    ) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+        self.available = ("br", "gzip") if brotli is not None else ("gzip",)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        accept_encoding = Headers(scope=scope).get("Accept-Encoding", "")
+        encoding = select_encoding(accept_encoding, self.available)
+
+        responder: ASGIApp
+        if encoding == "br":
+            responder = BrotliResponder(
+                self.app, self.minimum_size, quality=self.brotli_quality
+            )
+        elif encoding == "gzip":
+            responder = GZipContentResponder(
+                self.app, self.minimum_size, compresslevel=self.gzip_level
+            )
+        else:
+            responder = ContentAwareResponder(self.app, self.minimum_size)
+
+        await responder(scope, receive, send)
@@ -0,0 +1,34 @@
+import csv
+import io
+from datetime import date, datetime
+from enum import Enum
+from typing import Any, Iterable
+
+from pydantic_core import to_json
+
+FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+
+
+def format_csv_value(value: Any) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, Enum):
+        value = value.value
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, list):
+        value = "; ".join(format_csv_value(item) for item in value)
+    elif isinstance(value, dict):
+        value = to_json(value).decode()
+    elif not isinstance(value, str):
+        return str(value)
+    if value.startswith(FORMULA_PREFIXES):
+        return f"'{value}"
+    return value
+
+
+def render_csv_rows(rows: Iterable[Iterable[Any]]) -> str:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerows([format_csv_value(value) for value in row] for row in rows)
+    return buffer.getvalue()
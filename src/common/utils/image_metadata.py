@@ -0,0 +1,148 @@
+import hashlib
+import os
+import struct
+from typing import BinaryIO, Optional
+
+HASH_CHUNK_BYTES = 1024 * 1024
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+JPEG_SOI = b"\xff\xd8"
+JPEG_SIGNATURE = b"\xff\xd8\xff"
+JPEG_SOF_MARKERS = frozenset(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+JPEG_STANDALONE_MARKERS = frozenset(range(0xD0, 0xDA)) | {0x01}
+EXIF_ORIENTATION_TAG = 0x0112
+EXIF_ROTATED_ORIENTATIONS = frozenset({5, 6, 7, 8})
+
+
+def _read_png_dimensions(file: BinaryIO) -> Optional[tuple[int, int]]:
+    header = file.read(16)
+    if len(header) < 16 or header[4:8] != b"IHDR":
+        return None
+    return struct.unpack(">II", header[8:16])
+
+
+def _read_exif_orientation(segment: bytes) -> Optional[int]:
+    if not segment.startswith(b"Exif\x00\x00") or len(segment) < 14:
+        return None
+
+    tiff = segment[6:]
+    if tiff[:2] == b"II":
+        endian = "<"
+    elif tiff[:2] == b"MM":
+        endian = ">"
+    else:
+        return None
+
+    ifd_offset = struct.unpack(f"{endian}I", tiff[4:8])[0]
+    if ifd_offset + 2 > len(tiff):
+        return None
+
+    entry_count = struct.unpack(f"{endian}H", tiff[ifd_offset : ifd_offset + 2])[0]
+    for index in range(entry_count):
+        entry_start = ifd_offset + 2 + index * 12
+        entry = tiff[entry_start : entry_start + 12]
+        if len(entry) < 12:
+            return None
+        tag = struct.unpack(f"{endian}H", entry[:2])[0]
+        if tag == EXIF_ORIENTATION_TAG:
+            return struct.unpack(f"{endian}H", entry[8:10])[0]
+    return None
+
+
+def _read_jpeg_dimensions(file: BinaryIO) -> Optional[tuple[int, int]]:
+    orientation = None
+    while True:
+        byte = file.read(1)
+        if not byte:
+            return None
+        if byte != b"\xff":
+            continue
+
+        marker = file.read(1)
+        while marker == b"\xff":
+            marker = file.read(1)
+        if not marker:
+            return None
+
+        marker_code = marker[0]
+        if marker_code in JPEG_STANDALONE_MARKERS or marker_code == 0x00:
+            continue
+        if marker_code == 0xD9:
+            return None
+
+        length_bytes = file.read(2)
+        if len(length_bytes) < 2:
+            return None
+        length = struct.unpack(">H", length_bytes)[0]
+        if length < 2:
+            return None
+
+        if marker_code in JPEG_SOF_MARKERS:
+            frame = file.read(5)
+            if len(frame) < 5:
+                return None
+            height, width = struct.unpack(">HH", frame[1:5])
+            if orientation in EXIF_ROTATED_ORIENTATIONS:
+                return height, width
+            return width, height
+
+        if marker_code == 0xE1 and orientation is None:
+            orientation = _read_exif_orientation(file.read(length - 2))
+        else:
+            file.seek(length - 2, os.SEEK_CUR)
+
+
+def sniff_image_content_type(file: BinaryIO) -> Optional[str]:
+    file.seek(0)
+    try:
+        signature = file.read(8)
+    finally:
+        file.seek(0)
+
+    if signature == PNG_SIGNATURE:
+        return "image/png"
+    if signature.startswith(JPEG_SIGNATURE):
+        return "image/jpeg"
+    return None
+
+
+def read_image_dimensions(file: BinaryIO) -> Optional[tuple[int, int]]:
+    file.seek(0)
+    try:
+        signature = file.read(8)
+        if signature == PNG_SIGNATURE:
+            return _read_png_dimensions(file)
+        if signature[:2] == JPEG_SOI:
+            file.seek(2)
+            return _read_jpeg_dimensions(file)
+        return None
+    except struct.error:
+        return None
+    finally:
+        file.seek(0)
+
+
+def read_image_metadata(file: BinaryIO, max_bytes: Optional[int] = None) -> dict:
+    dimensions = read_image_dimensions(file)
+    digest = hashlib.sha256()
+    byte_size = 0
+    while chunk := file.read(HASH_CHUNK_BYTES):
+        digest.update(chunk)
+        byte_size += len(chunk)
+        if max_bytes is not None and byte_size > max_bytes:
+            break
+    file.seek(0)
+
+    return {
+        "width": dimensions[0] if dimensions else None,
+        "height": dimensions[1] if dimensions else None,
+        "byte_size": byte_size,
+        "sha256": digest.hexdigest(),
+    }
+
+
+def get_image_metadata(image) -> dict:
+    return {
+        "width": image.width,
+        "height": image.height,
+        "byte_size": image.byte_size,
+    }
@@ -4,6 +4,7 @@ from fastapi import Response as FastAPIResponse
 from fastapi import status
 from fastapi.responses import JSONResponse
 from pydantic import BaseModel, Field
+from pydantic_core import to_json
 
 
 class StandardResponse(BaseModel):
@@ -18,15 +19,29 @@ class StandardResponse(BaseModel):
     )
 
 
+class ModelJSONResponse(JSONResponse):
+    def __init__(self, content: Any, exclude_unset: bool = False, **kwargs: Any):
+        self.exclude_unset = exclude_unset
+        super().__init__(content, **kwargs)
+
+    def render(self, content: Any) -> bytes:
+        if self.exclude_unset:
+            return content.__pydantic_serializer__.to_json(content, exclude_unset=True)
+        return to_json(content)
+
+
 class Response:
     @staticmethod
     def success(
         message: str = "Success",
         data: Optional[Any] = None,
         status_code: int = status.HTTP_200_OK,
+        exclude_unset: bool = False,
     ) -> JSONResponse:
         response = StandardResponse(success=True, message=message, data=data)
-        return JSONResponse(status_code=status_code, content=response.model_dump())
+        return ModelJSONResponse(
+            status_code=status_code, content=response, exclude_unset=exclude_unset
+        )
 
     @staticmethod
     def error(
@@ -35,7 +50,7 @@ class Response:
         status_code: int = status.HTTP_400_BAD_REQUEST,
     ) -> JSONResponse:
         response = StandardResponse(success=False, message=message, data=data)
-        return JSONResponse(status_code=status_code, content=response.model_dump())
+        return ModelJSONResponse(status_code=status_code, content=response)
 
     @staticmethod
     def no_content(status_code: int = status.HTTP_204_NO_CONTENT) -> FastAPIResponse:
@@ -0,0 +1,23 @@
+from pydantic import BaseModel
+from sqlalchemy import Select, select
+from sqlmodel import SQLModel
+
+
+def get_response_columns(
+    table_model: type[SQLModel], response_model: type[BaseModel]
+) -> list[str]:
+    return [
+        name for name in response_model.model_fields if name in table_model.model_fields
+    ]
+
+
+def select_columns(table_model: type[SQLModel], names: list[str]) -> Select:
+    return select(*(getattr(table_model, name) for name in names))
+
+
+def select_response_columns(
+    table_model: type[SQLModel], response_model: type[BaseModel]
+) -> Select:
+    return select_columns(
+        table_model, get_response_columns(table_model, response_model)
+    )
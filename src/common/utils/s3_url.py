@@ -1,14 +1,70 @@
+from enum import Enum
+from typing import Optional, Union
+
 from src.common.config import settings
 from src.common.constants import S3_PUBLIC_BUCKET_NAME
 
+S3_URL_PATH = "/storage/v1/s3/"
+PUBLIC_URL_PATH = "/storage/v1/object/public/"
+RENDER_URL_PATH = "/storage/v1/render/image/public/"
+
 
 def get_public_image_url(file_key: str) -> str:
     endpoint = settings.S3_ENDPOINT.rstrip("/")
-    endpoint = endpoint.replace("/storage/v1/s3", "/storage/v1/object/public")
+    endpoint = endpoint.replace(S3_URL_PATH.rstrip("/"), PUBLIC_URL_PATH.rstrip("/"))
+    return f"{endpoint}/{S3_PUBLIC_BUCKET_NAME}/{file_key}"
+
+
+def get_s3_image_url(file_key: str) -> str:
+    endpoint = settings.S3_ENDPOINT.rstrip("/")
     return f"{endpoint}/{S3_PUBLIC_BUCKET_NAME}/{file_key}"
 
 
 def convert_s3_url_to_public_url(s3_url: str) -> str:
-    if "/storage/v1/s3/" in s3_url:
-        return s3_url.replace("/storage/v1/s3/", "/storage/v1/object/public/")
+    if S3_URL_PATH in s3_url:
+        return s3_url.replace(S3_URL_PATH, PUBLIC_URL_PATH)
     return s3_url
+
+
+def normalize_image_urls(
+    image_urls: Optional[Union[str, list[str]]],
+) -> Optional[Union[str, list[str]]]:
+    if isinstance(image_urls, list):
+        return [convert_s3_url_to_public_url(image_url) for image_url in image_urls]
+    if image_urls:
+        return convert_s3_url_to_public_url(image_urls)
+    return image_urls
+
+
+class ImageRendition(str, Enum):
+    thumb = "thumb"
+    card = "card"
+    full = "full"
+
+
+IMAGE_RENDITION_WIDTHS = {
+    ImageRendition.thumb: 200,
+    ImageRendition.card: 640,
+    ImageRendition.full: 1600,
+}
+
+
+IMAGE_RENDITION_QUERIES = {
+    rendition: f"?width={width}&quality={settings.IMAGE_RENDITION_QUALITY}"
+    for rendition, width in IMAGE_RENDITION_WIDTHS.items()
+}
+
+
+def get_image_rendition_url(image_url: str, rendition: ImageRendition) -> str:
+    if not settings.IMAGE_TRANSFORMATIONS_ENABLED or PUBLIC_URL_PATH not in image_url:
+        return image_url
+
+    render_url = image_url.replace(PUBLIC_URL_PATH, RENDER_URL_PATH, 1)
+    return f"{render_url}{IMAGE_RENDITION_QUERIES[rendition]}"
+
+
+def get_image_renditions(image_url: str) -> dict[str, str]:
+    return {
+        rendition.value: get_image_rendition_url(image_url, rendition)
+        for rendition in ImageRendition
+    }
@@ -0,0 +1,30 @@
+from typing import Optional
+
+from pydantic import BaseModel
+
+
+def split_fields(value: Optional[str | list[str]]) -> Optional[list[str]]:
+    if value is None:
+        return None
+    if isinstance(value, str):
+        value = value.split(",")
+    fields = [name.strip() for name in value if name.strip()]
+    return fields or None
+
+
+def resolve_fields(
+    model: type[BaseModel],
+    fields: Optional[list[str]],
+    presets: dict[str, list[str]],
+) -> tuple[list[str], list[str]]:
+    if not fields:
+        return list(model.model_fields), []
+
+    requested = {
+        name for name, field in model.model_fields.items() if field.is_required()
+    }
+    for name in fields:
+        requested.update(presets.get(name, [name]))
+
+    unknown = sorted(requested - model.model_fields.keys())
+    return [name for name in model.model_fields if name in requested], unknown
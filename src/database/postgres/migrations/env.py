@@ -19,6 +19,7 @@ from src.database.postgres.models.db_models import (
     Application,  # noqa: F401
     Business,  # noqa: F401
     BusinessImage,  # noqa: F401
+    EmailOutbox,  # noqa: F401
     Market,  # noqa: F401
     MarketImage,  # noqa: F401
     Review,  # noqa: F401
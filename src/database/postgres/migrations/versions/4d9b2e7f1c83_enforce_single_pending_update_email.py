@@ -0,0 +1,87 @@
+"""Enforce a single pending update email per application
+
+Revision ID: 4d9b2e7f1c83
+Revises: c5e81d4a9f36
+Create Date: 2025-12-12 09:14:51.302417
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "4d9b2e7f1c83"
+down_revision: Union[str, None] = "c5e81d4a9f36"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+PENDING_UPDATE_CONDITION = "status = 'pending' AND event_type = 'application_updated'"
+
+
+def upgrade() -> None:
+    op.drop_index("email_outbox_recipient_idx", table_name="email_outbox")
+    op.execute(
+        "DELETE FROM email_outbox "
+        "WHERE event_type IN ('application_received', 'applications_digest')"
+    )
+    op.drop_column("email_outbox", "recipient_user_id")
+    op.alter_column(
+        "email_outbox", "application_id", existing_type=sa.UUID(), nullable=False
+    )
+
+    op.execute(f"""
+        UPDATE email_outbox AS target
+        SET payload = merged.payload
+        FROM (
+            SELECT
+                (array_agg(entry.id ORDER BY entry.created_at, entry.id))[1] AS id,
+                coalesce(
+                    jsonb_object_agg(
+                        change.key, change.value ORDER BY entry.created_at, entry.id
+                    ) FILTER (WHERE change.key IS NOT NULL),
+                    '{{}}'::jsonb
+                ) AS payload
+            FROM email_outbox AS entry
+            LEFT JOIN LATERAL jsonb_each(coalesce(entry.payload, '{{}}'::jsonb))
+                AS change ON true
+            WHERE {PENDING_UPDATE_CONDITION}
+            GROUP BY entry.application_id
+            HAVING count(DISTINCT entry.id) > 1
+        ) AS merged
+        WHERE target.id = merged.id
+    """)
+    op.execute("""
+        DELETE FROM email_outbox AS duplicate
+        USING email_outbox AS kept
+        WHERE duplicate.status = 'pending'
+            AND duplicate.event_type = 'application_updated'
+            AND kept.status = 'pending'
+            AND kept.event_type = 'application_updated'
+            AND kept.application_id = duplicate.application_id
+            AND (kept.created_at, kept.id) < (duplicate.created_at, duplicate.id)
+    """)
+
+    op.create_index(
+        "email_outbox_pending_update_idx",
+        "email_outbox",
+        ["application_id"],
+        unique=True,
+        postgresql_where=sa.text(PENDING_UPDATE_CONDITION),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("email_outbox_pending_update_idx", table_name="email_outbox")
+    op.alter_column(
+        "email_outbox", "application_id", existing_type=sa.UUID(), nullable=True
+    )
+    op.add_column(
+        "email_outbox", sa.Column("recipient_user_id", sa.UUID(), nullable=True)
+    )
+    op.create_index(
+        "email_outbox_recipient_idx",
+        "email_outbox",
+        ["recipient_user_id", "event_type"],
+    )
@@ -0,0 +1,47 @@
+"""Add email outbox coalescing
+
+Revision ID: 7c2e9b4f1a53
+Revises: 3f8a1c6d2b90
+Create Date: 2025-12-03 16:40:12.871904
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "7c2e9b4f1a53"
+down_revision: Union[str, None] = "3f8a1c6d2b90"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "email_outbox", sa.Column("recipient_user_id", sa.UUID(), nullable=True)
+    )
+    op.alter_column(
+        "email_outbox", "application_id", existing_type=sa.UUID(), nullable=True
+    )
+    op.create_index(
+        "email_outbox_application_idx",
+        "email_outbox",
+        ["application_id", "event_type"],
+    )
+    op.create_index(
+        "email_outbox_recipient_idx",
+        "email_outbox",
+        ["recipient_user_id", "event_type"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("email_outbox_recipient_idx", table_name="email_outbox")
+    op.drop_index("email_outbox_application_idx", table_name="email_outbox")
+    op.execute("DELETE FROM email_outbox WHERE application_id IS NULL")
+    op.alter_column(
+        "email_outbox", "application_id", existing_type=sa.UUID(), nullable=False
+    )
+    op.drop_column("email_outbox", "recipient_user_id")
@@ -0,0 +1,79 @@
+"""Add upload sessions
+
+Revision ID: 8b3d5f1e6a27
+Revises: f2a7c4e8b135
+Create Date: 2025-12-09 14:03:52.690317
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "8b3d5f1e6a27"
+down_revision: Union[str, None] = "f2a7c4e8b135"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "upload_sessions",
+        sa.Column(
+            "id", sa.UUID(), server_default=sa.text("gen_random_uuid()"), nullable=False
+        ),
+        sa.Column("user_id", sa.UUID(), nullable=False),
+        sa.Column("entity_type", sa.String(), nullable=False),
+        sa.Column("filename", sa.String(), nullable=False),
+        sa.Column("content_type", sa.String(), nullable=False),
+        sa.Column("s3_key", sa.String(), nullable=False),
+        sa.Column("s3_upload_id", sa.String(), nullable=False),
+        sa.Column("total_bytes", sa.Integer(), nullable=False),
+        sa.Column("chunk_bytes", sa.Integer(), nullable=False),
+        sa.Column("width", sa.Integer(), nullable=True),
+        sa.Column("height", sa.Integer(), nullable=True),
+        sa.Column(
+            "status",
+            sa.String(length=50),
+            server_default=sa.text("'active'"),
+            nullable=False,
+        ),
+        sa.Column("expires_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "upload_sessions_status_expires_at_idx",
+        "upload_sessions",
+        ["status", "expires_at"],
+    )
+    op.create_table(
+        "upload_session_parts",
+        sa.Column("session_id", sa.UUID(), nullable=False),
+        sa.Column("part_number", sa.Integer(), nullable=False),
+        sa.Column("etag", sa.String(), nullable=False),
+        sa.Column("byte_size", sa.Integer(), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(
+            ["session_id"], ["upload_sessions.id"], ondelete="CASCADE"
+        ),
+        sa.PrimaryKeyConstraint("session_id", "part_number"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("upload_session_parts")
+    op.drop_index("upload_sessions_status_expires_at_idx", table_name="upload_sessions")
+    op.drop_table("upload_sessions")
@@ -0,0 +1,27 @@
+"""Add pending images user and key index
+
+Revision ID: 8c1f5a3e7d24
+Revises: 4d9b2e7f1c83
+Create Date: 2025-12-15 10:42:18.615203
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "8c1f5a3e7d24"
+down_revision: Union[str, None] = "4d9b2e7f1c83"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "pending_images_user_id_s3_key_idx", "pending_images", ["user_id", "s3_key"]
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("pending_images_user_id_s3_key_idx", table_name="pending_images")
@@ -0,0 +1,63 @@
+"""Normalize image urls to public urls
+
+Revision ID: c5e81d4a9f36
+Revises: 8b3d5f1e6a27
+Create Date: 2025-12-10 11:37:08.214659
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c5e81d4a9f36"
+down_revision: Union[str, None] = "8b3d5f1e6a27"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+S3_URL_PATH = "/storage/v1/s3/"
+PUBLIC_URL_PATH = "/storage/v1/object/public/"
+BACKFILL_BATCH_SIZE = 1000
+IMAGE_URL_COLUMNS = (
+    ("market_images", "image_url"),
+    ("business_images", "image_url"),
+    ("review_images", "image_url"),
+    ("markets", "logo_url"),
+    ("businesses", "logo_url"),
+)
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    with op.get_context().autocommit_block():
+        for table_name, column_name in IMAGE_URL_COLUMNS:
+            statement = sa.text(f"""
+                UPDATE {table_name}
+                SET {column_name} = replace({column_name}, :s3_path, :public_path)
+                WHERE id IN (
+                    SELECT id FROM {table_name}
+                    WHERE strpos({column_name}, :s3_path) > 0
+                    LIMIT :batch_size
+                )
+            """)
+            while True:
+                result = bind.execute(
+                    statement,
+                    {
+                        "s3_path": S3_URL_PATH,
+                        "public_path": PUBLIC_URL_PATH,
+                        "batch_size": BACKFILL_BATCH_SIZE,
+                    },
+                )
+                if result.rowcount < BACKFILL_BATCH_SIZE:
+                    break
+
+
+def downgrade() -> None:
+    raise NotImplementedError(
+        "Image URL normalization is irreversible: the original S3 URLs are not "
+        "kept, and public URLs written since the upgrade cannot be told apart "
+        "from backfilled ones"
+    )
@@ -0,0 +1,34 @@
+"""Add image metadata columns
+
+Revision ID: d41b7e2c9a08
+Revises: 7c2e9b4f1a53
+Create Date: 2025-12-05 11:22:47.603215
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d41b7e2c9a08"
+down_revision: Union[str, None] = "7c2e9b4f1a53"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+IMAGE_TABLES = ("pending_images", "market_images", "business_images")
+
+
+def upgrade() -> None:
+    for table_name in IMAGE_TABLES:
+        op.add_column(table_name, sa.Column("width", sa.Integer(), nullable=True))
+        op.add_column(table_name, sa.Column("height", sa.Integer(), nullable=True))
+        op.add_column(table_name, sa.Column("byte_size", sa.Integer(), nullable=True))
+
+
+def downgrade() -> None:
+    for table_name in IMAGE_TABLES:
+        op.drop_column(table_name, "byte_size")
+        op.drop_column(table_name, "height")
+        op.drop_column(table_name, "width")
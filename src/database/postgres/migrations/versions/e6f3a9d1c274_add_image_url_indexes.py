@@ -0,0 +1,36 @@
+"""Add image url indexes
+
+Revision ID: e6f3a9d1c274
+Revises: d41b7e2c9a08
+Create Date: 2025-12-06 09:48:15.274630
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e6f3a9d1c274"
+down_revision: Union[str, None] = "d41b7e2c9a08"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+IMAGE_URL_INDEXES = (
+    ("market_images_image_url_idx", "market_images", "image_url"),
+    ("business_images_image_url_idx", "business_images", "image_url"),
+    ("review_images_image_url_idx", "review_images", "image_url"),
+    ("pending_images_image_url_idx", "pending_images", "image_url"),
+    ("markets_logo_url_idx", "markets", "logo_url"),
+    ("businesses_logo_url_idx", "businesses", "logo_url"),
+)
+
+
+def upgrade() -> None:
+    for index_name, table_name, column_name in IMAGE_URL_INDEXES:
+        op.create_index(index_name, table_name, [column_name])
+
+
+def downgrade() -> None:
+    for index_name, table_name, _ in reversed(IMAGE_URL_INDEXES):
+        op.drop_index(index_name, table_name=table_name)
@@ -0,0 +1,104 @@
+"""Partition pending images by day
+
+Revision ID: f2a7c4e8b135
+Revises: e6f3a9d1c274
+Create Date: 2025-12-08 10:21:37.518204
+
+"""
+
+from datetime import datetime, timedelta, timezone
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "f2a7c4e8b135"
+down_revision: Union[str, None] = "e6f3a9d1c274"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+PENDING_IMAGE_COLUMNS = (
+    "id, user_id, image_url, s3_key, width, height, byte_size, created_at"
+)
+INITIAL_PARTITION_DAYS_BEHIND = 1
+INITIAL_PARTITION_DAYS_AHEAD = 7
+
+
+def upgrade() -> None:
+    op.execute("ALTER TABLE pending_images RENAME TO pending_images_legacy")
+    op.execute(
+        "ALTER TABLE pending_images_legacy "
+        "RENAME CONSTRAINT pending_images_pkey TO pending_images_legacy_pkey"
+    )
+    op.execute(
+        "ALTER INDEX pending_images_image_url_idx "
+        "RENAME TO pending_images_legacy_image_url_idx"
+    )
+
+    op.execute("""
+        CREATE TABLE pending_images (
+            id UUID NOT NULL DEFAULT gen_random_uuid(),
+            user_id UUID NOT NULL,
+            image_url VARCHAR NOT NULL,
+            s3_key VARCHAR NOT NULL,
+            width INTEGER,
+            height INTEGER,
+            byte_size INTEGER,
+            created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT now(),
+            CONSTRAINT pending_images_pkey PRIMARY KEY (id, created_at)
+        ) PARTITION BY RANGE (created_at)
+    """)
+    op.create_index("pending_images_image_url_idx", "pending_images", ["image_url"])
+    op.execute(
+        "CREATE TABLE pending_images_default PARTITION OF pending_images DEFAULT"
+    )
+
+    today = datetime.now(timezone.utc).date()
+    for offset in range(
+        -INITIAL_PARTITION_DAYS_BEHIND, INITIAL_PARTITION_DAYS_AHEAD + 1
+    ):
+        day = today + timedelta(days=offset)
+        op.execute(
+            f"CREATE TABLE pending_images_p{day:%Y%m%d} PARTITION OF pending_images "
+            f"FOR VALUES FROM ('{day.isoformat()}') "
+            f"TO ('{(day + timedelta(days=1)).isoformat()}')"
+        )
+
+    op.execute(
+        f"INSERT INTO pending_images ({PENDING_IMAGE_COLUMNS}) "
+        f"SELECT {PENDING_IMAGE_COLUMNS} FROM pending_images_legacy"
+    )
+    op.execute("DROP TABLE pending_images_legacy")
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE pending_images RENAME TO pending_images_partitioned")
+    op.execute(
+        "ALTER TABLE pending_images_partitioned "
+        "RENAME CONSTRAINT pending_images_pkey TO pending_images_partitioned_pkey"
+    )
+    op.execute(
+        "ALTER INDEX pending_images_image_url_idx "
+        "RENAME TO pending_images_partitioned_image_url_idx"
+    )
+
+    op.execute("""
+        CREATE TABLE pending_images (
+            id UUID NOT NULL DEFAULT gen_random_uuid(),
+            user_id UUID NOT NULL,
+            image_url VARCHAR NOT NULL,
+            s3_key VARCHAR NOT NULL,
+            width INTEGER,
+            height INTEGER,
+            byte_size INTEGER,
+            created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT now(),
+            CONSTRAINT pending_images_pkey PRIMARY KEY (id)
+        )
+    """)
+    op.create_index("pending_images_image_url_idx", "pending_images", ["image_url"])
+
+    op.execute(
+        f"INSERT INTO pending_images ({PENDING_IMAGE_COLUMNS}) "
+        f"SELECT {PENDING_IMAGE_COLUMNS} FROM pending_images_partitioned"
+    )
+    op.execute("DROP TABLE pending_images_partitioned")
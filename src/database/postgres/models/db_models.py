@@ -3,7 +3,15 @@ from enum import Enum
 from typing import Any, Dict, Optional
 from uuid import UUID, uuid4
 
-from sqlalchemy import CheckConstraint, Column, ForeignKey, Index, UniqueConstraint
+from sqlalchemy import (
+    CheckConstraint,
+    Column,
+    DateTime,
+    ForeignKey,
+    Index,
+    UniqueConstraint,
+    text,
+)
 from sqlalchemy import Enum as SQLEnum
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.dialects.postgresql import UUID as PGUUID
@@ -34,8 +42,32 @@ class PaymentStatus(str, Enum):
     refunded = "refunded"
 
 
+class EmailEventType(str, Enum):
+    application_created = "application_created"
+    application_accepted = "application_accepted"
+    application_rejected = "application_rejected"
+    application_confirmed = "application_confirmed"
+    application_updated = "application_updated"
+    payment_updated = "payment_updated"
+
+
+class EmailOutboxStatus(str, Enum):
+    pending = "pending"
+    processing = "processing"
+    sent = "sent"
+    failed = "failed"
+
+
+class UploadSessionStatus(str, Enum):
+    active = "active"
+    completing = "completing"
+    completed = "completed"
+    aborted = "aborted"
+
+
 class Business(SQLModel, table=True):
     __tablename__ = "businesses"
+    __table_args__ = (Index("businesses_logo_url_idx", "logo_url"),)
 
     id: UUID = Field(
         default_factory=uuid4,
@@ -66,6 +98,7 @@ class Business(SQLModel, table=True):
 
 class BusinessImage(SQLModel, table=True):
     __tablename__ = "business_images"
+    __table_args__ = (Index("business_images_image_url_idx", "image_url"),)
 
     id: UUID = Field(
         default_factory=uuid4,
@@ -83,10 +116,14 @@ class BusinessImage(SQLModel, table=True):
     image_url: str
     caption: Optional[str] = None
     sort_order: Optional[int] = None
+    width: Optional[int] = None
+    height: Optional[int] = None
+    byte_size: Optional[int] = None
 
 
 class Market(SQLModel, table=True):
     __tablename__ = "markets"
+    __table_args__ = (Index("markets_logo_url_idx", "logo_url"),)
 
     id: UUID = Field(
         default_factory=uuid4,
@@ -136,6 +173,7 @@ class Market(SQLModel, table=True):
 
 class MarketImage(SQLModel, table=True):
     __tablename__ = "market_images"
+    __table_args__ = (Index("market_images_image_url_idx", "image_url"),)
 
     id: UUID = Field(
         default_factory=uuid4,
@@ -153,6 +191,9 @@ class MarketImage(SQLModel, table=True):
     image_url: str
     caption: Optional[str] = None
     sort_order: Optional[int] = None
+    width: Optional[int] = None
+    height: Optional[int] = None
+    byte_size: Optional[int] = None
 
 
 class Application(SQLModel, table=True):
@@ -274,6 +315,7 @@ class Review(SQLModel, table=True):
 
 class ReviewImage(SQLModel, table=True):
     __tablename__ = "review_images"
+    __table_args__ = (Index("review_images_image_url_idx", "image_url"),)
 
     id: UUID = Field(
         default_factory=uuid4,
@@ -294,6 +336,11 @@ class ReviewImage(SQLModel, table=True):
 
 class PendingImage(SQLModel, table=True):
     __tablename__ = "pending_images"
+    __table_args__ = (
+        Index("pending_images_image_url_idx", "image_url"),
+        Index("pending_images_user_id_s3_key_idx", "user_id", "s3_key"),
+        {"postgresql_partition_by": "RANGE (created_at)"},
+    )
 
     id: UUID = Field(
         default_factory=uuid4,
@@ -306,6 +353,114 @@ class PendingImage(SQLModel, table=True):
     user_id: UUID = Field(sa_column=Column(PGUUID(as_uuid=True)))
     image_url: str
     s3_key: str
+    width: Optional[int] = None
+    height: Optional[int] = None
+    byte_size: Optional[int] = None
+    created_at: datetime = Field(
+        default_factory=lambda: datetime.now(timezone.utc),
+        sa_column=Column(
+            DateTime(timezone=True), primary_key=True, server_default=func.now()
+        ),
+    )
+
+
+class UploadSession(SQLModel, table=True):
+    __tablename__ = "upload_sessions"
+    __table_args__ = (
+        Index("upload_sessions_status_expires_at_idx", "status", "expires_at"),
+    )
+
+    id: UUID = Field(
+        default_factory=uuid4,
+        sa_column=Column(
+            PGUUID(as_uuid=True),
+            primary_key=True,
+            server_default=func.gen_random_uuid(),
+        ),
+    )
+    user_id: UUID = Field(sa_column=Column(PGUUID(as_uuid=True)))
+    entity_type: str
+    filename: str
+    content_type: str
+    s3_key: str
+    s3_upload_id: str
+    total_bytes: int
+    chunk_bytes: int
+    width: Optional[int] = None
+    height: Optional[int] = None
+    status: UploadSessionStatus = Field(
+        default=UploadSessionStatus.active,
+        sa_column=Column(SQLEnum(UploadSessionStatus, native_enum=False, length=50)),
+    )
+    expires_at: datetime
+    created_at: datetime = Field(
+        default_factory=lambda: datetime.now(timezone.utc),
+        sa_column=Column(server_default=func.now()),
+    )
+
+
+class UploadSessionPart(SQLModel, table=True):
+    __tablename__ = "upload_session_parts"
+
+    session_id: UUID = Field(
+        sa_column=Column(
+            PGUUID(as_uuid=True),
+            ForeignKey("upload_sessions.id", ondelete="CASCADE"),
+            primary_key=True,
+        )
+    )
+    part_number: int = Field(primary_key=True)
+    etag: str
+    byte_size: int
+    created_at: datetime = Field(
+        default_factory=lambda: datetime.now(timezone.utc),
+        sa_column=Column(server_default=func.now()),
+    )
+
+
+class EmailOutbox(SQLModel, table=True):
+    __tablename__ = "email_outbox"
+    __table_args__ = (
+        Index("email_outbox_status_next_attempt_idx", "status", "next_attempt_at"),
+        Index("email_outbox_application_idx", "application_id", "event_type"),
+        Index(
+            "email_outbox_pending_update_idx",
+            "application_id",
+            unique=True,
+            postgresql_where=text(
+                "status = 'pending' AND event_type = 'application_updated'"
+            ),
+        ),
+    )
+
+    id: UUID = Field(
+        default_factory=uuid4,
+        sa_column=Column(
+            PGUUID(as_uuid=True),
+            primary_key=True,
+            server_default=func.gen_random_uuid(),
+        ),
+    )
+    event_type: EmailEventType = Field(
+        sa_column=Column(SQLEnum(EmailEventType, native_enum=False, length=50)),
+    )
+    application_id: UUID = Field(sa_column=Column(PGUUID(as_uuid=True)))
+    payload: Optional[Dict[str, Any]] = Field(
+        default=None,
+        sa_column=Column(JSONB),
+    )
+    status: EmailOutboxStatus = Field(
+        default=EmailOutboxStatus.pending,
+        sa_column=Column(SQLEnum(EmailOutboxStatus, native_enum=False, length=50)),
+    )
+    attempts: int = Field(default=0)
+    next_attempt_at: datetime = Field(
+        default_factory=lambda: datetime.now(timezone.utc),
+        sa_column=Column(server_default=func.now()),
+    )
+    locked_until: Optional[datetime] = None
+    last_error: Optional[str] = None
+    sent_at: Optional[datetime] = None
     created_at: datetime = Field(
         default_factory=lambda: datetime.now(timezone.utc),
         sa_column=Column(server_default=func.now()),
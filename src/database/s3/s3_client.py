@@ -1,12 +1,19 @@
-from typing import BinaryIO, Optional
+import asyncio
+import hashlib
+from typing import BinaryIO, Iterator, Optional
 
 import boto3
+from botocore.config import Config
 from botocore.exceptions import ClientError, NoCredentialsError
 from fastapi import HTTPException
 
 from src.common.config import settings
 from src.common.constants import S3_PUBLIC_BUCKET_NAME
 from src.common.logger import logger
+from src.common.utils.image_metadata import HASH_CHUNK_BYTES
+
+S3_MIN_PART_SIZE_BYTES = 5 * 1024 * 1024
+S3_DELETE_BATCH_LIMIT = 1000
 
 
 class S3Client:
@@ -21,6 +28,10 @@ class S3Client:
                 region_name=settings.S3_REGION,
                 aws_access_key_id=settings.S3_ACCESS_KEY_ID,
                 aws_secret_access_key=settings.S3_SECRET_ACCESS_KEY_ID,
+                config=Config(
+                    signature_version="s3v4",
+                    max_pool_connections=settings.S3_MAX_POOL_CONNECTIONS,
+                ),
             )
             return s3_client
         except NoCredentialsError:
@@ -35,21 +46,21 @@ class S3Client:
         file_key: str,
         content_type: Optional[str] = None,
         bucket_name: Optional[str] = None,
+        max_size: Optional[int] = None,
     ) -> str:
         try:
-            file.seek(0)
-            file_content = file.read()
-
             extra_args = {}
             if content_type:
                 extra_args["ContentType"] = content_type
 
             bucket = bucket_name or S3_PUBLIC_BUCKET_NAME
-            self.s3_client.put_object(
-                Bucket=bucket, Key=file_key, Body=file_content, **extra_args
+            await asyncio.to_thread(
+                self._stream_upload, file, bucket, file_key, extra_args, max_size
             )
 
             return f"File uploaded successfully: {file_key}"
+        except HTTPException:
+            raise
         except ClientError as e:
             error_code = e.response["Error"]["Code"]
             if error_code == "NoSuchBucket":
@@ -65,12 +76,82 @@ class S3Client:
                 status_code=500, detail=f"Failed to upload file: {str(e)}"
             )
 
+    def _read_chunk(
+        self, file: BinaryIO, size: int, uploaded: int, max_size: Optional[int]
+    ) -> bytes:
+        if max_size is not None:
+            size = min(size, max_size - uploaded + 1)
+
+        chunk = file.read(size)
+        if max_size is not None and uploaded + len(chunk) > max_size:
+            raise HTTPException(
+                status_code=413,
+                detail=f"File exceeds maximum size of {max_size} bytes",
+            )
+        return chunk
+
+    def _stream_upload(
+        self,
+        file: BinaryIO,
+        bucket: str,
+        file_key: str,
+        extra_args: dict,
+        max_size: Optional[int],
+    ) -> None:
+        file.seek(0)
+        threshold = max(settings.S3_MULTIPART_THRESHOLD_BYTES, S3_MIN_PART_SIZE_BYTES)
+        chunk_size = max(settings.S3_MULTIPART_CHUNK_BYTES, S3_MIN_PART_SIZE_BYTES)
+
+        chunk = self._read_chunk(file, threshold, 0, max_size)
+        if len(chunk) < threshold:
+            self.s3_client.put_object(
+                Bucket=bucket, Key=file_key, Body=chunk, **extra_args
+            )
+            return
+
+        upload_id = self.s3_client.create_multipart_upload(
+            Bucket=bucket, Key=file_key, **extra_args
+        )["UploadId"]
+        try:
+            parts = []
+            uploaded = 0
+            while chunk:
+                part_number = len(parts) + 1
+                response = self.s3_client.upload_part(
+                    Bucket=bucket,
+                    Key=file_key,
+                    UploadId=upload_id,
+                    PartNumber=part_number,
+                    Body=chunk,
+                )
+                parts.append({"ETag": response["ETag"], "PartNumber": part_number})
+                uploaded += len(chunk)
+                del chunk
+                chunk = self._read_chunk(file, chunk_size, uploaded, max_size)
+
+            self.s3_client.complete_multipart_upload(
+                Bucket=bucket,
+                Key=file_key,
+                UploadId=upload_id,
+                MultipartUpload={"Parts": parts},
+            )
+        except BaseException:
+            try:
+                self.s3_client.abort_multipart_upload(
+                    Bucket=bucket, Key=file_key, UploadId=upload_id
+                )
+            except Exception as e:
+                logger.error(f"Failed to abort multipart upload {file_key}: {str(e)}")
+            raise
+
     async def delete_file(
         self, file_key: str, bucket_name: Optional[str] = None
     ) -> str:
         try:
             bucket = bucket_name or S3_PUBLIC_BUCKET_NAME
-            self.s3_client.delete_object(Bucket=bucket, Key=file_key)
+            await asyncio.to_thread(
+                self.s3_client.delete_object, Bucket=bucket, Key=file_key
+            )
 
             return f"File deleted successfully: {file_key}"
         except ClientError as e:
@@ -109,6 +190,113 @@ class S3Client:
                 status_code=500, detail=f"Failed to update file: {str(e)}"
             )
 
+    def _get_object_body(self, bucket: str, file_key: str) -> bytes:
+        response = self.s3_client.get_object(Bucket=bucket, Key=file_key)
+        return response["Body"].read()
+
+    def delete_files_sync(
+        self, file_keys: list[str], bucket_name: Optional[str] = None
+    ) -> list[str]:
+        if not file_keys:
+            return []
+
+        bucket = bucket_name or S3_PUBLIC_BUCKET_NAME
+        deleted_keys = []
+        try:
+            for start in range(0, len(file_keys), S3_DELETE_BATCH_LIMIT):
+                batch = file_keys[start : start + S3_DELETE_BATCH_LIMIT]
+                response = self.s3_client.delete_objects(
+                    Bucket=bucket,
+                    Delete={
+                        "Objects": [{"Key": file_key} for file_key in batch],
+                        "Quiet": True,
+                    },
+                )
+                failed_keys = {error["Key"] for error in response.get("Errors", [])}
+                deleted_keys.extend(
+                    file_key for file_key in batch if file_key not in failed_keys
+                )
+        except ClientError as e:
+            error_code = e.response["Error"]["Code"]
+            if error_code == "NoSuchBucket":
+                raise HTTPException(
+                    status_code=404, detail=f"Bucket not found: {bucket}"
+                )
+            raise HTTPException(
+                status_code=500, detail=f"Failed to delete files: {str(e)}"
+            )
+        except Exception as e:
+            raise HTTPException(
+                status_code=500, detail=f"Failed to delete files: {str(e)}"
+            )
+
+        return deleted_keys
+
+    async def delete_files(
+        self, file_keys: list[str], bucket_name: Optional[str] = None
+    ) -> list[str]:
+        return await asyncio.to_thread(self.delete_files_sync, file_keys, bucket_name)
+
+    async def download_file_range(
+        self,
+        file_key: str,
+        start: int,
+        end: int,
+        bucket_name: Optional[str] = None,
+    ) -> bytes:
+        try:
+            bucket = bucket_name or S3_PUBLIC_BUCKET_NAME
+            response = await asyncio.to_thread(
+                self.s3_client.get_object,
+                Bucket=bucket,
+                Key=file_key,
+                Range=f"bytes={start}-{end}",
+            )
+            return await asyncio.to_thread(response["Body"].read)
+        except ClientError as e:
+            error_code = e.response["Error"]["Code"]
+            if error_code == "NoSuchBucket":
+                bucket = bucket_name or S3_PUBLIC_BUCKET_NAME
+                raise HTTPException(
+                    status_code=404, detail=f"Bucket not found: {bucket}"
+                )
+            elif error_code == "NoSuchKey":
+                raise HTTPException(
+                    status_code=404, detail=f"File not found: {file_key}"
+                )
+            raise HTTPException(
+                status_code=500, detail=f"Failed to download file: {str(e)}"
+            )
+        except Exception as e:
+            raise HTTPException(
+                status_code=500, detail=f"Failed to download file: {str(e)}"
+            )
+
+    def iter_file_pages(
+        self,
+        prefix: str = "",
+        page_size: int = 1000,
+        bucket_name: Optional[str] = None,
+    ) -> Iterator[list[dict]]:
+        bucket = bucket_name or S3_PUBLIC_BUCKET_NAME
+        paginator = self.s3_client.get_paginator("list_objects_v2")
+        try:
+            for page in paginator.paginate(
+                Bucket=bucket,
+                Prefix=prefix,
+                PaginationConfig={"PageSize": page_size},
+            ):
+                yield page.get("Contents", [])
+        except ClientError as e:
+            error_code = e.response["Error"]["Code"]
+            if error_code == "NoSuchBucket":
+                raise HTTPException(
+                    status_code=404, detail=f"Bucket not found: {bucket}"
+                )
+            raise HTTPException(
+                status_code=500, detail=f"Failed to list files: {str(e)}"
+            )
+
     def download_file_sync(
         self, file_key: str, bucket_name: Optional[str] = None
     ) -> bytes:
@@ -143,9 +331,7 @@ class S3Client:
         try:
             logger.debug(f"Downloading file from bucket: {bucket_name or 'default'}")
             bucket = bucket_name or S3_PUBLIC_BUCKET_NAME
-            response = self.s3_client.get_object(Bucket=bucket, Key=file_key)
-
-            return response["Body"].read()
+            return await asyncio.to_thread(self._get_object_body, bucket, file_key)
         except ClientError as e:
             error_code = e.response["Error"]["Code"]
             if error_code == "NoSuchBucket":
@@ -165,12 +351,254 @@ class S3Client:
                 status_code=500, detail=f"Failed to download file: {str(e)}"
             )
 
+    def _hash_object_body(self, bucket: str, file_key: str) -> str:
+        response = self.s3_client.get_object(Bucket=bucket, Key=file_key)
+        digest = hashlib.sha256()
+        for chunk in response["Body"].iter_chunks(HASH_CHUNK_BYTES):
+            digest.update(chunk)
+        return digest.hexdigest()
+
+    async def compute_file_sha256(
+        self, file_key: str, bucket_name: Optional[str] = None
+    ) -> str:
+        try:
+            bucket = bucket_name or S3_PUBLIC_BUCKET_NAME
+            return await asyncio.to_thread(self._hash_object_body, bucket, file_key)
+        except ClientError as e:
+            error_code = e.response["Error"]["Code"]
+            if error_code == "NoSuchBucket":
+                bucket = bucket_name or S3_PUBLIC_BUCKET_NAME
+                raise HTTPException(
+                    status_code=404, detail=f"Bucket not found: {bucket}"
+                )
+            elif error_code == "NoSuchKey":
+                raise HTTPException(
+                    status_code=404, detail=f"File not found: {file_key}"
+                )
+            raise HTTPException(
+                status_code=500, detail=f"Failed to hash file: {str(e)}"
+            )
+        except Exception as e:
+            raise HTTPException(
+                status_code=500, detail=f"Failed to hash file: {str(e)}"
+            )
+
+    async def copy_file(
+        self, source_key: str, file_key: str, bucket_name: Optional[str] = None
+    ) -> None:
+        try:
+            bucket = bucket_name or S3_PUBLIC_BUCKET_NAME
+            await asyncio.to_thread(
+                self.s3_client.copy_object,
+                Bucket=bucket,
+                Key=file_key,
+                CopySource={"Bucket": bucket, "Key": source_key},
+            )
+        except ClientError as e:
+            error_code = e.response["Error"]["Code"]
+            if error_code == "NoSuchBucket":
+                bucket = bucket_name or S3_PUBLIC_BUCKET_NAME
+                raise HTTPException(
+                    status_code=404, detail=f"Bucket not found: {bucket}"
+                )
+            elif error_code == "NoSuchKey":
+                raise HTTPException(
+                    status_code=404, detail=f"File not found: {source_key}"
+                )
+            raise HTTPException(
+                status_code=500, detail=f"Failed to copy file: {str(e)}"
+            )
+        except Exception as e:
+            raise HTTPException(
+                status_code=500, detail=f"Failed to copy file: {str(e)}"
+            )
+
+    async def create_multipart_upload(
+        self,
+        file_key: str,
+        content_type: Optional[str] = None,
+        bucket_name: Optional[str] = None,
+    ) -> str:
+        try:
+            extra_args = {}
+            if content_type:
+                extra_args["ContentType"] = content_type
+
+            bucket = bucket_name or S3_PUBLIC_BUCKET_NAME
+            response = await asyncio.to_thread(
+                self.s3_client.create_multipart_upload,
+                Bucket=bucket,
+                Key=file_key,
+                **extra_args,
+            )
+            return response["UploadId"]
+        except ClientError as e:
+            error_code = e.response["Error"]["Code"]
+            if error_code == "NoSuchBucket":
+                bucket = bucket_name or S3_PUBLIC_BUCKET_NAME
+                raise HTTPException(
+                    status_code=404, detail=f"Bucket not found: {bucket}"
+                )
+            raise HTTPException(
+                status_code=500, detail=f"Failed to start upload: {str(e)}"
+            )
+        except Exception as e:
+            raise HTTPException(
+                status_code=500, detail=f"Failed to start upload: {str(e)}"
+            )
+
+    async def upload_part(
+        self,
+        file_key: str,
+        upload_id: str,
+        part_number: int,
+        body: bytes,
+        bucket_name: Optional[str] = None,
+    ) -> str:
+        try:
+            bucket = bucket_name or S3_PUBLIC_BUCKET_NAME
+            response = await asyncio.to_thread(
+                self.s3_client.upload_part,
+                Bucket=bucket,
+                Key=file_key,
+                UploadId=upload_id,
+                PartNumber=part_number,
+                Body=body,
+            )
+            return response["ETag"]
+        except ClientError as e:
+            error_code = e.response["Error"]["Code"]
+            if error_code == "NoSuchUpload":
+                raise HTTPException(
+                    status_code=404, detail=f"Upload not found: {file_key}"
+                )
+            raise HTTPException(
+                status_code=500, detail=f"Failed to upload part: {str(e)}"
+            )
+        except Exception as e:
+            raise HTTPException(
+                status_code=500, detail=f"Failed to upload part: {str(e)}"
+            )
+
+    async def complete_multipart_upload(
+        self,
+        file_key: str,
+        upload_id: str,
+        parts: list[dict],
+        bucket_name: Optional[str] = None,
+    ) -> None:
+        try:
+            bucket = bucket_name or S3_PUBLIC_BUCKET_NAME
+            await asyncio.to_thread(
+                self.s3_client.complete_multipart_upload,
+                Bucket=bucket,
+                Key=file_key,
+                UploadId=upload_id,
+                MultipartUpload={"Parts": parts},
+            )
+        except ClientError as e:
+            error_code = e.response["Error"]["Code"]
+            if error_code == "NoSuchUpload":
+                raise HTTPException(
+                    status_code=404, detail=f"Upload not found: {file_key}"
+                )
+            elif error_code in ("InvalidPart", "InvalidPartOrder", "EntityTooSmall"):
+                raise HTTPException(
+                    status_code=400, detail=f"Invalid upload parts: {str(e)}"
+                )
+            raise HTTPException(
+                status_code=500, detail=f"Failed to complete upload: {str(e)}"
+            )
+        except Exception as e:
+            raise HTTPException(
+                status_code=500, detail=f"Failed to complete upload: {str(e)}"
+            )
+
+    def abort_multipart_upload_sync(
+        self, file_key: str, upload_id: str, bucket_name: Optional[str] = None
+    ) -> None:
+        try:
+            bucket = bucket_name or S3_PUBLIC_BUCKET_NAME
+            self.s3_client.abort_multipart_upload(
+                Bucket=bucket, Key=file_key, UploadId=upload_id
+            )
+        except ClientError as e:
+            error_code = e.response["Error"]["Code"]
+            if error_code == "NoSuchUpload":
+                return
+            raise HTTPException(
+                status_code=500, detail=f"Failed to abort upload: {str(e)}"
+            )
+        except Exception as e:
+            raise HTTPException(
+                status_code=500, detail=f"Failed to abort upload: {str(e)}"
+            )
+
+    async def abort_multipart_upload(
+        self, file_key: str, upload_id: str, bucket_name: Optional[str] = None
+    ) -> None:
+        await asyncio.to_thread(
+            self.abort_multipart_upload_sync, file_key, upload_id, bucket_name
+        )
+
+    def generate_presigned_upload_url(
+        self,
+        file_key: str,
+        content_type: str,
+        content_length: int,
+        expires_in: int,
+        bucket_name: Optional[str] = None,
+    ) -> str:
+        try:
+            bucket = bucket_name or S3_PUBLIC_BUCKET_NAME
+            return self.s3_client.generate_presigned_url(
+                "put_object",
+                Params={
+                    "Bucket": bucket,
+                    "Key": file_key,
+                    "ContentType": content_type,
+                    "ContentLength": content_length,
+                },
+                ExpiresIn=expires_in,
+            )
+        except Exception as e:
+            raise HTTPException(
+                status_code=500, detail=f"Failed to create upload URL: {str(e)}"
+            )
+
+    async def get_file_metadata(
+        self, file_key: str, bucket_name: Optional[str] = None
+    ) -> Optional[dict]:
+        try:
+            bucket = bucket_name or S3_PUBLIC_BUCKET_NAME
+            return await asyncio.to_thread(
+                self.s3_client.head_object, Bucket=bucket, Key=file_key
+            )
+        except ClientError as e:
+            error_code = e.response["Error"]["Code"]
+            if error_code == "NoSuchBucket":
+                bucket = bucket_name or S3_PUBLIC_BUCKET_NAME
+                raise HTTPException(
+                    status_code=404, detail=f"Bucket not found: {bucket}"
+                )
+            elif error_code in ("404", "NoSuchKey"):
+                return None
+            raise HTTPException(
+                status_code=500, detail=f"Failed to read file metadata: {str(e)}"
+            )
+        except Exception as e:
+            raise HTTPException(
+                status_code=500, detail=f"Failed to read file metadata: {str(e)}"
+            )
+
     async def file_exists(
         self, file_key: str, bucket_name: Optional[str] = None
     ) -> bool:
         try:
             bucket = bucket_name or S3_PUBLIC_BUCKET_NAME
-            self.s3_client.head_object(Bucket=bucket, Key=file_key)
+            await asyncio.to_thread(
+                self.s3_client.head_object, Bucket=bucket, Key=file_key
+            )
             return True
         except ClientError as e:
             error_code = e.response["Error"]["Code"]
@@ -1,6 +1,10 @@
 from src.downstream.google.google_places_client import GooglePlacesClient
+from src.downstream.http.dependency import http_client_registry
+from src.downstream.http.http_client_registry import DownstreamService
 
-google_places_client = GooglePlacesClient()
+google_places_client = GooglePlacesClient(
+    http_client_registry.get_client(DownstreamService.google_places)
+)
 
 
 def get_google_places_client() -> GooglePlacesClient:
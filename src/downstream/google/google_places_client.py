@@ -8,9 +8,9 @@ from src.common.logger import logger
 
 
 class GooglePlacesClient:
-    def __init__(self):
+    def __init__(self, http_client: httpx.Client):
         self.api_key = settings.GOOGLE_PLACES_API_KEY
-        self.base_url = "https://places.googleapis.com/v1"
+        self.http_client = http_client
 
     def _get_headers(self) -> Dict[str, str]:
         return {
@@ -21,24 +21,22 @@ class GooglePlacesClient:
 
     def get_place_details(self, place_id: str) -> Optional[Dict[str, Any]]:
         try:
-            url = f"{self.base_url}/places/{place_id}"
             headers = self._get_headers()
 
-            with httpx.Client() as client:
-                response = client.get(url, headers=headers, timeout=10.0)
+            response = self.http_client.get(f"/places/{place_id}", headers=headers)
 
-                if response.status_code == 404:
-                    return None
+            if response.status_code == 404:
+                return None
 
-                if response.status_code != 200:
-                    logger.error(
-                        f"Google Places API error: {response.status_code} - {response.text}"
-                    )
-                    raise HTTPException(
-                        status_code=500, detail="Failed to fetch place details"
-                    )
+            if response.status_code != 200:
+                logger.error(
+                    f"Google Places API error: {response.status_code} - {response.text}"
+                )
+                raise HTTPException(
+                    status_code=500, detail="Failed to fetch place details"
+                )
 
-                return response.json()
+            return response.json()
 
         except httpx.RequestError as e:
             logger.error(f"Google Places API request error: {e}")
@@ -49,7 +47,6 @@ class GooglePlacesClient:
 
     def search_places(self, query: str) -> Optional[Dict[str, Any]]:
         try:
-            url = f"{self.base_url}/places:searchText"
             headers = {
                 "Content-Type": "application/json",
                 "X-Goog-Api-Key": self.api_key,
@@ -58,18 +55,20 @@ class GooglePlacesClient:
 
             payload = {"textQuery": query}
 
-            with httpx.Client() as client:
-                response = client.post(url, headers=headers, json=payload, timeout=10.0)
+            response = self.http_client.post(
+                "/places:searchText",
+                headers=headers,
+                json=payload,
+                extensions={"retry": True},
+            )
 
-                if response.status_code != 200:
-                    logger.error(
-                        f"Google Places API error: {response.status_code} - {response.text}"
-                    )
-                    raise HTTPException(
-                        status_code=500, detail="Failed to search places"
-                    )
+            if response.status_code != 200:
+                logger.error(
+                    f"Google Places API error: {response.status_code} - {response.text}"
+                )
+                raise HTTPException(status_code=500, detail="Failed to search places")
 
-                return response.json()
+            return response.json()
 
         except httpx.RequestError as e:
             logger.error(f"Google Places API request error: {e}")
@@ -0,0 +1,45 @@
+import httpx
+
+from src.common.config import settings
+from src.downstream.http.http_client_registry import (
+    DownstreamService,
+    HttpClientConfig,
+    HttpClientRegistry,
+)
+
+http_client_registry = HttpClientRegistry(
+    {
+        DownstreamService.google_places: HttpClientConfig(
+            base_url="https://places.googleapis.com/v1",
+            timeout_seconds=settings.GOOGLE_PLACES_TIMEOUT_SECONDS,
+            max_retries=settings.HTTP_CLIENT_MAX_RETRIES,
+            http2=settings.HTTP_CLIENT_HTTP2_ENABLED,
+            failure_threshold=settings.HTTP_CLIENT_CIRCUIT_FAILURE_THRESHOLD,
+            recovery_seconds=settings.HTTP_CLIENT_CIRCUIT_RECOVERY_SECONDS,
+        ),
+        DownstreamService.supabase: HttpClientConfig(
+            base_url=settings.SUPABASE_PROJECT_URL,
+            timeout_seconds=settings.SUPABASE_HTTP_TIMEOUT_SECONDS,
+            max_retries=settings.HTTP_CLIENT_MAX_RETRIES,
+            http2=settings.HTTP_CLIENT_HTTP2_ENABLED,
+            failure_threshold=settings.HTTP_CLIENT_CIRCUIT_FAILURE_THRESHOLD,
+            recovery_seconds=settings.HTTP_CLIENT_CIRCUIT_RECOVERY_SECONDS,
+        ),
+        DownstreamService.resend: HttpClientConfig(
+            base_url="https://api.resend.com",
+            timeout_seconds=settings.RESEND_HTTP_TIMEOUT_SECONDS,
+            max_retries=settings.HTTP_CLIENT_MAX_RETRIES,
+            http2=settings.HTTP_CLIENT_HTTP2_ENABLED,
+            failure_threshold=settings.HTTP_CLIENT_CIRCUIT_FAILURE_THRESHOLD,
+            recovery_seconds=settings.HTTP_CLIENT_CIRCUIT_RECOVERY_SECONDS,
+        ),
+    }
+)
+
+
+def get_http_client_registry() -> HttpClientRegistry:
+    return http_client_registry
+
+
+def get_supabase_http_client() -> httpx.Client:
+    return http_client_registry.get_client(DownstreamService.supabase)
@@ -0,0 +1,261 @@
+import asyncio
+import importlib.util
+import random
+import threading
+import time
+from enum import Enum
+
+import httpx
+from pydantic import BaseModel
+
+from src.common.logger import logger
+
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+RETRYABLE_STATUS_CODES = frozenset({429, 502, 503, 504})
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+
+class DownstreamService(str, Enum):
+    google_places = "google_places"
+    supabase = "supabase"
+    resend = "resend"
+
+
+class HttpClientConfig(BaseModel):
+    base_url: str = ""
+    timeout_seconds: float = 10.0
+    connect_timeout_seconds: float = 5.0
+    max_retries: int = 2
+    retry_backoff_seconds: float = 0.2
+    retry_backoff_max_seconds: float = 2.0
+    http2: bool = True
+    max_connections: int = 20
+    max_keepalive_connections: int = 10
+    keepalive_expiry_seconds: float = 30.0
+    failure_threshold: int = 5
+    recovery_seconds: float = 30.0
+
+
+class CircuitOpenError(httpx.TransportError):
+    pass
+
+
+class CircuitBreaker:
+    def __init__(self, name: str, failure_threshold: int, recovery_seconds: float):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.recovery_seconds = recovery_seconds
+        self.failures = 0
+        self.opened_at: float | None = None
+        self.trial_in_flight = False
+        self.lock = threading.Lock()
+
+    def before_request(self, request: httpx.Request) -> None:
+        with self.lock:
+            if self.opened_at is None:
+                return
+            if time.monotonic() - self.opened_at < self.recovery_seconds:
+                raise CircuitOpenError(
+                    f"Circuit for {self.name} is open", request=request
+                )
+            if self.trial_in_flight:
+                raise CircuitOpenError(
+                    f"Circuit for {self.name} is half-open", request=request
+                )
+            self.trial_in_flight = True
+
+    def record_success(self) -> None:
+        with self.lock:
+            if self.opened_at is not None:
+                logger.info(f"Circuit for {self.name} closed")
+            self.failures = 0
+            self.opened_at = None
+            self.trial_in_flight = False
+
+    def record_failure(self) -> None:
+        with self.lock:
+            self.failures += 1
+            self.trial_in_flight = False
+            if self.opened_at is not None or self.failures >= self.failure_threshold:
+                if self.opened_at is None:
+                    logger.warning(
+                        f"Circuit for {self.name} opened after {self.failures} failures"
+                    )
+                self.opened_at = time.monotonic()
+
+
+class RetryPolicy:
+    def __init__(self, config: HttpClientConfig):
+        self.max_retries = config.max_retries
+        self.backoff_seconds = config.retry_backoff_seconds
+        self.backoff_max_seconds = config.retry_backoff_max_seconds
+
+    def should_retry(
+        self, request: httpx.Request, attempt: int, error: Exception | None = None
+    ) -> bool:
+        if attempt >= self.max_retries:
+            return False
+        if isinstance(error, (httpx.ConnectError, httpx.ConnectTimeout)):
+            return True
+        return (
+            request.method in IDEMPOTENT_METHODS
+            or request.extensions.get("retry") is True
+        )
+
+    def backoff(self, attempt: int) -> float:
+        delay = min(self.backoff_max_seconds, self.backoff_seconds * 2**attempt)
+        return random.uniform(0, delay)
+
+
+class ResilientTransport(httpx.BaseTransport):
+    def __init__(
+        self,
+        transport: httpx.BaseTransport,
+        breaker: CircuitBreaker,
+        retry_policy: RetryPolicy,
+    ):
+        self.transport = transport
+        self.breaker = breaker
+        self.retry_policy = retry_policy
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        attempt = 0
+        while True:
+            self.breaker.before_request(request)
+            try:
+                response = self.transport.handle_request(request)
+            except httpx.TransportError as e:
+                self.breaker.record_failure()
+                if not self.retry_policy.should_retry(request, attempt, e):
+                    raise
+            else:
+                if response.status_code not in RETRYABLE_STATUS_CODES:
+                    self.breaker.record_success()
+                    return response
+                self.breaker.record_failure()
+                if not self.retry_policy.should_retry(request, attempt):
+                    return response
+                response.close()
+
+            time.sleep(self.retry_policy.backoff(attempt))
+            attempt += 1
+
+    def close(self) -> None:
+        self.transport.close()
+
+
+class AsyncResilientTransport(httpx.AsyncBaseTransport):
+    def __init__(
+        self,
+        transport: httpx.AsyncBaseTransport,
+        breaker: CircuitBreaker,
+        retry_policy: RetryPolicy,
+    ):
+        self.transport = transport
+        self.breaker = breaker
+        self.retry_policy = retry_policy
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        attempt = 0
+        while True:
+            self.breaker.before_request(request)
+            try:
+                response = await self.transport.handle_async_request(request)
+            except httpx.TransportError as e:
+                self.breaker.record_failure()
+                if not self.retry_policy.should_retry(request, attempt, e):
+                    raise
+            else:
+                if response.status_code not in RETRYABLE_STATUS_CODES:
+                    self.breaker.record_success()
+                    return response
+                self.breaker.record_failure()
+                if not self.retry_policy.should_retry(request, attempt):
+                    return response
+                await response.aclose()
+
+            await asyncio.sleep(self.retry_policy.backoff(attempt))
+            attempt += 1
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
+
+
+class HttpClientRegistry:
+    def __init__(self, configs: dict[DownstreamService, HttpClientConfig]):
+        self.configs = configs
+        self.breakers = {
+            service: CircuitBreaker(
+                service.value, config.failure_threshold, config.recovery_seconds
+            )
+            for service, config in configs.items()
+        }
+        self.clients: dict[DownstreamService, httpx.Client] = {}
+        self.async_clients: dict[DownstreamService, httpx.AsyncClient] = {}
+        self.lock = threading.Lock()
+
+    def _client_options(self, config: HttpClientConfig) -> dict:
+        return {
+            "base_url": config.base_url,
+            "timeout": httpx.Timeout(
+                config.timeout_seconds, connect=config.connect_timeout_seconds
+            ),
+            "follow_redirects": True,
+        }
+
+    def _transport_options(self, config: HttpClientConfig) -> dict:
+        return {
+            "http2": config.http2 and HTTP2_AVAILABLE,
+            "limits": httpx.Limits(
+                max_connections=config.max_connections,
+                max_keepalive_connections=config.max_keepalive_connections,
+                keepalive_expiry=config.keepalive_expiry_seconds,
+            ),
+        }
+
+    def get_client(self, service: DownstreamService) -> httpx.Client:
+        with self.lock:
+            client = self.clients.get(service)
+            if client is None or client.is_closed:
+                config = self.configs[service]
+                client = httpx.Client(
+                    transport=ResilientTransport(
+                        httpx.HTTPTransport(**self._transport_options(config)),
+                        self.breakers[service],
+                        RetryPolicy(config),
+                    ),
+                    **self._client_options(config),
+                )
+                self.clients[service] = client
+            return client
+
+    def get_async_client(self, service: DownstreamService) -> httpx.AsyncClient:
+        with self.lock:
+            client = self.async_clients.get(service)
+            if client is None or client.is_closed:
+                config = self.configs[service]
+                client = httpx.AsyncClient(
+                    transport=AsyncResilientTransport(
+                        httpx.AsyncHTTPTransport(**self._transport_options(config)),
+                        self.breakers[service],
+                        RetryPolicy(config),
+                    ),
+                    **self._client_options(config),
+                )
+                self.async_clients[service] = client
+            return client
+
+    def close(self) -> None:
+        with self.lock:
+            clients = list(self.clients.values())
+            self.clients.clear()
+        for client in clients:
+            client.close()
+
+    async def aclose(self) -> None:
+        with self.lock:
+            async_clients = list(self.async_clients.values())
+            self.async_clients.clear()
+        for client in async_clients:
+            await client.aclose()
+        self.close()
@@ -1,6 +1,10 @@
+from src.downstream.http.dependency import http_client_registry
+from src.downstream.http.http_client_registry import DownstreamService
 from src.downstream.resend.resend_email_client import ResendEmailClient
 
-resend_email_client = ResendEmailClient()
+resend_email_client = ResendEmailClient(
+    http_client_registry.get_client(DownstreamService.resend)
+)
 
 
 def get_resend_email_client() -> ResendEmailClient:
@@ -1,15 +1,39 @@
-from typing import Optional
+from typing import Dict, List, Mapping, Optional, Tuple, Union
 
+import httpx
 import resend
 
 from src.common.config import settings
 from src.common.logger import logger
 
+RESEND_BATCH_LIMIT = 100
+
+
+class ResendHttpClient(resend.HTTPClient):
+    def __init__(self, http_client: httpx.Client):
+        self.http_client = http_client
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        headers: Mapping[str, str],
+        json: Optional[Union[Dict[str, object], List[object]]] = None,
+    ) -> Tuple[bytes, int, Mapping[str, str]]:
+        try:
+            response = self.http_client.request(
+                method=method, url=url, headers=headers, json=json
+            )
+            return response.content, response.status_code, response.headers
+        except httpx.HTTPError as e:
+            raise RuntimeError(f"Request failed: {e}") from e
+
 
 class ResendEmailClient:
-    def __init__(self):
+    def __init__(self, http_client: httpx.Client):
         if settings.RESEND_ENABLED:
             resend.api_key = settings.RESEND_API_KEY
+            resend.default_http_client = ResendHttpClient(http_client)
         self.from_email = settings.RESEND_FROM_EMAIL
         self.from_name = settings.RESEND_FROM_NAME
 
@@ -47,3 +71,44 @@ class ResendEmailClient:
         except Exception as e:
             logger.error(f"Failed to send email to {to}: {str(e)}")
             raise
+
+    def send_batch(self, messages: list[dict]) -> list[dict]:
+        if not messages:
+            return []
+
+        if not settings.RESEND_ENABLED:
+            logger.info(
+                f"Email sending is disabled. Would have sent {len(messages)} batched emails"
+            )
+            return [
+                {"id": "disabled", "message": "Email sending is disabled"}
+                for _ in messages
+            ]
+
+        try:
+            from_address = f"{self.from_name} <{self.from_email}>"
+            params = []
+            for message in messages:
+                to = message["to"]
+                email_params = resend.Emails.SendParams(
+                    {
+                        "from": from_address,
+                        "to": to if isinstance(to, list) else [to],
+                        "subject": message["subject"],
+                    }
+                )
+                if message.get("html"):
+                    email_params["html"] = message["html"]
+                if message.get("text"):
+                    email_params["text"] = message["text"]
+                params.append(email_params)
+
+            results = []
+            for start in range(0, len(params), RESEND_BATCH_LIMIT):
+                response = resend.Batch.send(params[start : start + RESEND_BATCH_LIMIT])
+                results.extend(response.get("data", []))
+            logger.info(f"Batch of {len(params)} emails sent successfully")
+            return results
+        except Exception as e:
+            logger.error(f"Failed to send batch of {len(messages)} emails: {str(e)}")
+            raise
@@ -1,6 +1,10 @@
+from src.downstream.http.dependency import http_client_registry
+from src.downstream.http.http_client_registry import DownstreamService
 from src.downstream.supabase.supabase_admin_client import SupabaseAdminClient
 
-supabase_admin_client = SupabaseAdminClient()
+supabase_admin_client = SupabaseAdminClient(
+    http_client_registry.get_client(DownstreamService.supabase)
+)
 
 
 def get_supabase_admin_client() -> SupabaseAdminClient:
@@ -1,16 +1,19 @@
 from uuid import UUID
 
+import httpx
 from supabase import Client, create_client
+from supabase.lib.client_options import SyncClientOptions
 
 from src.common.config import settings
 from src.common.logger import logger
 
 
 class SupabaseAdminClient:
-    def __init__(self):
+    def __init__(self, http_client: httpx.Client):
         self.client: Client = create_client(
             settings.SUPABASE_PROJECT_URL,
             settings.SUPABASE_SERVICE_ROLE_KEY,
+            options=SyncClientOptions(httpx_client=http_client),
         )
 
     def get_user(self, user_id: UUID):
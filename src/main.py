@@ -1,12 +1,23 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 
+from src.common.config import settings
 from src.common.constants import PROJECT_TITLE
 from src.common.logger import logger, setup_logging
+from src.common.utils.compression import CompressionMiddleware
 from src.common.utils.exception_handlers import register_exception_handlers
 from src.common.utils.response import Response
 from src.common.utils.routes import include_routers
+from src.downstream.http.dependency import http_client_registry
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    await http_client_registry.aclose()
 
 
 def create_app() -> FastAPI:
@@ -23,8 +34,15 @@ def create_app() -> FastAPI:
         summary="Monkeybun Backend Service API",
         description="Monkeybun Backend Service API",
         version="0.1.0",
+        lifespan=lifespan,
     )
 
+    app.add_middleware(
+        CompressionMiddleware,
+        minimum_size=settings.COMPRESSION_MIN_BYTES,
+        gzip_level=settings.COMPRESSION_GZIP_LEVEL,
+        brotli_quality=settings.COMPRESSION_BROTLI_QUALITY,
+    )
     app.add_middleware(
         CORSMiddleware,
         allow_origins=["*"],
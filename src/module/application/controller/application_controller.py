@@ -1,7 +1,8 @@
 from typing import Annotated
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, Header, HTTPException, Query
+from fastapi.responses import StreamingResponse
 
 from src.common.logger import logger
 from src.common.utils.response import Response, StandardResponse, Status
@@ -37,7 +38,7 @@ def create_application(
     application = application_service.create_application(db, current_user, request)
     return Response.success(
         message="Application created successfully",
-        data=application.model_dump(mode="json"),
+        data=application,
         status_code=Status.CREATED,
     )
 
@@ -75,7 +76,7 @@ def get_my_applications(
         )
     return Response.success(
         message="Applications retrieved successfully",
-        data=result.model_dump(mode="json"),
+        data=result,
     )
 
 
@@ -86,7 +87,17 @@ def get_my_markets_applications(
     current_user: Annotated[UUID, Depends(get_current_user)],
     limit: Annotated[int, Query(ge=1, le=100)] = 100,
     offset: Annotated[int, Query(ge=0)] = 0,
+    accept: Annotated[str | None, Header()] = None,
 ) -> StandardResponse:
+    if accept and "application/x-ndjson" in accept:
+        logger.info(f"Streaming applications for user {current_user}'s markets")
+        return StreamingResponse(
+            application_service.stream_my_markets_applications_with_details(
+                db, current_user
+            ),
+            media_type="application/x-ndjson",
+        )
+
     logger.info(
         f"Retrieving applications for user {current_user}'s markets - limit: {limit}, offset: {offset}"
     )
@@ -95,7 +106,7 @@ def get_my_markets_applications(
     )
     return Response.success(
         message="Applications retrieved successfully",
-        data=result.model_dump(mode="json"),
+        data=result,
     )
 
 
@@ -126,7 +137,7 @@ def get_application(
 
     return Response.success(
         message="Application retrieved successfully",
-        data=application.model_dump(mode="json"),
+        data=application,
     )
 
 
@@ -191,7 +202,7 @@ def search_applications(
     result = application_service.search_applications(db, filters)
     return Response.success(
         message="Applications retrieved successfully",
-        data=result.model_dump(mode="json"),
+        data=result,
     )
 
 
@@ -209,7 +220,7 @@ def update_application(
     )
     return Response.success(
         message="Application updated successfully",
-        data=application.model_dump(mode="json"),
+        data=application,
     )
 
 
@@ -239,7 +250,7 @@ def accept_application(
     )
     return Response.success(
         message="Application accepted successfully",
-        data=application.model_dump(mode="json"),
+        data=application,
     )
 
 
@@ -257,7 +268,7 @@ def reject_application(
     )
     return Response.success(
         message="Application rejected successfully",
-        data=application.model_dump(mode="json"),
+        data=application,
     )
 
 
@@ -277,7 +288,7 @@ def update_payment(
     )
     return Response.success(
         message="Payment updated successfully",
-        data=application.model_dump(mode="json"),
+        data=application,
     )
 
 
@@ -295,5 +306,5 @@ def confirm_application(
     )
     return Response.success(
         message="Application confirmed successfully",
-        data=application.model_dump(mode="json"),
+        data=application,
     )
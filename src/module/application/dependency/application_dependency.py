@@ -5,23 +5,26 @@ from fastapi import Depends, HTTPException
 
 from src.database.dependency.db_dependency import DatabaseDep
 from src.database.postgres.models.db_models import Application, Business
-from src.downstream.resend.dependency import get_resend_email_client
-from src.downstream.resend.resend_email_client import ResendEmailClient
-from src.downstream.supabase.dependency import get_supabase_admin_client
-from src.downstream.supabase.supabase_admin_client import SupabaseAdminClient
 from src.module.auth.dependency.auth_dependency import get_current_user
 from src.module.application.service.application_service import ApplicationService
-from src.module.application.service.email_service import ApplicationEmailService
+from src.module.application.service.email_outbox_service import EmailOutboxService
 from src.module.review.dependency.review_dependency import ReviewServiceDep
 
 
+def get_email_outbox_service() -> EmailOutboxService:
+    return EmailOutboxService()
+
+
+EmailOutboxServiceDep = Annotated[EmailOutboxService, Depends(get_email_outbox_service)]
+
+
 def get_application_service(
-    email_client: Annotated[ResendEmailClient, Depends(get_resend_email_client)],
-    supabase_client: Annotated[SupabaseAdminClient, Depends(get_supabase_admin_client)],
+    email_outbox_service: EmailOutboxServiceDep,
     review_service: ReviewServiceDep,
 ) -> ApplicationService:
-    email_service = ApplicationEmailService(email_client, supabase_client)
-    return ApplicationService(email_service=email_service, review_service=review_service)
+    return ApplicationService(
+        email_outbox_service=email_outbox_service, review_service=review_service
+    )
 
 
 ApplicationServiceDep = Annotated[ApplicationService, Depends(get_application_service)]
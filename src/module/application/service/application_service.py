@@ -1,7 +1,9 @@
 from datetime import datetime, timezone
+from typing import Iterator
 from uuid import UUID
 
 from fastapi import HTTPException
+from pydantic_core import to_json
 from sqlalchemy import and_, func
 from sqlmodel import Session, select
 
@@ -9,9 +11,12 @@ from src.database.postgres.models.db_models import (
     Application,
     ApplicationStatus,
     Business,
+    EmailEventType,
     Market,
 )
-from src.common.utils.s3_url import convert_s3_url_to_public_url
+from src.common.config import settings
+from src.common.utils.row_query import select_columns, select_response_columns
+from src.common.utils.s3_url import ImageRendition, get_image_rendition_url
 from src.database.postgres.models.db_models import BusinessImage, MarketImage
 from src.module.application.schema.application_schema import (
     ApplicationAcceptRequest,
@@ -28,16 +33,16 @@ from src.module.application.schema.application_schema import (
     ApplicationWithDetailsResponse,
 )
 from src.module.review.service.review_service import ReviewService
-from src.module.application.service.email_service import ApplicationEmailService
+from src.module.application.service.email_outbox_service import EmailOutboxService
 
 
 class ApplicationService:
     def __init__(
         self,
-        email_service: ApplicationEmailService | None = None,
+        email_outbox_service: EmailOutboxService | None = None,
         review_service: ReviewService | None = None,
     ):
-        self.email_service = email_service
+        self.email_outbox_service = email_outbox_service
         self.review_service = review_service
 
     def create_application(
@@ -82,6 +87,7 @@ class ApplicationService:
             answers=request.answers,
         )
         db.add(application)
+        self._enqueue_email(db, EmailEventType.application_created, application.id)
 
         try:
             db.commit()
@@ -100,14 +106,6 @@ class ApplicationService:
                 )
             raise
 
-        if self.email_service:
-            try:
-                self.email_service.send_application_created_email(db, application)
-            except Exception as e:
-                from src.common.logger import logger
-
-                logger.error(f"Failed to send application created email: {str(e)}")
-
         return ApplicationResponse.model_validate(application.model_dump())
 
     def get_application_by_id(
@@ -122,7 +120,7 @@ class ApplicationService:
     def search_applications(
         self, db: Session, filters: ApplicationSearchFilters
     ) -> ApplicationListResponse:
-        query = select(Application)
+        query = select_response_columns(Application, ApplicationSearchResponse)
 
         conditions = []
 
@@ -225,19 +223,13 @@ class ApplicationService:
                     changes[key] = "updated"
 
         db.add(application)
+        if self.email_outbox_service and changes:
+            self.email_outbox_service.enqueue_application_update(
+                db, application.id, changes
+            )
         db.commit()
         db.refresh(application)
 
-        if self.email_service and changes:
-            try:
-                self.email_service.send_application_updated_email(
-                    db, application, changes
-                )
-            except Exception as e:
-                from src.common.logger import logger
-
-                logger.error(f"Failed to send application updated email: {str(e)}")
-
         return ApplicationResponse.model_validate(application.model_dump())
 
     def delete_application(
@@ -292,17 +284,10 @@ class ApplicationService:
         application.rejection_reason = None
 
         db.add(application)
+        self._enqueue_email(db, EmailEventType.application_accepted, application.id)
         db.commit()
         db.refresh(application)
 
-        if self.email_service:
-            try:
-                self.email_service.send_application_accepted_email(db, application)
-            except Exception as e:
-                from src.common.logger import logger
-
-                logger.error(f"Failed to send application accepted email: {str(e)}")
-
         return ApplicationResponse.model_validate(application.model_dump())
 
     def reject_application(
@@ -337,17 +322,10 @@ class ApplicationService:
         application.rejection_reason = request.rejection_reason
 
         db.add(application)
+        self._enqueue_email(db, EmailEventType.application_rejected, application.id)
         db.commit()
         db.refresh(application)
 
-        if self.email_service:
-            try:
-                self.email_service.send_application_rejected_email(db, application)
-            except Exception as e:
-                from src.common.logger import logger
-
-                logger.error(f"Failed to send application rejected email: {str(e)}")
-
         return ApplicationResponse.model_validate(application.model_dump())
 
     def get_my_applications(
@@ -358,11 +336,11 @@ class ApplicationService:
         limit: int = 20,
         offset: int = 0,
     ) -> ApplicationListResponse:
-        user_businesses = db.exec(
-            select(Business).where(Business.owner_user_id == user_id)
+        business_ids = db.exec(
+            select(Business.id).where(Business.owner_user_id == user_id)
         ).all()
 
-        if not user_businesses:
+        if not business_ids:
             return ApplicationListResponse(
                 applications=[],
                 total=0,
@@ -370,14 +348,12 @@ class ApplicationService:
                 offset=offset,
             )
 
-        business_ids = [business.id for business in user_businesses]
-
         conditions = [Application.business_id.in_(business_ids)]
 
         if status:
             conditions.append(Application.status == status)
 
-        query = select(Application)
+        query = select_response_columns(Application, ApplicationSearchResponse)
         if conditions:
             query = query.where(and_(*conditions))
 
@@ -421,11 +397,11 @@ class ApplicationService:
         limit: int = 20,
         offset: int = 0,
     ) -> ApplicationListWithDetailsResponse:
-        user_businesses = db.exec(
-            select(Business).where(Business.owner_user_id == user_id)
+        business_ids = db.exec(
+            select(Business.id).where(Business.owner_user_id == user_id)
         ).all()
 
-        if not user_businesses:
+        if not business_ids:
             return ApplicationListWithDetailsResponse(
                 applications=[],
                 total=0,
@@ -433,14 +409,12 @@ class ApplicationService:
                 offset=offset,
             )
 
-        business_ids = [business.id for business in user_businesses]
-
         conditions = [Application.business_id.in_(business_ids)]
 
         if status:
             conditions.append(Application.status == status)
 
-        query = select(Application)
+        query = select_response_columns(Application, ApplicationWithDetailsResponse)
         if conditions:
             query = query.where(and_(*conditions))
 
@@ -455,68 +429,15 @@ class ApplicationService:
 
         applications = db.exec(query).all()
 
-        market_ids = [app.market_id for app in applications]
-        markets = {}
-        if market_ids and self.review_service:
-            review_stats = self.review_service.get_batch_review_stats(
-                db, "market", market_ids
-            )
-            markets_query = select(Market).where(Market.id.in_(market_ids))
-            markets_list = db.exec(markets_query).all()
-            images_query = (
-                select(MarketImage)
-                .where(MarketImage.market_id.in_(market_ids))
-                .order_by(
-                    MarketImage.sort_order.asc().nulls_last(), MarketImage.id.asc()
-                )
-            )
-            all_images = db.exec(images_query).all()
-            images_by_market = {}
-            first_images_by_market = {}
-            for image in all_images:
-                if image.market_id not in images_by_market:
-                    images_by_market[image.market_id] = []
-                images_by_market[image.market_id].append(
-                    convert_s3_url_to_public_url(image.image_url)
-                )
-                if image.market_id not in first_images_by_market:
-                    first_images_by_market[image.market_id] = image
-
-            for market in markets_list:
-                review_count, average_rating = review_stats.get(market.id, (0, None))
-                market_dict = market.model_dump()
-                if market_dict.get("logo_url"):
-                    market_dict["logo_url"] = convert_s3_url_to_public_url(
-                        market_dict["logo_url"]
-                    )
-                first_image = first_images_by_market.get(market.id)
-                market_dict["image_url"] = (
-                    convert_s3_url_to_public_url(first_image.image_url)
-                    if first_image
-                    else market_dict.get("logo_url")
-                )
-                market_dict["images"] = images_by_market.get(market.id, [])
-                market_dict["review_count"] = review_count
-                market_dict["average_rating"] = average_rating
-                markets[market.id] = market_dict
-
-        application_responses = []
-        for application in applications:
-            application_responses.append(
-                ApplicationWithDetailsResponse(
-                    id=application.id,
-                    market_id=application.market_id,
-                    business_id=application.business_id,
-                    status=application.status,
-                    applied_at=application.applied_at,
-                    rejection_reason=application.rejection_reason,
-                    created_at=application.created_at,
-                    market=markets.get(application.market_id),
-                )
-            )
+        markets = self._get_market_details(
+            db, list({app.market_id for app in applications})
+        )
 
         return ApplicationListWithDetailsResponse(
-            applications=application_responses,
+            applications=[
+                self._build_application_with_details(application, markets, {})
+                for application in applications
+            ],
             total=total,
             limit=limit,
             offset=offset,
@@ -525,11 +446,11 @@ class ApplicationService:
     def get_my_markets_applications_with_details(
         self, db: Session, user_id: UUID, limit: int = 100, offset: int = 0
     ) -> ApplicationListWithDetailsResponse:
-        user_markets = db.exec(
-            select(Market).where(Market.organizer_user_id == user_id)
+        market_ids = db.exec(
+            select(Market.id).where(Market.organizer_user_id == user_id)
         ).all()
 
-        if not user_markets:
+        if not market_ids:
             return ApplicationListWithDetailsResponse(
                 applications=[],
                 total=0,
@@ -537,9 +458,9 @@ class ApplicationService:
                 offset=offset,
             )
 
-        market_ids = [market.id for market in user_markets]
-
-        query = select(Application).where(Application.market_id.in_(market_ids))
+        query = select_response_columns(
+            Application, ApplicationWithDetailsResponse
+        ).where(Application.market_id.in_(market_ids))
 
         total_query = select(func.count()).select_from(Application)
         total_query = total_query.where(Application.market_id.in_(market_ids))
@@ -550,104 +471,148 @@ class ApplicationService:
 
         applications = db.exec(query).all()
 
-        business_ids = [app.business_id for app in applications]
-        businesses = {}
-        if business_ids:
-            businesses_query = select(Business).where(Business.id.in_(business_ids))
-            businesses_list = db.exec(businesses_query).all()
-            images_query = (
-                select(BusinessImage)
-                .where(BusinessImage.business_id.in_(business_ids))
-                .order_by(
-                    BusinessImage.sort_order.asc().nulls_last(),
-                    BusinessImage.id.asc(),
-                )
-            )
-            all_images = db.exec(images_query).all()
-            images_by_business = {}
-            for image in all_images:
-                if image.business_id not in images_by_business:
-                    images_by_business[image.business_id] = []
-                images_by_business[image.business_id].append(
-                    convert_s3_url_to_public_url(image.image_url)
-                )
+        businesses = self._get_business_details(
+            db, list({app.business_id for app in applications})
+        )
+        markets = self._get_market_details(
+            db, list({app.market_id for app in applications})
+        )
 
-            for business in businesses_list:
-                business_dict = business.model_dump()
-                if business_dict.get("logo_url"):
-                    business_dict["logo_url"] = convert_s3_url_to_public_url(
-                        business_dict["logo_url"]
-                    )
-                business_dict["images"] = images_by_business.get(business.id, [])
-                businesses[business.id] = business_dict
+        return ApplicationListWithDetailsResponse(
+            applications=[
+                self._build_application_with_details(application, markets, businesses)
+                for application in applications
+            ],
+            total=total,
+            limit=limit,
+            offset=offset,
+        )
+
+    def stream_my_markets_applications_with_details(
+        self, db: Session, user_id: UUID
+    ) -> Iterator[bytes]:
+        market_ids = db.exec(
+            select(Market.id).where(Market.organizer_user_id == user_id)
+        ).all()
+
+        if not market_ids:
+            return
+
+        query = (
+            select_response_columns(Application, ApplicationWithDetailsResponse)
+            .where(Application.market_id.in_(market_ids))
+            .order_by(Application.created_at.desc(), Application.id.desc())
+            .execution_options(yield_per=settings.APPLICATION_STREAM_CHUNK_SIZE)
+        )
 
         markets = {}
-        if market_ids and self.review_service:
-            review_stats = self.review_service.get_batch_review_stats(
-                db, "market", market_ids
+        for applications in db.exec(query).partitions():
+            businesses = self._get_business_details(
+                db, list({app.business_id for app in applications})
             )
-            markets_query = select(Market).where(Market.id.in_(market_ids))
-            markets_list = db.exec(markets_query).all()
-            images_query = (
-                select(MarketImage)
-                .where(MarketImage.market_id.in_(market_ids))
-                .order_by(
-                    MarketImage.sort_order.asc().nulls_last(), MarketImage.id.asc()
+            markets.update(
+                self._get_market_details(
+                    db, list({app.market_id for app in applications} - markets.keys())
                 )
             )
-            all_images = db.exec(images_query).all()
-            images_by_market = {}
-            first_images_by_market = {}
-            for image in all_images:
-                if image.market_id not in images_by_market:
-                    images_by_market[image.market_id] = []
-                images_by_market[image.market_id].append(
-                    convert_s3_url_to_public_url(image.image_url)
-                )
-                if image.market_id not in first_images_by_market:
-                    first_images_by_market[image.market_id] = image
-
-            for market in markets_list:
-                review_count, average_rating = review_stats.get(market.id, (0, None))
-                market_dict = market.model_dump()
-                if market_dict.get("logo_url"):
-                    market_dict["logo_url"] = convert_s3_url_to_public_url(
-                        market_dict["logo_url"]
+            yield b"".join(
+                to_json(
+                    self._build_application_with_details(
+                        application, markets, businesses
                     )
-                first_image = first_images_by_market.get(market.id)
-                market_dict["image_url"] = (
-                    convert_s3_url_to_public_url(first_image.image_url)
-                    if first_image
-                    else market_dict.get("logo_url")
                 )
-                market_dict["images"] = images_by_market.get(market.id, [])
-                market_dict["review_count"] = review_count
-                market_dict["average_rating"] = average_rating
-                markets[market.id] = market_dict
+                + b"\n"
+                for application in applications
+            )
 
-        application_responses = []
-        for application in applications:
-            application_responses.append(
-                ApplicationWithDetailsResponse(
-                    id=application.id,
-                    market_id=application.market_id,
-                    business_id=application.business_id,
-                    status=application.status,
-                    applied_at=application.applied_at,
-                    rejection_reason=application.rejection_reason,
-                    created_at=application.created_at,
-                    market=markets.get(application.market_id),
-                    business=businesses.get(application.business_id),
-                )
+    def _build_application_with_details(
+        self, application, markets: dict, businesses: dict
+    ) -> ApplicationWithDetailsResponse:
+        return ApplicationWithDetailsResponse(
+            id=application.id,
+            market_id=application.market_id,
+            business_id=application.business_id,
+            status=application.status,
+            applied_at=application.applied_at,
+            rejection_reason=application.rejection_reason,
+            created_at=application.created_at,
+            market=markets.get(application.market_id),
+            business=businesses.get(application.business_id),
+        )
+
+    def _get_card_image_urls(
+        self, db: Session, image_model, owner_field: str, owner_ids: list[UUID]
+    ) -> dict:
+        images_query = (
+            select_columns(image_model, [owner_field, "image_url"])
+            .where(getattr(image_model, owner_field).in_(owner_ids))
+            .order_by(image_model.sort_order.asc().nulls_last(), image_model.id.asc())
+        )
+        images_by_owner = {}
+        for owner_id, image_url in db.exec(images_query).all():
+            if owner_id not in images_by_owner:
+                images_by_owner[owner_id] = []
+            images_by_owner[owner_id].append(
+                get_image_rendition_url(image_url, ImageRendition.card)
             )
+        return images_by_owner
 
-        return ApplicationListWithDetailsResponse(
-            applications=application_responses,
-            total=total,
-            limit=limit,
-            offset=offset,
+    def _build_card_details(self, row) -> dict:
+        details = row.model_dump()
+        if row.logo_url:
+            details["logo_url"] = get_image_rendition_url(
+                row.logo_url, ImageRendition.thumb
+            )
+        return details
+
+    def _get_business_details(self, db: Session, business_ids: list[UUID]) -> dict:
+        if not business_ids:
+            return {}
+
+        businesses_list = db.exec(
+            select(Business).where(Business.id.in_(business_ids))
+        ).all()
+        images_by_business = self._get_card_image_urls(
+            db, BusinessImage, "business_id", business_ids
         )
 
+        businesses = {}
+        for business in businesses_list:
+            business_dict = self._build_card_details(business)
+            business_dict["images"] = images_by_business.get(business.id, [])
+            businesses[business.id] = business_dict
+        return businesses
+
+    def _get_market_details(self, db: Session, market_ids: list[UUID]) -> dict:
+        markets = {}
+        if not market_ids or not self.review_service:
+            return markets
+
+        review_stats = self.review_service.get_batch_review_stats(
+            db, "market", market_ids
+        )
+        markets_list = db.exec(select(Market).where(Market.id.in_(market_ids))).all()
+        images_by_market = self._get_card_image_urls(
+            db, MarketImage, "market_id", market_ids
+        )
+
+        for market in markets_list:
+            review_count, average_rating = review_stats.get(market.id, (0, None))
+            images = images_by_market.get(market.id, [])
+            market_dict = self._build_card_details(market)
+            market_dict["image_url"] = (
+                images[0]
+                if images
+                else get_image_rendition_url(market.logo_url, ImageRendition.card)
+                if market.logo_url
+                else None
+            )
+            market_dict["images"] = images
+            market_dict["review_count"] = review_count
+            market_dict["average_rating"] = average_rating
+            markets[market.id] = market_dict
+        return markets
+
     def update_payment(
         self,
         db: Session,
@@ -681,17 +646,10 @@ class ApplicationService:
             setattr(application, key, value)
 
         db.add(application)
+        self._enqueue_email(db, EmailEventType.payment_updated, application.id)
         db.commit()
         db.refresh(application)
 
-        if self.email_service:
-            try:
-                self.email_service.send_payment_updated_email(db, application)
-            except Exception as e:
-                from src.common.logger import logger
-
-                logger.error(f"Failed to send payment updated email: {str(e)}")
-
         return ApplicationResponse.model_validate(application.model_dump())
 
     def confirm_application(
@@ -731,19 +689,18 @@ class ApplicationService:
         self._update_status_timestamps(application, ApplicationStatus.confirmed)
 
         db.add(application)
+        self._enqueue_email(db, EmailEventType.application_confirmed, application.id)
         db.commit()
         db.refresh(application)
 
-        if self.email_service:
-            try:
-                self.email_service.send_application_confirmed_email(db, application)
-            except Exception as e:
-                from src.common.logger import logger
-
-                logger.error(f"Failed to send application confirmed email: {str(e)}")
-
         return ApplicationResponse.model_validate(application.model_dump())
 
+    def _enqueue_email(
+        self, db: Session, event_type: EmailEventType, application_id: UUID
+    ) -> None:
+        if self.email_outbox_service:
+            self.email_outbox_service.enqueue(db, event_type, application_id)
+
     def _update_status_timestamps(
         self, application: Application, new_status: ApplicationStatus
     ) -> None:
@@ -0,0 +1,176 @@
+import random
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Optional
+from uuid import UUID, uuid4
+
+from sqlalchemy import and_, or_, text
+from sqlalchemy.dialects.postgresql import insert
+from sqlmodel import Session, select
+
+from src.common.config import settings
+from src.common.logger import logger
+from src.database.postgres.models.db_models import (
+    EmailEventType,
+    EmailOutbox,
+    EmailOutboxStatus,
+)
+from src.module.application.service.email_service import ApplicationEmailService
+
+
+class EmailOutboxService:
+    def __init__(self, email_service: ApplicationEmailService | None = None):
+        self.email_service = email_service
+
+    def enqueue(
+        self,
+        db: Session,
+        event_type: EmailEventType,
+        application_id: UUID,
+        payload: Optional[Dict[str, Any]] = None,
+    ) -> EmailOutbox:
+        entry = EmailOutbox(
+            event_type=event_type,
+            application_id=application_id,
+            payload=payload,
+        )
+        db.add(entry)
+        return entry
+
+    def enqueue_application_update(
+        self, db: Session, application_id: UUID, changes: Dict[str, Any]
+    ) -> None:
+        send_at = datetime.now(timezone.utc) + timedelta(
+            seconds=settings.EMAIL_UPDATE_COALESCE_SECONDS
+        )
+        statement = insert(EmailOutbox).values(
+            id=uuid4(),
+            event_type=EmailEventType.application_updated,
+            application_id=application_id,
+            payload=changes,
+            status=EmailOutboxStatus.pending,
+            attempts=0,
+            next_attempt_at=send_at,
+        )
+        db.exec(
+            statement.on_conflict_do_update(
+                index_elements=["application_id"],
+                index_where=text(
+                    "status = 'pending' AND event_type = 'application_updated'"
+                ),
+                set_={
+                    "payload": EmailOutbox.payload.concat(statement.excluded.payload)
+                },
+            )
+        )
+
+    def claim_batch(self, db: Session, batch_size: int) -> list[EmailOutbox]:
+        now = datetime.now(timezone.utc)
+        query = (
+            select(EmailOutbox)
+            .where(
+                or_(
+                    and_(
+                        EmailOutbox.status == EmailOutboxStatus.pending,
+                        EmailOutbox.next_attempt_at <= now,
+                    ),
+                    and_(
+                        EmailOutbox.status == EmailOutboxStatus.processing,
+                        EmailOutbox.locked_until < now,
+                    ),
+                )
+            )
+            .order_by(EmailOutbox.next_attempt_at.asc())
+            .limit(batch_size)
+            .with_for_update(skip_locked=True)
+        )
+        entries = db.exec(query).all()
+
+        claimed = []
+        locked_until = now + timedelta(seconds=settings.EMAIL_OUTBOX_LEASE_SECONDS)
+        for entry in entries:
+            if (
+                entry.status == EmailOutboxStatus.processing
+                and entry.attempts >= settings.EMAIL_OUTBOX_MAX_ATTEMPTS
+            ):
+                entry.status = EmailOutboxStatus.failed
+                entry.locked_until = None
+                entry.last_error = "Lease expired on final delivery attempt"
+                logger.error(f"Outbox email {entry.id} failed after lease expiry")
+            else:
+                entry.status = EmailOutboxStatus.processing
+                entry.locked_until = locked_until
+                entry.attempts += 1
+                claimed.append(entry)
+            db.add(entry)
+
+        db.commit()
+        return claimed
+
+    def process_batch(self, db: Session, batch_size: int) -> int:
+        if not self.email_service:
+            raise RuntimeError("Email outbox processing requires an email service")
+
+        entries = self.claim_batch(db, batch_size)
+        if not entries:
+            return 0
+
+        self.email_service.preload_outbox_entities(db, entries)
+
+        messages = []
+        deliverable = []
+        for entry in entries:
+            try:
+                message = self.email_service.build_outbox_email(db, entry)
+            except Exception as e:
+                logger.error(f"Failed to build outbox email {entry.id}: {str(e)}")
+                self._schedule_retry(entry, str(e))
+                continue
+
+            if message is None:
+                entry.status = EmailOutboxStatus.failed
+                entry.locked_until = None
+                entry.last_error = "No recipient or source data for email"
+                continue
+
+            messages.append(message)
+            deliverable.append(entry)
+
+        if messages:
+            try:
+                self.email_service.send_batch(messages)
+            except Exception as e:
+                for entry in deliverable:
+                    self._schedule_retry(entry, str(e))
+            else:
+                sent_at = datetime.now(timezone.utc)
+                for entry in deliverable:
+                    entry.status = EmailOutboxStatus.sent
+                    entry.locked_until = None
+                    entry.last_error = None
+                    entry.sent_at = sent_at
+
+        for entry in entries:
+            db.add(entry)
+        db.commit()
+
+        logger.info(
+            f"Processed {len(entries)} outbox emails ({len(messages)} sent in batch)"
+        )
+        return len(entries)
+
+    def _schedule_retry(self, entry: EmailOutbox, error: str) -> None:
+        entry.locked_until = None
+        entry.last_error = error
+
+        if entry.attempts >= settings.EMAIL_OUTBOX_MAX_ATTEMPTS:
+            entry.status = EmailOutboxStatus.failed
+            return
+
+        delay = min(
+            settings.EMAIL_OUTBOX_BACKOFF_MAX_SECONDS,
+            settings.EMAIL_OUTBOX_BACKOFF_BASE_SECONDS * 2 ** (entry.attempts - 1),
+        )
+        delay = random.uniform(delay / 2, delay)
+
+        entry.status = EmailOutboxStatus.pending
+        entry.next_attempt_at = datetime.now(timezone.utc) + timedelta(seconds=delay)
@@ -1,11 +1,34 @@
+from pathlib import Path
 from uuid import UUID
 
-from sqlmodel import Session
+from jinja2 import Environment, FileSystemLoader, select_autoescape
+from sqlmodel import Session, select
 
-from src.database.postgres.models.db_models import Application, Business, Market
+from src.database.postgres.models.db_models import (
+    Application,
+    Business,
+    EmailEventType,
+    EmailOutbox,
+    Market,
+)
 from src.downstream.resend.resend_email_client import ResendEmailClient
 from src.downstream.supabase.supabase_admin_client import SupabaseAdminClient
 
+TEMPLATE_DIR = Path(__file__).resolve().parent.parent / "template"
+
+template_environment = Environment(
+    loader=FileSystemLoader(TEMPLATE_DIR),
+    autoescape=select_autoescape(["html"]),
+    auto_reload=False,
+    trim_blocks=True,
+    lstrip_blocks=True,
+)
+
+email_templates = {
+    event_type: template_environment.get_template(f"{event_type.value}.html")
+    for event_type in EmailEventType
+}
+
 
 class ApplicationEmailService:
     def __init__(
@@ -14,218 +37,161 @@ class ApplicationEmailService:
         self.email_client = email_client
         self.supabase_client = supabase_client
 
-    def _get_vendor_email(
-        self, owner_user_id: UUID, business_email: str | None = None
+    def _get_user_email(
+        self, user_id: UUID, fallback_email: str | None = None
     ) -> str | None:
-        user = self.supabase_client.get_user(owner_user_id)
+        user = self.supabase_client.get_user(user_id)
         if user and user.email:
             return user.email
-        return business_email
+        return fallback_email
 
-    def send_application_created_email(
-        self, db: Session, application: Application
-    ) -> None:
-        market = db.get(Market, application.market_id)
-        business = db.get(Business, application.business_id)
+    def _render(self, event_type: EmailEventType, **context) -> str:
+        return email_templates[event_type].render(**context)
 
-        if not market or not business:
+    def preload_outbox_entities(self, db: Session, entries: list[EmailOutbox]) -> None:
+        application_ids = {entry.application_id for entry in entries}
+        if not application_ids:
             return
 
-        vendor_email = self._get_vendor_email(business.owner_user_id, business.email)
+        applications = db.exec(
+            select(Application).where(Application.id.in_(application_ids))
+        ).all()
+        market_ids = {application.market_id for application in applications}
+        business_ids = {application.business_id for application in applications}
+        if market_ids:
+            db.exec(select(Market).where(Market.id.in_(market_ids))).all()
+        if business_ids:
+            db.exec(select(Business).where(Business.id.in_(business_ids))).all()
+
+    def build_outbox_email(self, db: Session, entry: EmailOutbox) -> dict | None:
+        application = db.get(Application, entry.application_id)
+        if not application:
+            return None
+
+        market = db.get(Market, application.market_id)
+        business = db.get(Business, application.business_id)
+        if not market or not business:
+            return None
+
+        if entry.event_type == EmailEventType.application_created:
+            return self.build_application_created_email(application, market, business)
+        if entry.event_type == EmailEventType.application_accepted:
+            return self.build_application_accepted_email(application, market, business)
+        if entry.event_type == EmailEventType.application_rejected:
+            return self.build_application_rejected_email(application, market, business)
+        if entry.event_type == EmailEventType.application_confirmed:
+            return self.build_application_confirmed_email(application, market, business)
+        if entry.event_type == EmailEventType.payment_updated:
+            return self.build_payment_updated_email(application, market, business)
+        if entry.event_type == EmailEventType.application_updated:
+            return self.build_application_updated_email(
+                application, market, business, entry.payload or {}
+            )
+        return None
+
+    def send_batch(self, messages: list[dict]) -> list[dict]:
+        return self.email_client.send_batch(messages)
+
+    def build_application_created_email(
+        self, application: Application, market: Market, business: Business
+    ) -> dict | None:
+        vendor_email = self._get_user_email(business.owner_user_id, business.email)
         if not vendor_email:
-            return
+            return None
 
         subject = f"Application Submitted: {business.shop_name} applied to {market.market_name}"
-
-        html_content = f"""
-        <html>
-        <body>
-            <h2>Application Submitted Successfully</h2>
-            <p>Your application has been submitted successfully!</p>
-            <p><strong>Market:</strong> {market.market_name}</p>
-            <p><strong>Business:</strong> {business.shop_name}</p>
-            <p>You will be notified once the market organizer reviews your application.</p>
-            <p>You can track the status of your application in your dashboard.</p>
-        </body>
-        </html>
-        """
-
-        self.email_client.send_email(
-            to=vendor_email,
-            subject=subject,
-            html=html_content,
+        html_content = self._render(
+            EmailEventType.application_created,
+            market_name=market.market_name,
+            shop_name=business.shop_name,
         )
 
-    def send_application_accepted_email(
-        self, db: Session, application: Application
-    ) -> None:
-        market = db.get(Market, application.market_id)
-        business = db.get(Business, application.business_id)
+        return {"to": vendor_email, "subject": subject, "html": html_content}
 
-        if not market or not business:
-            return
-
-        vendor_email = self._get_vendor_email(business.owner_user_id, business.email)
+    def build_application_accepted_email(
+        self, application: Application, market: Market, business: Business
+    ) -> dict | None:
+        vendor_email = self._get_user_email(business.owner_user_id, business.email)
         if not vendor_email:
-            return
+            return None
 
         subject = f"Application Accepted: {business.shop_name} accepted to {market.market_name}"
-
-        html_content = f"""
-        <html>
-        <body>
-            <h2>Congratulations! Your Application Has Been Accepted</h2>
-            <p>Great news! Your application has been accepted.</p>
-            <p><strong>Market:</strong> {market.market_name}</p>
-            <p><strong>Business:</strong> {business.shop_name}</p>
-            <p>Next steps:</p>
-            <ol>
-                <li>Complete payment information in your application</li>
-                <li>Confirm your participation</li>
-            </ol>
-            <p>You can manage your application in your dashboard.</p>
-        </body>
-        </html>
-        """
-
-        self.email_client.send_email(
-            to=vendor_email,
-            subject=subject,
-            html=html_content,
+        html_content = self._render(
+            EmailEventType.application_accepted,
+            market_name=market.market_name,
+            shop_name=business.shop_name,
         )
 
-    def send_application_rejected_email(
-        self, db: Session, application: Application
-    ) -> None:
-        market = db.get(Market, application.market_id)
-        business = db.get(Business, application.business_id)
-
-        if not market or not business:
-            return
+        return {"to": vendor_email, "subject": subject, "html": html_content}
 
-        vendor_email = self._get_vendor_email(business.owner_user_id, business.email)
+    def build_application_rejected_email(
+        self, application: Application, market: Market, business: Business
+    ) -> dict | None:
+        vendor_email = self._get_user_email(business.owner_user_id, business.email)
         if not vendor_email:
-            return
+            return None
 
         subject = f"Application Update: {business.shop_name} - {market.market_name}"
-
-        rejection_reason_text = (
-            f"<p><strong>Reason:</strong> {application.rejection_reason}</p>"
-            if application.rejection_reason
-            else "<p>No specific reason was provided.</p>"
+        html_content = self._render(
+            EmailEventType.application_rejected,
+            market_name=market.market_name,
+            shop_name=business.shop_name,
+            rejection_reason=application.rejection_reason,
         )
 
-        html_content = f"""
-        <html>
-        <body>
-            <h2>Application Status Update</h2>
-            <p>We regret to inform you that your application has been declined.</p>
-            <p><strong>Market:</strong> {market.market_name}</p>
-            <p><strong>Business:</strong> {business.shop_name}</p>
-            {rejection_reason_text}
-            <p>Thank you for your interest. We encourage you to apply to other markets.</p>
-        </body>
-        </html>
-        """
-
-        self.email_client.send_email(
-            to=vendor_email,
-            subject=subject,
-            html=html_content,
-        )
-
-    def send_payment_updated_email(self, db: Session, application: Application) -> None:
-        market = db.get(Market, application.market_id)
-        business = db.get(Business, application.business_id)
-
-        if not market or not business:
-            return
+        return {"to": vendor_email, "subject": subject, "html": html_content}
 
-        vendor_email = self._get_vendor_email(business.owner_user_id, business.email)
+    def build_payment_updated_email(
+        self, application: Application, market: Market, business: Business
+    ) -> dict | None:
+        vendor_email = self._get_user_email(business.owner_user_id, business.email)
         if not vendor_email:
-            return
-
-        payment_method_text = (
-            application.payment_method.value
-            if application.payment_method
-            else "Not set"
-        )
-        payment_status_text = (
-            application.payment_status.value
-            if application.payment_status
-            else "Not set"
-        )
+            return None
 
         subject = (
             f"Payment Information Updated: {business.shop_name} - {market.market_name}"
         )
-
-        html_content = f"""
-        <html>
-        <body>
-            <h2>Payment Information Updated</h2>
-            <p>The payment information for your application has been updated.</p>
-            <p><strong>Market:</strong> {market.market_name}</p>
-            <p><strong>Business:</strong> {business.shop_name}</p>
-            <p><strong>Payment Method:</strong> {payment_method_text}</p>
-            <p><strong>Payment Status:</strong> {payment_status_text}</p>
-            <p>You can confirm your participation once you're ready.</p>
-        </body>
-        </html>
-        """
-
-        self.email_client.send_email(
-            to=vendor_email,
-            subject=subject,
-            html=html_content,
+        html_content = self._render(
+            EmailEventType.payment_updated,
+            market_name=market.market_name,
+            shop_name=business.shop_name,
+            payment_method=(
+                application.payment_method.value
+                if application.payment_method
+                else "Not set"
+            ),
+            payment_status=(
+                application.payment_status.value
+                if application.payment_status
+                else "Not set"
+            ),
         )
 
-    def send_application_confirmed_email(
-        self, db: Session, application: Application
-    ) -> None:
-        market = db.get(Market, application.market_id)
-        business = db.get(Business, application.business_id)
+        return {"to": vendor_email, "subject": subject, "html": html_content}
 
-        if not market or not business:
-            return
-
-        vendor_email = self._get_vendor_email(business.owner_user_id, business.email)
+    def build_application_confirmed_email(
+        self, application: Application, market: Market, business: Business
+    ) -> dict | None:
+        vendor_email = self._get_user_email(business.owner_user_id, business.email)
         if not vendor_email:
-            return
+            return None
 
         subject = f"Application Confirmed: {business.shop_name} confirmed for {market.market_name}"
-
-        html_content = f"""
-        <html>
-        <body>
-            <h2>Application Confirmed</h2>
-            <p>Your application has been confirmed. You're all set!</p>
-            <p><strong>Market:</strong> {market.market_name}</p>
-            <p><strong>Business:</strong> {business.shop_name}</p>
-            <p>We look forward to having you at the market!</p>
-        </body>
-        </html>
-        """
-
-        self.email_client.send_email(
-            to=vendor_email,
-            subject=subject,
-            html=html_content,
+        html_content = self._render(
+            EmailEventType.application_confirmed,
+            market_name=market.market_name,
+            shop_name=business.shop_name,
         )
 
-    def send_application_updated_email(
-        self, db: Session, application: Application, changes: dict
-    ) -> None:
-        market = db.get(Market, application.market_id)
-        business = db.get(Business, application.business_id)
-
-        if not market or not business:
-            return
-
-        vendor_email = self._get_vendor_email(business.owner_user_id, business.email)
-        if not vendor_email:
-            return
+        return {"to": vendor_email, "subject": subject, "html": html_content}
 
+    def build_application_updated_email(
+        self,
+        application: Application,
+        market: Market,
+        business: Business,
+        changes: dict,
+    ) -> dict | None:
         changes_list = []
         if "status" in changes:
             changes_list.append(f"Status: {changes['status']}")
@@ -239,31 +205,18 @@ class ApplicationEmailService:
             changes_list.append("Application answers updated")
 
         if not changes_list:
-            return
+            return None
 
-        subject = f"Application Updated: {business.shop_name} - {market.market_name}"
+        vendor_email = self._get_user_email(business.owner_user_id, business.email)
+        if not vendor_email:
+            return None
 
-        changes_html = (
-            "<ul>"
-            + "".join([f"<li>{change}</li>" for change in changes_list])
-            + "</ul>"
+        subject = f"Application Updated: {business.shop_name} - {market.market_name}"
+        html_content = self._render(
+            EmailEventType.application_updated,
+            market_name=market.market_name,
+            shop_name=business.shop_name,
+            changes=changes_list,
         )
 
-        html_content = f"""
-        <html>
-        <body>
-            <h2>Application Updated</h2>
-            <p>Your application has been updated with the following changes:</p>
-            {changes_html}
-            <p><strong>Market:</strong> {market.market_name}</p>
-            <p><strong>Business:</strong> {business.shop_name}</p>
-            <p>You can view the updated details in your dashboard.</p>
-        </body>
-        </html>
-        """
-
-        self.email_client.send_email(
-            to=vendor_email,
-            subject=subject,
-            html=html_content,
-        )
+        return {"to": vendor_email, "subject": subject, "html": html_content}
@@ -6,6 +6,7 @@ from fastapi import APIRouter, Depends, HTTPException
 
 from src.common.config import settings
 from src.common.utils.response import Response
+from src.downstream.http.dependency import get_supabase_http_client
 from src.downstream.supabase.dependency import get_supabase_admin_client
 from src.downstream.supabase.supabase_admin_client import SupabaseAdminClient
 from src.module.auth.dependency.auth_dependency import get_current_user
@@ -41,7 +42,7 @@ def get_profile(
 
     return Response.success(
         message="Profile retrieved",
-        data=user_response.model_dump(mode="json"),
+        data=user_response,
     )
 
 
@@ -85,12 +86,14 @@ def update_profile(
 
     return Response.success(
         message="Profile updated successfully",
-        data=user_response.model_dump(mode="json"),
+        data=user_response,
     )
 
 
 @router.post("/token")
-def create_token():
+def create_token(
+    http_client: Annotated[httpx.Client, Depends(get_supabase_http_client)],
+):
     if settings.PYTHON_ENV != "DEV":
         raise HTTPException(status_code=404, detail="Not Found")
 
@@ -98,7 +101,7 @@ def create_token():
         raise HTTPException(status_code=500, detail="Dev credentials not configured")
 
     try:
-        response = httpx.post(
+        response = http_client.post(
             f"https://{settings.SUPABASE_PROJECT_REF}.supabase.co/auth/v1/token?grant_type=password",
             json={
                 "email": settings.SUPABASE_DEV_USERNAME,
@@ -1,7 +1,9 @@
 from typing import Optional
 from uuid import UUID
 
-from pydantic import BaseModel
+from pydantic import BaseModel, field_validator
+
+from src.common.utils.s3_url import normalize_image_urls
 
 
 class UserResponse(BaseModel):
@@ -14,3 +16,8 @@ class UserResponse(BaseModel):
 class UserUpdateRequest(BaseModel):
     full_name: Optional[str] = None
     avatar_url: Optional[str] = None
+
+    @field_validator("avatar_url")
+    @classmethod
+    def normalize_image_url_fields(cls, value):
+        return normalize_image_urls(value)
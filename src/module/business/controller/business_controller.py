@@ -31,7 +31,7 @@ def create_business(
     business = business_service.create_business(db, current_user, request)
     return Response.success(
         message="Business created successfully",
-        data=business.model_dump(mode="json"),
+        data=business,
         status_code=Status.CREATED,
     )
 
@@ -50,7 +50,7 @@ def get_my_businesses(
     result = business_service.get_my_businesses(db, current_user, limit, offset)
     return Response.success(
         message="Businesses retrieved successfully",
-        data=result.model_dump(mode="json"),
+        data=result,
     )
 
 
@@ -64,7 +64,7 @@ def get_business(
     business = business_service.get_business_by_id(db, business_id)
     return Response.success(
         message="Business retrieved successfully",
-        data=business.model_dump(mode="json"),
+        data=business,
     )
 
 
@@ -74,6 +74,7 @@ def search_businesses(
     db: DatabaseDep,
     current_user: Annotated[UUID | None, Depends(get_optional_user)] = None,
     category: Annotated[str | None, Query()] = None,
+    fields: Annotated[str | None, Query()] = None,
     limit: Annotated[int, Query(ge=1, le=100)] = 20,
     offset: Annotated[int, Query(ge=0)] = 0,
 ) -> StandardResponse:
@@ -82,6 +83,7 @@ def search_businesses(
     )
     filters = BusinessSearchFilters(
         category=category,
+        fields=fields,
         limit=limit,
         offset=offset,
     )
@@ -89,7 +91,8 @@ def search_businesses(
     result = business_service.search_businesses(db, filters, current_user)
     return Response.success(
         message="Businesses retrieved successfully",
-        data=result.model_dump(mode="json"),
+        data=result,
+        exclude_unset=True,
     )
 
 
@@ -105,7 +108,7 @@ def update_business(
     business = business_service.update_business(db, business_id, current_user, request)
     return Response.success(
         message="Business updated successfully",
-        data=business.model_dump(mode="json"),
+        data=business,
     )
 
 
@@ -157,9 +160,7 @@ def update_business_image(
 
     return Response.success(
         message="Image updated successfully",
-        data=BusinessImageResponse.model_validate(
-            business_image.model_dump()
-        ).model_dump(mode="json"),
+        data=BusinessImageResponse.model_validate(business_image.model_dump()),
     )
 
 
@@ -1,8 +1,15 @@
 from datetime import datetime
-from typing import Optional
+from typing import Dict, Optional
 from uuid import UUID
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
+
+from src.common.utils.s3_url import normalize_image_urls
+from src.common.utils.sparse_fields import split_fields
+
+BUSINESS_SEARCH_FIELD_PRESETS = {
+    "list": ["id", "shop_name", "logo_url"],
+}
 
 
 class BusinessCreateRequest(BaseModel):
@@ -20,6 +27,11 @@ class BusinessCreateRequest(BaseModel):
     logo_url: Optional[str] = None
     image_urls: Optional[list[str]] = None
 
+    @field_validator("logo_url", "image_urls")
+    @classmethod
+    def normalize_image_url_fields(cls, value):
+        return normalize_image_urls(value)
+
 
 class BusinessUpdateRequest(BaseModel):
     shop_name: Optional[str] = None
@@ -36,6 +48,11 @@ class BusinessUpdateRequest(BaseModel):
     logo_url: Optional[str] = None
     image_urls: Optional[list[str]] = None
 
+    @field_validator("logo_url", "image_urls")
+    @classmethod
+    def normalize_image_url_fields(cls, value):
+        return normalize_image_urls(value)
+
 
 class BusinessImageResponse(BaseModel):
     id: UUID
@@ -43,6 +60,10 @@ class BusinessImageResponse(BaseModel):
     image_url: str
     caption: Optional[str] = None
     sort_order: Optional[int] = None
+    width: Optional[int] = None
+    height: Optional[int] = None
+    byte_size: Optional[int] = None
+    renditions: Optional[Dict[str, str]] = None
 
 
 class BusinessImageUpdateRequest(BaseModel):
@@ -73,9 +94,15 @@ class BusinessResponse(BaseModel):
 
 class BusinessSearchFilters(BaseModel):
     category: Optional[str] = None
+    fields: Optional[list[str]] = None
     limit: int = Field(default=20, ge=1, le=100)
     offset: int = Field(default=0, ge=0)
 
+    @field_validator("fields", mode="before")
+    @classmethod
+    def split_field_names(cls, value):
+        return split_fields(value)
+
 
 class BusinessSearchResponse(BaseModel):
     id: UUID
@@ -5,9 +5,17 @@ from fastapi import HTTPException
 from sqlalchemy import and_, func
 from sqlmodel import Session, select
 
-from src.common.utils.s3_url import convert_s3_url_to_public_url
+from src.common.utils.image_metadata import get_image_metadata
+from src.common.utils.row_query import select_columns, select_response_columns
+from src.common.utils.s3_url import (
+    ImageRendition,
+    get_image_rendition_url,
+    get_image_renditions,
+)
+from src.common.utils.sparse_fields import resolve_fields
 from src.database.postgres.models.db_models import Business, BusinessImage, PendingImage
 from src.module.business.schema.business_schema import (
+    BUSINESS_SEARCH_FIELD_PRESETS,
     BusinessCreateRequest,
     BusinessListResponse,
     BusinessResponse,
@@ -34,23 +42,37 @@ class BusinessService:
         db.refresh(business)
 
         if request.image_urls:
+            pending_images = db.exec(
+                select(PendingImage).where(
+                    PendingImage.user_id == user_id,
+                    PendingImage.image_url.in_(request.image_urls),
+                )
+            ).all()
+            metadata_by_url = {
+                pending.image_url: get_image_metadata(pending)
+                for pending in pending_images
+            }
+
             for idx, image_url in enumerate(request.image_urls):
                 business_image = BusinessImage(
-                    business_id=business.id, image_url=image_url, sort_order=idx
+                    business_id=business.id,
+                    image_url=image_url,
+                    sort_order=idx,
+                    **metadata_by_url.get(image_url, {}),
                 )
                 db.add(business_image)
 
-                pending_images = db.exec(
-                    select(PendingImage).where(PendingImage.image_url == image_url)
-                ).all()
-                for pending in pending_images:
-                    db.delete(pending)
+            for pending in pending_images:
+                db.delete(pending)
 
             db.commit()
 
         if request.logo_url:
             pending_logos = db.exec(
-                select(PendingImage).where(PendingImage.image_url == request.logo_url)
+                select(PendingImage).where(
+                    PendingImage.user_id == user_id,
+                    PendingImage.image_url == request.logo_url,
+                )
             ).all()
             for pending in pending_logos:
                 db.delete(pending)
@@ -68,7 +90,18 @@ class BusinessService:
     def search_businesses(
         self, db: Session, filters: BusinessSearchFilters, user_id: Optional[UUID] = None
     ) -> BusinessListResponse:
-        query = select(Business)
+        fields, unknown_fields = resolve_fields(
+            BusinessSearchResponse, filters.fields, BUSINESS_SEARCH_FIELD_PRESETS
+        )
+        if unknown_fields:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Unknown fields: {', '.join(unknown_fields)}",
+            )
+
+        query = select_columns(
+            Business, [name for name in fields if name in Business.model_fields]
+        )
 
         conditions = []
 
@@ -90,25 +123,25 @@ class BusinessService:
         query = query.order_by(Business.created_at.desc())
         query = query.offset(filters.offset).limit(filters.limit)
 
-        businesses = db.exec(query).all()
+        businesses = db.exec(query).mappings().all()
 
-        business_ids = [business.id for business in businesses]
-        review_stats = self.review_service.get_batch_review_stats(
-            db, "business", business_ids
-        )
+        business_ids = [business["id"] for business in businesses]
+        review_stats = {}
+        if "review_count" in fields or "average_rating" in fields:
+            review_stats = self.review_service.get_batch_review_stats(
+                db, "business", business_ids
+            )
 
         business_responses = []
         for business in businesses:
-            review_count, average_rating = review_stats.get(business.id, (0, None))
+            business_values = dict(business)
+            review_count, average_rating = review_stats.get(business["id"], (0, None))
+            if "review_count" in fields:
+                business_values["review_count"] = review_count
+            if "average_rating" in fields:
+                business_values["average_rating"] = average_rating
             business_responses.append(
-                BusinessSearchResponse(
-                    id=business.id,
-                    shop_name=business.shop_name,
-                    category=business.category,
-                    logo_url=business.logo_url,
-                    review_count=review_count,
-                    average_rating=average_rating,
-                )
+                BusinessSearchResponse.model_validate(business_values)
             )
 
         return BusinessListResponse(
@@ -150,27 +183,42 @@ class BusinessService:
             existing_images = db.exec(
                 select(BusinessImage).where(BusinessImage.business_id == business_id)
             ).all()
+            metadata_by_url = {
+                img.image_url: get_image_metadata(img) for img in existing_images
+            }
             for img in existing_images:
                 db.delete(img)
 
+            pending_images = []
+            if image_urls:
+                pending_images = db.exec(
+                    select(PendingImage).where(
+                        PendingImage.user_id == user_id,
+                        PendingImage.image_url.in_(image_urls),
+                    )
+                ).all()
+            for pending in pending_images:
+                metadata_by_url[pending.image_url] = get_image_metadata(pending)
+
             for idx, image_url in enumerate(image_urls):
                 business_image = BusinessImage(
-                    business_id=business.id, image_url=image_url, sort_order=idx
+                    business_id=business.id,
+                    image_url=image_url,
+                    sort_order=idx,
+                    **metadata_by_url.get(image_url, {}),
                 )
                 db.add(business_image)
 
-                pending_images = db.exec(
-                    select(PendingImage).where(PendingImage.image_url == image_url)
-                ).all()
-                for pending in pending_images:
-                    db.delete(pending)
+            for pending in pending_images:
+                db.delete(pending)
 
             db.commit()
 
         if "logo_url" in update_data and update_data["logo_url"]:
             pending_logos = db.exec(
                 select(PendingImage).where(
-                    PendingImage.image_url == update_data["logo_url"]
+                    PendingImage.user_id == user_id,
+                    PendingImage.image_url == update_data["logo_url"],
                 )
             ).all()
             for pending in pending_logos:
@@ -196,7 +244,9 @@ class BusinessService:
     def get_my_businesses(
         self, db: Session, user_id: UUID, limit: int = 20, offset: int = 0
     ) -> BusinessListResponse:
-        query = select(Business).where(Business.owner_user_id == user_id)
+        query = select_response_columns(Business, BusinessSearchResponse).where(
+            Business.owner_user_id == user_id
+        )
 
         total_query = (
             select(func.count())
@@ -219,7 +269,7 @@ class BusinessService:
         for business in businesses:
             review_count, average_rating = review_stats.get(business.id, (0, None))
             logo_url = (
-                convert_s3_url_to_public_url(business.logo_url)
+                get_image_rendition_url(business.logo_url, ImageRendition.thumb)
                 if business.logo_url
                 else None
             )
@@ -262,17 +312,17 @@ class BusinessService:
         )
 
         business_dict = business.model_dump()
-        if business_dict.get("logo_url"):
-            business_dict["logo_url"] = convert_s3_url_to_public_url(
-                business_dict["logo_url"]
-            )
         business_dict["images"] = [
             BusinessImageResponse(
                 id=img.id,
                 business_id=img.business_id,
-                image_url=convert_s3_url_to_public_url(img.image_url),
+                image_url=img.image_url,
                 caption=img.caption,
                 sort_order=img.sort_order,
+                width=img.width,
+                height=img.height,
+                byte_size=img.byte_size,
+                renditions=get_image_renditions(img.image_url),
             )
             for img in images
         ]
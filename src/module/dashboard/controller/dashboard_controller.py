@@ -22,5 +22,5 @@ def get_dashboard_stats(
     stats = dashboard_service.get_dashboard_stats(db, current_user)
     return Response.success(
         message="Dashboard stats retrieved successfully",
-        data=stats.model_dump(mode="json"),
+        data=stats,
     )
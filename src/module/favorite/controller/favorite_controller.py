@@ -26,7 +26,7 @@ def create_favorite(
     favorite = favorite_service.create_favorite(db, current_user, request)
     return Response.success(
         message="Favorite created successfully",
-        data=favorite.model_dump(mode="json"),
+        data=favorite,
         status_code=Status.CREATED,
     )
 
@@ -67,7 +67,7 @@ def list_favorites(
     result = favorite_service.list_favorites(db, filters)
     return Response.success(
         message="Favorites retrieved successfully",
-        data=result.model_dump(mode="json"),
+        data=result,
     )
 
 
@@ -85,7 +85,7 @@ def get_my_favorites(
     result = favorite_service.get_my_favorites(db, current_user, limit, offset)
     return Response.success(
         message="Favorites retrieved successfully",
-        data=result.model_dump(mode="json"),
+        data=result,
     )
 
 
@@ -4,6 +4,7 @@ from fastapi import HTTPException
 from sqlalchemy import and_, func
 from sqlmodel import Session, select
 
+from src.common.utils.row_query import select_response_columns
 from src.database.postgres.models.db_models import Market, MarketFavorite
 from src.module.favorite.schema.favorite_schema import (
     FavoriteCreateRequest,
@@ -62,7 +63,7 @@ class FavoriteService:
     def list_favorites(
         self, db: Session, filters: FavoriteListFilters
     ) -> FavoriteListResponse:
-        query = select(MarketFavorite)
+        query = select_response_columns(MarketFavorite, FavoriteResponse)
 
         conditions = []
 
@@ -84,11 +85,10 @@ class FavoriteService:
         query = query.order_by(MarketFavorite.created_at.desc())
         query = query.offset(filters.offset).limit(filters.limit)
 
-        favorites = db.exec(query).all()
+        favorites = db.exec(query).mappings().all()
 
         favorite_responses = [
-            FavoriteResponse.model_validate(favorite.model_dump())
-            for favorite in favorites
+            FavoriteResponse.model_validate(favorite) for favorite in favorites
         ]
 
         return FavoriteListResponse(
@@ -3,13 +3,17 @@ from typing import Annotated
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
 
 from src.common.logger import logger
 from src.common.utils.response import Response, StandardResponse, Status
 from src.database.dependency.db_dependency import DatabaseDep
 from src.database.postgres.models.db_models import Market, MarketImage
 from src.module.auth.dependency.auth_dependency import get_current_user, get_optional_user
-from src.module.market.dependency.market_dependency import MarketServiceDep
+from src.module.market.dependency.market_dependency import (
+    MarketOwnershipDep,
+    MarketServiceDep,
+)
 from src.module.market.schema.market_schema import (
     MarketCreateRequest,
     MarketImageResponse,
@@ -32,7 +36,7 @@ def create_market(
     market = market_service.create_market(db, current_user, request)
     return Response.success(
         message="Market created successfully",
-        data=market.model_dump(mode="json"),
+        data=market,
         status_code=Status.CREATED,
     )
 
@@ -54,6 +58,7 @@ def search_markets(
     aesthetic: Annotated[str | None, Query()] = None,
     market_size: Annotated[str | None, Query()] = None,
     is_free: Annotated[bool | None, Query()] = None,
+    fields: Annotated[str | None, Query()] = None,
     limit: Annotated[int, Query(ge=1, le=100)] = 20,
     offset: Annotated[int, Query(ge=0)] = 0,
 ) -> StandardResponse:
@@ -75,6 +80,7 @@ def search_markets(
         aesthetic=aesthetic,
         market_size=market_size,
         is_free=is_free,
+        fields=fields,
         limit=limit,
         offset=offset,
     )
@@ -82,7 +88,8 @@ def search_markets(
     result = market_service.search_markets(db, filters, current_user)
     return Response.success(
         message="Markets retrieved successfully",
-        data=result.model_dump(mode="json"),
+        data=result,
+        exclude_unset=True,
     )
 
 
@@ -100,7 +107,7 @@ def get_my_markets(
     result = market_service.get_my_markets(db, current_user, limit, offset)
     return Response.success(
         message="Markets retrieved successfully",
-        data=result.model_dump(mode="json"),
+        data=result,
     )
 
 
@@ -114,7 +121,23 @@ def get_market(
     market = market_service.get_market_by_id(db, market_id)
     return Response.success(
         message="Market retrieved successfully",
-        data=market.model_dump(mode="json"),
+        data=market,
+    )
+
+
+@router.get("/{market_id}/applications/export.csv")
+def export_market_applications(
+    market: MarketOwnershipDep,
+    market_service: MarketServiceDep,
+    db: DatabaseDep,
+) -> StreamingResponse:
+    logger.info(f"Exporting applications for market {market.id}")
+    return StreamingResponse(
+        market_service.export_applications_csv(db, market),
+        media_type="text/csv",
+        headers={
+            "Content-Disposition": f'attachment; filename="market-{market.id}-applications.csv"'
+        },
     )
 
 
@@ -130,7 +153,7 @@ def update_market(
     market = market_service.update_market(db, market_id, current_user, request)
     return Response.success(
         message="Market updated successfully",
-        data=market.model_dump(mode="json"),
+        data=market,
     )
 
 
@@ -182,9 +205,7 @@ def update_market_image(
 
     return Response.success(
         message="Image updated successfully",
-        data=MarketImageResponse.model_validate(market_image.model_dump()).model_dump(
-            mode="json"
-        ),
+        data=MarketImageResponse.model_validate(market_image.model_dump()),
     )
 
 
@@ -2,7 +2,53 @@ from datetime import date, datetime
 from typing import Any, Dict, Literal, Optional
 from uuid import UUID
 
-from pydantic import BaseModel, Field, model_validator
+from pydantic import BaseModel, Field, field_validator, model_validator
+
+from src.common.utils.s3_url import normalize_image_urls
+from src.common.utils.sparse_fields import split_fields
+
+APPLICATION_EXPORT_COLUMNS = {
+    "application_id": "id",
+    "status": "status",
+    "applied_at": "applied_at",
+    "accepted_at": "accepted_at",
+    "confirmed_at": "confirmed_at",
+    "declined_at": "declined_at",
+    "payment_method": "payment_method",
+    "payment_status": "payment_status",
+    "notes_for_org": "notes_for_org",
+    "rejection_reason": "rejection_reason",
+}
+
+APPLICATION_EXPORT_BUSINESS_COLUMNS = {
+    "business_id": "id",
+    "shop_name": "shop_name",
+    "business_email": "email",
+    "business_phone": "phone",
+    "website_url": "website_url",
+    "instagram_handle": "instagram_handle",
+    "category": "category",
+}
+
+MARKET_SEARCH_FIELD_PRESETS = {
+    "map": ["id", "market_name", "latitude", "longitude", "logo_url"],
+    "list": [
+        "id",
+        "market_name",
+        "location_text",
+        "city",
+        "start_date",
+        "end_date",
+        "image_url",
+        "review_count",
+        "average_rating",
+        "is_free",
+        "cost_amount",
+        "cost_currency",
+        "is_favorited",
+        "has_applied",
+    ],
+}
 
 
 class MarketCreateRequest(BaseModel):
@@ -31,6 +77,11 @@ class MarketCreateRequest(BaseModel):
     cost_amount: Optional[float] = None
     cost_currency: Optional[Literal["CAD", "USD"]] = None
 
+    @field_validator("logo_url", "image_urls")
+    @classmethod
+    def normalize_image_url_fields(cls, value):
+        return normalize_image_urls(value)
+
     @model_validator(mode="after")
     def validate_cost_fields(self):
         if not self.is_free:
@@ -73,6 +124,11 @@ class MarketUpdateRequest(BaseModel):
     cost_amount: Optional[float] = None
     cost_currency: Optional[Literal["CAD", "USD"]] = None
 
+    @field_validator("logo_url", "image_urls")
+    @classmethod
+    def normalize_image_url_fields(cls, value):
+        return normalize_image_urls(value)
+
     @model_validator(mode="after")
     def validate_cost_fields(self):
         if self.is_free is False:
@@ -96,6 +152,10 @@ class MarketImageResponse(BaseModel):
     image_url: str
     caption: Optional[str] = None
     sort_order: Optional[int] = None
+    width: Optional[int] = None
+    height: Optional[int] = None
+    byte_size: Optional[int] = None
+    renditions: Optional[Dict[str, str]] = None
 
 
 class MarketImageCreateRequest(BaseModel):
@@ -159,9 +219,15 @@ class MarketSearchFilters(BaseModel):
     aesthetic: Optional[str] = None
     market_size: Optional[str] = None
     is_free: Optional[bool] = None
+    fields: Optional[list[str]] = None
     limit: int = Field(default=20, ge=1, le=100)
     offset: int = Field(default=0, ge=0)
 
+    @field_validator("fields", mode="before")
+    @classmethod
+    def split_field_names(cls, value):
+        return split_fields(value)
+
 
 class MarketSearchResponse(BaseModel):
     id: UUID
@@ -187,6 +253,7 @@ class MarketSearchResponse(BaseModel):
     application_deadline: Optional[datetime] = None
     images: Optional[list[str]] = None
     is_favorited: Optional[bool] = None
+    has_applied: Optional[bool] = None
 
 
 class MarketListResponse(BaseModel):
@@ -1,12 +1,20 @@
-from datetime import datetime, timedelta, timezone
-from typing import Optional
+from typing import Iterator, Optional
 from uuid import UUID
 
 from fastapi import HTTPException
 from sqlalchemy import and_, exists, func, or_
 from sqlmodel import Session, select
 
-from src.common.utils.s3_url import convert_s3_url_to_public_url
+from src.common.config import settings
+from src.common.utils.csv_export import render_csv_rows
+from src.common.utils.image_metadata import get_image_metadata
+from src.common.utils.row_query import get_response_columns, select_columns
+from src.common.utils.s3_url import (
+    ImageRendition,
+    get_image_rendition_url,
+    get_image_renditions,
+)
+from src.common.utils.sparse_fields import resolve_fields
 from src.database.postgres.models.db_models import (
     Application,
     Business,
@@ -17,6 +25,9 @@ from src.database.postgres.models.db_models import (
 )
 from src.downstream.google.google_places_client import GooglePlacesClient
 from src.module.market.schema.market_schema import (
+    APPLICATION_EXPORT_BUSINESS_COLUMNS,
+    APPLICATION_EXPORT_COLUMNS,
+    MARKET_SEARCH_FIELD_PRESETS,
     MarketCreateRequest,
     MarketListResponse,
     MarketResponse,
@@ -53,23 +64,37 @@ class MarketService:
         db.refresh(market)
 
         if request.image_urls:
+            pending_images = db.exec(
+                select(PendingImage).where(
+                    PendingImage.user_id == user_id,
+                    PendingImage.image_url.in_(request.image_urls),
+                )
+            ).all()
+            metadata_by_url = {
+                pending.image_url: get_image_metadata(pending)
+                for pending in pending_images
+            }
+
             for idx, image_url in enumerate(request.image_urls):
                 market_image = MarketImage(
-                    market_id=market.id, image_url=image_url, sort_order=idx
+                    market_id=market.id,
+                    image_url=image_url,
+                    sort_order=idx,
+                    **metadata_by_url.get(image_url, {}),
                 )
                 db.add(market_image)
 
-                pending_images = db.exec(
-                    select(PendingImage).where(PendingImage.image_url == image_url)
-                ).all()
-                for pending in pending_images:
-                    db.delete(pending)
+            for pending in pending_images:
+                db.delete(pending)
 
             db.commit()
 
         if request.logo_url:
             pending_logos = db.exec(
-                select(PendingImage).where(PendingImage.image_url == request.logo_url)
+                select(PendingImage).where(
+                    PendingImage.user_id == user_id,
+                    PendingImage.image_url == request.logo_url,
+                )
             ).all()
             for pending in pending_logos:
                 db.delete(pending)
@@ -87,6 +112,19 @@ class MarketService:
     def search_markets(
         self, db: Session, filters: MarketSearchFilters, user_id: Optional[UUID] = None
     ) -> MarketListResponse:
+        fields, unknown_fields = resolve_fields(
+            MarketSearchResponse, filters.fields, MARKET_SEARCH_FIELD_PRESETS
+        )
+        if unknown_fields:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Unknown fields: {', '.join(unknown_fields)}",
+            )
+
+        column_names = [name for name in fields if name in Market.model_fields]
+        if "image_url" in fields and "logo_url" not in column_names:
+            column_names.append("logo_url")
+
         filter_conditions = []
 
         if filters.city:
@@ -174,7 +212,7 @@ class MarketService:
                 )
             )
 
-        query = select(Market)
+        query = select_columns(Market, column_names)
         where_clause_parts = []
 
         if filter_conditions:
@@ -204,15 +242,17 @@ class MarketService:
         query = query.order_by(Market.created_at.desc())
         query = query.offset(filters.offset).limit(filters.limit)
 
-        markets = db.exec(query).all()
+        markets = db.exec(query).mappings().all()
 
-        market_ids = [market.id for market in markets]
-        review_stats = self.review_service.get_batch_review_stats(
-            db, "market", market_ids
-        )
+        market_ids = [market["id"] for market in markets]
+        review_stats = {}
+        if "review_count" in fields or "average_rating" in fields:
+            review_stats = self.review_service.get_batch_review_stats(
+                db, "market", market_ids
+            )
 
         favorited_market_ids = set()
-        if user_id is not None and market_ids:
+        if user_id is not None and market_ids and "is_favorited" in fields:
             favorites_query = select(MarketFavorite.market_id).where(
                 and_(
                     MarketFavorite.user_id == user_id,
@@ -227,93 +267,100 @@ class MarketService:
                 for row in favorited_results
             }
 
-        first_images_query = (
-            select(MarketImage)
-            .where(MarketImage.market_id.in_(market_ids))
-            .order_by(MarketImage.sort_order.asc().nulls_last(), MarketImage.id.asc())
-        )
-        all_images = db.exec(first_images_query).all()
+        applied_market_ids_on_page = set()
+        if user_id is not None and market_ids and "has_applied" in fields:
+            applied_query = (
+                select(Application.market_id)
+                .join(Business, Business.id == Application.business_id)
+                .where(
+                    and_(
+                        Business.owner_user_id == user_id,
+                        Application.market_id.in_(market_ids),
+                    )
+                )
+                .distinct()
+            )
+            applied_market_ids_on_page = set(db.exec(applied_query).all())
 
         # Group all images by market_id
         images_by_market = {}
         first_images_by_market = {}
-        for image in all_images:
-            if image.market_id not in images_by_market:
-                images_by_market[image.market_id] = []
-            images_by_market[image.market_id].append(
-                convert_s3_url_to_public_url(image.image_url)
+        if "image_url" in fields or "images" in fields:
+            first_images_query = (
+                select_columns(MarketImage, ["market_id", "image_url"])
+                .where(MarketImage.market_id.in_(market_ids))
+                .order_by(
+                    MarketImage.sort_order.asc().nulls_last(), MarketImage.id.asc()
+                )
             )
-            if image.market_id not in first_images_by_market:
-                first_images_by_market[image.market_id] = image
+            all_images = db.exec(first_images_query).all()
+
+            for image in all_images:
+                if image.market_id not in images_by_market:
+                    images_by_market[image.market_id] = []
+                images_by_market[image.market_id].append(
+                    get_image_rendition_url(image.image_url, ImageRendition.card)
+                )
+                if image.market_id not in first_images_by_market:
+                    first_images_by_market[image.market_id] = image
 
         market_responses = []
         for market in markets:
-            review_count, average_rating = review_stats.get(market.id, (0, None))
-            logo_url = (
-                convert_s3_url_to_public_url(market.logo_url)
-                if market.logo_url
-                else None
-            )
-            first_image = first_images_by_market.get(market.id)
-            image_url = (
-                convert_s3_url_to_public_url(first_image.image_url)
-                if first_image
-                else logo_url
-            )
+            market_values = {name: market[name] for name in fields if name in market}
 
-            # Get all images for this market
-            market_images = images_by_market.get(market.id, [])
+            if "logo_url" in fields:
+                market_values["logo_url"] = (
+                    get_image_rendition_url(market["logo_url"], ImageRendition.thumb)
+                    if market["logo_url"]
+                    else None
+                )
 
-            is_favorited = (
-                market.id in favorited_market_ids if user_id is not None else None
-            )
+            if "image_url" in fields:
+                first_image = first_images_by_market.get(market["id"])
+                market_values["image_url"] = (
+                    get_image_rendition_url(first_image.image_url, ImageRendition.card)
+                    if first_image
+                    else get_image_rendition_url(
+                        market["logo_url"], ImageRendition.card
+                    )
+                    if market["logo_url"]
+                    else None
+                )
 
-            market_responses.append(
-                MarketSearchResponse(
-                    id=market.id,
-                    market_name=market.market_name,
-                    location_text=market.location_text,
-                    city=market.city,
-                    country=market.country,
-                    latitude=market.latitude,
-                    longitude=market.longitude,
-                    formatted_address=market.formatted_address,
-                    start_date=market.start_date,
-                    end_date=market.end_date,
-                    logo_url=logo_url,
-                    image_url=image_url,
-                    review_count=review_count,
-                    average_rating=average_rating,
-                    aesthetic=market.aesthetic,
-                    market_size=market.market_size,
-                    is_free=market.is_free,
-                    description=market.description,
-                    cost_amount=market.cost_amount,
-                    cost_currency=market.cost_currency,
-                    application_deadline=market.application_deadline,
-                    images=market_images if market_images else None,
-                    is_favorited=is_favorited,
+            if "images" in fields:
+                market_images = images_by_market.get(market["id"], [])
+                market_values["images"] = market_images if market_images else None
+
+            review_count, average_rating = review_stats.get(market["id"], (0, None))
+            if "review_count" in fields:
+                market_values["review_count"] = review_count
+            if "average_rating" in fields:
+                market_values["average_rating"] = average_rating
+
+            if "is_favorited" in fields:
+                market_values["is_favorited"] = (
+                    market["id"] in favorited_market_ids
+                    if user_id is not None
+                    else None
+                )
+
+            if "has_applied" in fields:
+                market_values["has_applied"] = (
+                    market["id"] in applied_market_ids_on_page
+                    if user_id is not None
+                    else None
                 )
-            )
+
+            market_responses.append(MarketSearchResponse.model_validate(market_values))
 
         applied_market_ids = None
-        if user_id is not None:
-            user_businesses = db.exec(
-                select(Business).where(Business.owner_user_id == user_id)
+        if user_id is not None and settings.MARKET_SEARCH_APPLIED_MARKET_IDS_ENABLED:
+            applied_market_ids = db.exec(
+                select(Application.market_id)
+                .join(Business, Business.id == Application.business_id)
+                .where(Business.owner_user_id == user_id)
+                .distinct()
             ).all()
-            if user_businesses:
-                business_ids = [business.id for business in user_businesses]
-                applied_applications = db.exec(
-                    select(Application.market_id)
-                    .where(Application.business_id.in_(business_ids))
-                    .distinct()
-                ).all()
-                applied_market_ids = [
-                    app[0]
-                    if hasattr(app, "__getitem__") and not isinstance(app, UUID)
-                    else app
-                    for app in applied_applications
-                ]
 
         return MarketListResponse(
             markets=market_responses,
@@ -362,27 +409,42 @@ class MarketService:
             existing_images = db.exec(
                 select(MarketImage).where(MarketImage.market_id == market_id)
             ).all()
+            metadata_by_url = {
+                img.image_url: get_image_metadata(img) for img in existing_images
+            }
             for img in existing_images:
                 db.delete(img)
 
+            pending_images = []
+            if image_urls:
+                pending_images = db.exec(
+                    select(PendingImage).where(
+                        PendingImage.user_id == user_id,
+                        PendingImage.image_url.in_(image_urls),
+                    )
+                ).all()
+            for pending in pending_images:
+                metadata_by_url[pending.image_url] = get_image_metadata(pending)
+
             for idx, image_url in enumerate(image_urls):
                 market_image = MarketImage(
-                    market_id=market.id, image_url=image_url, sort_order=idx
+                    market_id=market.id,
+                    image_url=image_url,
+                    sort_order=idx,
+                    **metadata_by_url.get(image_url, {}),
                 )
                 db.add(market_image)
 
-                pending_images = db.exec(
-                    select(PendingImage).where(PendingImage.image_url == image_url)
-                ).all()
-                for pending in pending_images:
-                    db.delete(pending)
+            for pending in pending_images:
+                db.delete(pending)
 
             db.commit()
 
         if "logo_url" in update_data and update_data["logo_url"]:
             pending_logos = db.exec(
                 select(PendingImage).where(
-                    PendingImage.image_url == update_data["logo_url"]
+                    PendingImage.user_id == user_id,
+                    PendingImage.image_url == update_data["logo_url"],
                 )
             ).all()
             for pending in pending_logos:
@@ -405,6 +467,75 @@ class MarketService:
         db.delete(market)
         db.commit()
 
+    def export_applications_csv(self, db: Session, market: Market) -> Iterator[str]:
+        questions = self._get_form_questions(market.application_form)
+        yield render_csv_rows(
+            [
+                [
+                    *APPLICATION_EXPORT_COLUMNS,
+                    *APPLICATION_EXPORT_BUSINESS_COLUMNS,
+                    *(label for _, label in questions),
+                ]
+            ]
+        )
+
+        query = (
+            select_columns(
+                Application,
+                [*APPLICATION_EXPORT_COLUMNS.values(), "business_id", "answers"],
+            )
+            .where(Application.market_id == market.id)
+            .order_by(Application.applied_at.asc(), Application.id.asc())
+            .execution_options(yield_per=settings.APPLICATION_STREAM_CHUNK_SIZE)
+        )
+
+        for applications in db.exec(query).mappings().partitions():
+            business_ids = list({app["business_id"] for app in applications})
+            businesses_query = select_columns(
+                Business, list(APPLICATION_EXPORT_BUSINESS_COLUMNS.values())
+            ).where(Business.id.in_(business_ids))
+            businesses = {
+                business["id"]: business
+                for business in db.exec(businesses_query).mappings().all()
+            }
+
+            rows = []
+            for application in applications:
+                business = businesses.get(
+                    application["business_id"], {"id": application["business_id"]}
+                )
+                answers = application["answers"] or {}
+                rows.append(
+                    [
+                        *(
+                            application[name]
+                            for name in APPLICATION_EXPORT_COLUMNS.values()
+                        ),
+                        *(
+                            business.get(name)
+                            for name in APPLICATION_EXPORT_BUSINESS_COLUMNS.values()
+                        ),
+                        *(answers.get(question_id) for question_id, _ in questions),
+                    ]
+                )
+            yield render_csv_rows(rows)
+
+    def _get_form_questions(
+        self, application_form: Optional[dict]
+    ) -> list[tuple[str, str]]:
+        if not isinstance(application_form, dict):
+            return []
+
+        questions = application_form.get("questions", [])
+        if not isinstance(questions, list):
+            return []
+
+        return [
+            (question["id"], question.get("label") or question["id"])
+            for question in questions
+            if isinstance(question, dict) and "id" in question
+        ]
+
     def _get_market_with_images(self, db: Session, market_id: UUID) -> MarketResponse:
         from src.module.market.schema.market_schema import MarketImageResponse
 
@@ -424,17 +555,17 @@ class MarketService:
         )
 
         market_dict = market.model_dump()
-        if market_dict.get("logo_url"):
-            market_dict["logo_url"] = convert_s3_url_to_public_url(
-                market_dict["logo_url"]
-            )
         market_dict["images"] = [
             MarketImageResponse(
                 id=img.id,
                 market_id=img.market_id,
-                image_url=convert_s3_url_to_public_url(img.image_url),
+                image_url=img.image_url,
                 caption=img.caption,
                 sort_order=img.sort_order,
+                width=img.width,
+                height=img.height,
+                byte_size=img.byte_size,
+                renditions=get_image_renditions(img.image_url),
             )
             for img in images
         ]
@@ -446,7 +577,9 @@ class MarketService:
     def get_my_markets(
         self, db: Session, user_id: UUID, limit: int = 20, offset: int = 0
     ) -> MarketListResponse:
-        query = select(Market).where(Market.organizer_user_id == user_id)
+        query = select_columns(
+            Market, get_response_columns(Market, MarketSearchResponse)
+        ).where(Market.organizer_user_id == user_id)
 
         total_query = (
             select(func.count())
@@ -458,15 +591,15 @@ class MarketService:
         query = query.order_by(Market.created_at.desc())
         query = query.offset(offset).limit(limit)
 
-        markets = db.exec(query).all()
+        markets = db.exec(query).mappings().all()
 
-        market_ids = [market.id for market in markets]
+        market_ids = [market["id"] for market in markets]
         review_stats = self.review_service.get_batch_review_stats(
             db, "market", market_ids
         )
 
         first_images_query = (
-            select(MarketImage)
+            select_columns(MarketImage, ["market_id", "image_url"])
             .where(MarketImage.market_id.in_(market_ids))
             .order_by(MarketImage.sort_order.asc().nulls_last(), MarketImage.id.asc())
         )
@@ -479,52 +612,54 @@ class MarketService:
             if image.market_id not in images_by_market:
                 images_by_market[image.market_id] = []
             images_by_market[image.market_id].append(
-                convert_s3_url_to_public_url(image.image_url)
+                get_image_rendition_url(image.image_url, ImageRendition.card)
             )
             if image.market_id not in first_images_by_market:
                 first_images_by_market[image.market_id] = image
 
         market_responses = []
         for market in markets:
-            review_count, average_rating = review_stats.get(market.id, (0, None))
+            review_count, average_rating = review_stats.get(market["id"], (0, None))
             logo_url = (
-                convert_s3_url_to_public_url(market.logo_url)
-                if market.logo_url
+                get_image_rendition_url(market["logo_url"], ImageRendition.thumb)
+                if market["logo_url"]
                 else None
             )
-            first_image = first_images_by_market.get(market.id)
+            first_image = first_images_by_market.get(market["id"])
             image_url = (
-                convert_s3_url_to_public_url(first_image.image_url)
+                get_image_rendition_url(first_image.image_url, ImageRendition.card)
                 if first_image
-                else logo_url
+                else get_image_rendition_url(market["logo_url"], ImageRendition.card)
+                if market["logo_url"]
+                else None
             )
 
             # Get all images for this market
-            market_images = images_by_market.get(market.id, [])
+            market_images = images_by_market.get(market["id"], [])
 
             market_responses.append(
                 MarketSearchResponse(
-                    id=market.id,
-                    market_name=market.market_name,
-                    location_text=market.location_text,
-                    city=market.city,
-                    country=market.country,
-                    latitude=market.latitude,
-                    longitude=market.longitude,
-                    formatted_address=market.formatted_address,
-                    start_date=market.start_date,
-                    end_date=market.end_date,
+                    id=market["id"],
+                    market_name=market["market_name"],
+                    location_text=market["location_text"],
+                    city=market["city"],
+                    country=market["country"],
+                    latitude=market["latitude"],
+                    longitude=market["longitude"],
+                    formatted_address=market["formatted_address"],
+                    start_date=market["start_date"],
+                    end_date=market["end_date"],
                     logo_url=logo_url,
                     image_url=image_url,
                     review_count=review_count,
                     average_rating=average_rating,
-                    aesthetic=market.aesthetic,
-                    market_size=market.market_size,
-                    is_free=market.is_free,
-                    description=market.description,
-                    cost_amount=market.cost_amount,
-                    cost_currency=market.cost_currency,
-                    application_deadline=market.application_deadline,
+                    aesthetic=market["aesthetic"],
+                    market_size=market["market_size"],
+                    is_free=market["is_free"],
+                    description=market["description"],
+                    cost_amount=market["cost_amount"],
+                    cost_currency=market["cost_currency"],
+                    application_deadline=market["application_deadline"],
                     images=market_images if market_images else None,
                 )
             )
@@ -535,14 +670,3 @@ class MarketService:
             limit=limit,
             offset=offset,
         )
-
-    def get_orphaned_images(
-        self, db: Session, older_than_hours: int = 24
-    ) -> list[PendingImage]:
-        cutoff_time = datetime.now(timezone.utc) - timedelta(hours=older_than_hours)
-
-        orphaned = db.exec(
-            select(PendingImage).where(PendingImage.created_at < cutoff_time)
-        ).all()
-
-        return orphaned
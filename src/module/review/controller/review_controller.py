@@ -30,7 +30,7 @@ def create_review(
     review = review_service.create_review(db, current_user, request)
     return Response.success(
         message="Review created successfully",
-        data=review.model_dump(mode="json"),
+        data=review,
         status_code=Status.CREATED,
     )
 
@@ -45,7 +45,7 @@ def get_review(
     review = review_service.get_review_by_id(db, review_id)
     return Response.success(
         message="Review retrieved successfully",
-        data=review.model_dump(mode="json"),
+        data=review,
     )
 
 
@@ -75,7 +75,7 @@ def list_reviews(
     result = review_service.list_reviews(db, filters)
     return Response.success(
         message="Reviews retrieved successfully",
-        data=result.model_dump(mode="json"),
+        data=result,
     )
 
 
@@ -91,7 +91,7 @@ def update_review(
     review = review_service.update_review(db, review_id, current_user, request)
     return Response.success(
         message="Review updated successfully",
-        data=review.model_dump(mode="json"),
+        data=review,
     )
 
 
@@ -118,5 +118,5 @@ def get_review_stats(
     stats = review_service.get_review_stats(db, target_type, target_id)
     return Response.success(
         message="Review stats retrieved successfully",
-        data=stats.model_dump(mode="json"),
+        data=stats,
     )
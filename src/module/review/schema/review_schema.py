@@ -2,7 +2,9 @@ from datetime import datetime
 from typing import Optional
 from uuid import UUID
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
+
+from src.common.utils.s3_url import normalize_image_urls
 
 
 class ReviewCreateRequest(BaseModel):
@@ -34,6 +36,11 @@ class ReviewResponse(BaseModel):
     is_published: bool
     created_at: datetime
 
+    @field_validator("author_avatar_url")
+    @classmethod
+    def normalize_image_url_fields(cls, value):
+        return normalize_image_urls(value)
+
 
 class ReviewListFilters(BaseModel):
     target_type: Optional[str] = Field(None, pattern="^(market|business)$")
@@ -1,13 +1,27 @@
 from typing import Annotated
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, File, HTTPException, Query, UploadFile
+from fastapi import (
+    APIRouter,
+    Depends,
+    File,
+    HTTPException,
+    Query,
+    Request,
+    UploadFile,
+)
 
 from src.common.logger import logger
 from src.common.utils.response import Response, StandardResponse, Status
 from src.database.dependency.db_dependency import DatabaseDep
 from src.module.auth.dependency.auth_dependency import get_current_user
 from src.module.upload.dependency.upload_dependency import UploadServiceDep
+from src.module.upload.schema.upload_schema import (
+    PresignedUploadCompleteRequest,
+    PresignedUploadRequest,
+    UploadEntityType,
+    UploadSessionCreateRequest,
+)
 
 router = APIRouter(prefix="/upload", tags=["upload"])
 
@@ -16,7 +30,8 @@ router = APIRouter(prefix="/upload", tags=["upload"])
 async def upload_image(
     file: UploadFile = File(...),
     entity_type: Annotated[
-        str, Query(description="Entity type (e.g., 'market', 'business')")
+        UploadEntityType,
+        Query(description="Entity type (e.g., 'market', 'business', 'review')"),
     ] = "market",
     current_user: Annotated[UUID, Depends(get_current_user)] = None,
     upload_service: UploadServiceDep = None,
@@ -31,7 +46,7 @@ async def upload_image(
         )
         return Response.success(
             message="Image uploaded successfully",
-            data=result.model_dump(),
+            data=result,
             status_code=Status.CREATED,
         )
     except HTTPException:
@@ -44,7 +59,8 @@ async def upload_image(
 async def upload_images(
     files: list[UploadFile] = File(...),
     entity_type: Annotated[
-        str, Query(description="Entity type (e.g., 'market', 'business')")
+        UploadEntityType,
+        Query(description="Entity type (e.g., 'market', 'business', 'review')"),
     ] = "market",
     current_user: Annotated[UUID, Depends(get_current_user)] = None,
     upload_service: UploadServiceDep = None,
@@ -59,7 +75,7 @@ async def upload_images(
         )
         return Response.success(
             message=f"Successfully uploaded {len(result.images)} image(s)",
-            data=result.model_dump(),
+            data=result,
             status_code=Status.CREATED,
         )
     except HTTPException:
@@ -69,3 +85,118 @@ async def upload_images(
             status_code=500,
             detail=f"Failed to upload images: {str(e)}",
         )
+
+
+@router.post("/presigned-url", status_code=Status.CREATED)
+def create_presigned_upload(
+    request: PresignedUploadRequest,
+    current_user: Annotated[UUID, Depends(get_current_user)],
+    upload_service: UploadServiceDep,
+    db: DatabaseDep,
+) -> StandardResponse:
+    logger.info(
+        f"Creating presigned upload for {request.entity_type} entity by user {current_user}"
+    )
+    result = upload_service.create_presigned_upload(request, current_user, db)
+    return Response.success(
+        message="Upload URL created successfully",
+        data=result,
+        status_code=Status.CREATED,
+    )
+
+
+@router.post("/presigned-url/complete")
+async def complete_presigned_upload(
+    request: PresignedUploadCompleteRequest,
+    current_user: Annotated[UUID, Depends(get_current_user)],
+    upload_service: UploadServiceDep,
+    db: DatabaseDep,
+) -> StandardResponse:
+    logger.info(f"Completing presigned upload {request.key} by user {current_user}")
+    result = await upload_service.complete_presigned_upload(
+        request.key, current_user, db
+    )
+    return Response.success(
+        message="Image uploaded successfully",
+        data=result,
+    )
+
+
+@router.post("/sessions", status_code=Status.CREATED)
+async def create_upload_session(
+    request: UploadSessionCreateRequest,
+    current_user: Annotated[UUID, Depends(get_current_user)],
+    upload_service: UploadServiceDep,
+    db: DatabaseDep,
+) -> StandardResponse:
+    logger.info(
+        f"Creating upload session for {request.entity_type} entity by user {current_user}"
+    )
+    result = await upload_service.create_upload_session(request, current_user, db)
+    return Response.success(
+        message="Upload session created successfully",
+        data=result,
+        status_code=Status.CREATED,
+    )
+
+
+@router.get("/sessions/{session_id}")
+def get_upload_session(
+    session_id: UUID,
+    current_user: Annotated[UUID, Depends(get_current_user)],
+    upload_service: UploadServiceDep,
+    db: DatabaseDep,
+) -> StandardResponse:
+    result = upload_service.get_upload_session(session_id, current_user, db)
+    return Response.success(
+        message="Upload session retrieved successfully",
+        data=result,
+    )
+
+
+@router.put("/sessions/{session_id}/chunks")
+async def upload_session_chunk(
+    session_id: UUID,
+    request: Request,
+    offset: Annotated[int, Query(ge=0, description="Byte offset of the chunk")],
+    current_user: Annotated[UUID, Depends(get_current_user)],
+    upload_service: UploadServiceDep,
+    db: DatabaseDep,
+) -> StandardResponse:
+    logger.info(
+        f"Uploading chunk at offset {offset} for session {session_id} by user {current_user}"
+    )
+    result = await upload_service.upload_session_chunk(
+        session_id, offset, request.stream(), current_user, db
+    )
+    return Response.success(
+        message="Chunk uploaded successfully",
+        data=result,
+    )
+
+
+@router.post("/sessions/{session_id}/complete")
+async def complete_upload_session(
+    session_id: UUID,
+    current_user: Annotated[UUID, Depends(get_current_user)],
+    upload_service: UploadServiceDep,
+    db: DatabaseDep,
+) -> StandardResponse:
+    logger.info(f"Completing upload session {session_id} by user {current_user}")
+    result = await upload_service.complete_upload_session(session_id, current_user, db)
+    return Response.success(
+        message="Image uploaded successfully",
+        data=result,
+    )
+
+
+@router.delete("/sessions/{session_id}")
+async def abort_upload_session(
+    session_id: UUID,
+    current_user: Annotated[UUID, Depends(get_current_user)],
+    upload_service: UploadServiceDep,
+    db: DatabaseDep,
+) -> StandardResponse:
+    logger.info(f"Aborting upload session {session_id} by user {current_user}")
+    await upload_service.abort_upload_session(session_id, current_user, db)
+    return Response.success(message="Upload session aborted successfully")
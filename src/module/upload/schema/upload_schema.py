@@ -1,10 +1,98 @@
-from pydantic import BaseModel
+from datetime import datetime
+from typing import Literal, Optional
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+
+from src.database.postgres.models.db_models import UploadSessionStatus
+
+UploadEntityType = Literal["market", "business", "review"]
 
 
 class ImageUploadResponse(BaseModel):
     url: str
     key: str
+    width: Optional[int] = None
+    height: Optional[int] = None
+    byte_size: Optional[int] = None
 
 
 class BatchImageUploadResponse(BaseModel):
     images: list[ImageUploadResponse]
+
+
+class PresignedUploadRequest(BaseModel):
+    filename: str
+    content_type: str
+    size: int = Field(gt=0)
+    entity_type: UploadEntityType = "market"
+
+
+class PresignedUploadResponse(BaseModel):
+    upload_url: str
+    method: str = "PUT"
+    headers: dict[str, str]
+    url: str
+    key: str
+    expires_in: int
+
+
+class PresignedUploadCompleteRequest(BaseModel):
+    key: str
+
+
+class UploadSessionCreateRequest(BaseModel):
+    filename: str
+    content_type: str
+    size: int = Field(gt=0)
+    entity_type: UploadEntityType = "market"
+
+
+class UploadSessionResponse(BaseModel):
+    id: UUID
+    key: str
+    url: str
+    status: UploadSessionStatus
+    chunk_size: int
+    total_bytes: int
+    bytes_received: int
+    uploaded_parts: list[int]
+    next_offset: Optional[int] = None
+    expires_at: datetime
+
+
+class ImageCleanupResult(BaseModel):
+    batches: int = 0
+    rows_deleted: int = 0
+    objects_deleted: int = 0
+    objects_retained: int = 0
+    objects_failed: int = 0
+    duration_seconds: float = 0.0
+
+
+class PendingImagePartitionResult(BaseModel):
+    partitions_created: int = 0
+    partitions_dropped: int = 0
+    rows_expired: int = 0
+    objects_deleted: int = 0
+    objects_retained: int = 0
+    objects_failed: int = 0
+    duration_seconds: float = 0.0
+
+
+class UploadSessionCleanupResult(BaseModel):
+    sessions_deleted: int = 0
+    uploads_aborted: int = 0
+    uploads_failed: int = 0
+    duration_seconds: float = 0.0
+
+
+class StorageReconciliationResult(BaseModel):
+    pages: int = 0
+    objects_scanned: int = 0
+    objects_referenced: int = 0
+    objects_too_recent: int = 0
+    objects_deleted: int = 0
+    objects_failed: int = 0
+    dry_run: bool = False
+    duration_seconds: float = 0.0
@@ -0,0 +1,468 @@
+import time
+from datetime import date, datetime, timedelta, timezone
+
+from sqlalchemy import Connection, String, column, delete, func, table, text
+from sqlalchemy.dialects.postgresql import UUID as PGUUID
+from sqlmodel import Session, select
+
+from src.common.constants import S3_PUBLIC_BUCKET_NAME
+from src.common.logger import logger
+from src.common.utils.s3_url import get_public_image_url, get_s3_image_url
+from src.database.postgres.models.db_models import UploadSession, UploadSessionStatus
+from src.database.s3.s3_client import S3Client
+from src.module.upload.schema.upload_schema import (
+    ImageCleanupResult,
+    PendingImagePartitionResult,
+    StorageReconciliationResult,
+    UploadSessionCleanupResult,
+)
+from src.module.upload.service.upload_service import UploadService
+
+PENDING_IMAGES_TABLE_NAME = "pending_images"
+PENDING_IMAGES_PARTITION_PREFIX = "pending_images_p"
+PENDING_IMAGES_DEFAULT_PARTITION = "pending_images_default"
+PENDING_IMAGES_PARTITION_DATE_FORMAT = "%Y%m%d"
+PENDING_IMAGES_MAINTENANCE_LOCK = "pending_images_partition_maintenance"
+PENDING_IMAGES_DETACH_LOCK_TIMEOUT = "5s"
+
+PENDING_IMAGES_PARTITIONS_QUERY = text("""
+    SELECT
+        child.relname,
+        inherits.inhparent IS NOT NULL AS attached,
+        coalesce(inherits.inhdetachpending, false) AS detach_pending
+    FROM pg_class child
+    JOIN pg_namespace namespace ON namespace.oid = child.relnamespace
+    LEFT JOIN pg_inherits inherits ON inherits.inhrelid = child.oid
+    WHERE namespace.nspname = current_schema()
+      AND child.relkind = 'r'
+      AND child.relname LIKE :name_pattern
+""")
+
+PENDING_IMAGES_HAS_DEFAULT_PARTITION_QUERY = text("""
+    SELECT partdefid <> 0
+    FROM pg_partitioned_table
+    WHERE partrelid = CAST(:table_name AS regclass)
+""")
+
+
+def pending_images_partition(table_name: str):
+    return table(
+        table_name,
+        column("id", PGUUID(as_uuid=True)),
+        column("image_url", String),
+        column("s3_key", String),
+        column("created_at"),
+    )
+
+
+class ImageCleanupService:
+    def __init__(self, s3_client: S3Client, upload_service: UploadService):
+        self.s3_client = s3_client
+        self.upload_service = upload_service
+
+    def collect_orphaned_images(
+        self, db: Session, older_than_hours: int, batch_size: int
+    ) -> ImageCleanupResult:
+        started_at = time.perf_counter()
+        cutoff_time = datetime.now(timezone.utc) - timedelta(hours=older_than_hours)
+        default_partition = pending_images_partition(PENDING_IMAGES_DEFAULT_PARTITION)
+        result = ImageCleanupResult()
+
+        while True:
+            orphans = db.exec(
+                select(
+                    default_partition.c.id,
+                    default_partition.c.image_url,
+                    default_partition.c.s3_key,
+                )
+                .where(default_partition.c.created_at < cutoff_time)
+                .order_by(
+                    default_partition.c.created_at.asc(), default_partition.c.id.asc()
+                )
+                .limit(batch_size)
+                .with_for_update(skip_locked=True)
+            ).all()
+            if not orphans:
+                break
+
+            db.exec(
+                delete(default_partition).where(
+                    default_partition.c.id.in_([orphan.id for orphan in orphans])
+                )
+            )
+
+            keys_by_url = {orphan.image_url: orphan.s3_key for orphan in orphans}
+            self.upload_service.lock_image_keys(db, list(keys_by_url.values()))
+            reference_counts = self.upload_service.get_image_reference_counts(
+                db, list(keys_by_url)
+            )
+            unreferenced_keys = [
+                file_key
+                for image_url, file_key in keys_by_url.items()
+                if reference_counts[image_url] == 0
+            ]
+
+            deleted_keys = self.s3_client.delete_files_sync(
+                unreferenced_keys, bucket_name=S3_PUBLIC_BUCKET_NAME
+            )
+            db.commit()
+
+            failed_keys = set(unreferenced_keys) - set(deleted_keys)
+            if failed_keys:
+                logger.warning(
+                    f"Failed to delete {len(failed_keys)} orphaned objects; "
+                    "they will be removed by storage reconciliation"
+                )
+
+            result.batches += 1
+            result.rows_deleted += len(orphans)
+            result.objects_deleted += len(deleted_keys)
+            result.objects_retained += len(keys_by_url) - len(unreferenced_keys)
+            result.objects_failed += len(failed_keys)
+
+            if len(orphans) < batch_size:
+                break
+
+        result.duration_seconds = round(time.perf_counter() - started_at, 3)
+        logger.info(
+            f"Orphaned image cleanup finished: {result.rows_deleted} rows and "
+            f"{result.objects_deleted} objects deleted in {result.batches} batches "
+            f"({result.objects_retained} still referenced, {result.objects_failed} failed) "
+            f"in {result.duration_seconds}s"
+        )
+        return result
+
+    def collect_expired_upload_sessions(
+        self, db: Session, batch_size: int
+    ) -> UploadSessionCleanupResult:
+        started_at = time.perf_counter()
+        result = UploadSessionCleanupResult()
+
+        while True:
+            expired_sessions = db.exec(
+                select(UploadSession)
+                .where(UploadSession.expires_at < datetime.now(timezone.utc))
+                .order_by(UploadSession.expires_at.asc())
+                .limit(batch_size)
+                .with_for_update(skip_locked=True)
+            ).all()
+            if not expired_sessions:
+                break
+
+            deleted_count = 0
+            for upload_session in expired_sessions:
+                if upload_session.status == UploadSessionStatus.active:
+                    try:
+                        self.s3_client.abort_multipart_upload_sync(
+                            upload_session.s3_key,
+                            upload_session.s3_upload_id,
+                            bucket_name=S3_PUBLIC_BUCKET_NAME,
+                        )
+                        result.uploads_aborted += 1
+                    except Exception as e:
+                        result.uploads_failed += 1
+                        logger.warning(
+                            f"Failed to abort upload for session {upload_session.id}: {str(e)}"
+                        )
+                        continue
+                elif upload_session.status == UploadSessionStatus.completing:
+                    try:
+                        self.s3_client.delete_files_sync(
+                            [upload_session.s3_key], bucket_name=S3_PUBLIC_BUCKET_NAME
+                        )
+                        result.uploads_aborted += 1
+                    except Exception as e:
+                        result.uploads_failed += 1
+                        logger.warning(
+                            f"Failed to delete staged upload for session {upload_session.id}: {str(e)}"
+                        )
+                        continue
+                db.delete(upload_session)
+                deleted_count += 1
+            db.commit()
+            result.sessions_deleted += deleted_count
+
+            if len(expired_sessions) < batch_size or deleted_count == 0:
+                break
+
+        result.duration_seconds = round(time.perf_counter() - started_at, 3)
+        logger.info(
+            f"Expired upload session cleanup finished: "
+            f"{result.sessions_deleted} sessions deleted, "
+            f"{result.uploads_aborted} uploads aborted, {result.uploads_failed} failed "
+            f"in {result.duration_seconds}s"
+        )
+        return result
+
+    def _partition_name(self, day: date) -> str:
+        return (
+            f"{PENDING_IMAGES_PARTITION_PREFIX}"
+            f"{day.strftime(PENDING_IMAGES_PARTITION_DATE_FORMAT)}"
+        )
+
+    def _partition_day(self, table_name: str) -> date | None:
+        try:
+            return datetime.strptime(
+                table_name.removeprefix(PENDING_IMAGES_PARTITION_PREFIX),
+                PENDING_IMAGES_PARTITION_DATE_FORMAT,
+            ).date()
+        except ValueError:
+            return None
+
+    def _get_pending_image_partitions(
+        self, connection: Connection
+    ) -> dict[str, tuple[bool, bool]]:
+        rows = connection.execute(
+            PENDING_IMAGES_PARTITIONS_QUERY,
+            {"name_pattern": f"{PENDING_IMAGES_PARTITION_PREFIX}%"},
+        ).all()
+        return {
+            table_name: (attached, detach_pending)
+            for table_name, attached, detach_pending in rows
+            if self._partition_day(table_name)
+        }
+
+    def _detach_pending_image_partition(
+        self, connection: Connection, table_name: str, mode: str
+    ) -> bool:
+        try:
+            connection.execute(
+                text(
+                    f"ALTER TABLE {PENDING_IMAGES_TABLE_NAME} "
+                    f"DETACH PARTITION {table_name} {mode}"
+                )
+            )
+            return True
+        except Exception as e:
+            logger.warning(f"Failed to detach partition {table_name}: {str(e)}")
+            return False
+
+    def _create_pending_image_partition(self, db: Session, day: date) -> bool:
+        partition_name = self._partition_name(day)
+        try:
+            db.exec(
+                text(
+                    f"CREATE TABLE {partition_name} "
+                    f"PARTITION OF {PENDING_IMAGES_TABLE_NAME} "
+                    f"FOR VALUES FROM ('{day.isoformat()}') "
+                    f"TO ('{(day + timedelta(days=1)).isoformat()}')"
+                )
+            )
+            db.commit()
+            return True
+        except Exception as e:
+            db.rollback()
+            logger.warning(f"Failed to create partition {partition_name}: {str(e)}")
+            return False
+
+    def _drain_pending_image_partition(
+        self,
+        db: Session,
+        table_name: str,
+        batch_size: int,
+        result: PendingImagePartitionResult,
+    ) -> None:
+        partition = pending_images_partition(table_name)
+        last_id = None
+
+        while True:
+            statement = select(
+                partition.c.id, partition.c.image_url, partition.c.s3_key
+            )
+            if last_id is not None:
+                statement = statement.where(partition.c.id > last_id)
+            rows = db.exec(
+                statement.order_by(partition.c.id.asc()).limit(batch_size)
+            ).all()
+            if not rows:
+                break
+            last_id = rows[-1].id
+
+            keys_by_url = {row.image_url: row.s3_key for row in rows}
+            self.upload_service.lock_image_keys(db, list(keys_by_url.values()))
+            reference_counts = self.upload_service.get_image_reference_counts(
+                db, list(keys_by_url)
+            )
+            unreferenced_keys = [
+                file_key
+                for image_url, file_key in keys_by_url.items()
+                if reference_counts[image_url] == 0
+            ]
+            deleted_keys = self.s3_client.delete_files_sync(
+                unreferenced_keys, bucket_name=S3_PUBLIC_BUCKET_NAME
+            )
+            db.commit()
+
+            result.rows_expired += len(rows)
+            result.objects_deleted += len(deleted_keys)
+            result.objects_retained += len(keys_by_url) - len(unreferenced_keys)
+            result.objects_failed += len(unreferenced_keys) - len(deleted_keys)
+
+            if len(rows) < batch_size:
+                break
+
+        db.exec(text(f"DROP TABLE {table_name}"))
+        db.commit()
+        result.partitions_dropped += 1
+
+    def _maintain_pending_image_partitions(
+        self,
+        db: Session,
+        connection: Connection,
+        days_ahead: int,
+        older_than_hours: int,
+        batch_size: int,
+        result: PendingImagePartitionResult,
+    ) -> None:
+        now = datetime.now(timezone.utc)
+        expiry_day = (now - timedelta(hours=older_than_hours)).date()
+
+        partitions = self._get_pending_image_partitions(connection)
+        for offset in range(days_ahead + 1):
+            day = now.date() + timedelta(days=offset)
+            if self._partition_name(day) not in partitions:
+                if self._create_pending_image_partition(db, day):
+                    result.partitions_created += 1
+
+        has_default_partition = connection.execute(
+            PENDING_IMAGES_HAS_DEFAULT_PARTITION_QUERY,
+            {"table_name": PENDING_IMAGES_TABLE_NAME},
+        ).scalar()
+        detach_mode = "" if has_default_partition else "CONCURRENTLY"
+
+        for table_name, (attached, detach_pending) in partitions.items():
+            if detach_pending:
+                detached = self._detach_pending_image_partition(
+                    connection, table_name, "FINALIZE"
+                )
+            elif attached and self._partition_day(table_name) < expiry_day:
+                detached = self._detach_pending_image_partition(
+                    connection, table_name, detach_mode
+                )
+            else:
+                continue
+            if detached:
+                partitions[table_name] = (False, False)
+
+        for table_name, (attached, _) in sorted(partitions.items()):
+            if not attached:
+                self._drain_pending_image_partition(db, table_name, batch_size, result)
+
+    def maintain_pending_image_partitions(
+        self, db: Session, days_ahead: int, older_than_hours: int, batch_size: int
+    ) -> PendingImagePartitionResult:
+        started_at = time.perf_counter()
+        result = PendingImagePartitionResult()
+        lock_id = func.hashtext(PENDING_IMAGES_MAINTENANCE_LOCK)
+
+        with (
+            db.get_bind()
+            .connect()
+            .execution_options(isolation_level="AUTOCOMMIT") as connection
+        ):
+            if not connection.execute(
+                select(func.pg_try_advisory_lock(lock_id))
+            ).scalar():
+                logger.info(
+                    "Pending image partition maintenance is already running elsewhere"
+                )
+                return result
+            try:
+                connection.execute(
+                    text(f"SET lock_timeout = '{PENDING_IMAGES_DETACH_LOCK_TIMEOUT}'")
+                )
+                self._maintain_pending_image_partitions(
+                    db,
+                    connection,
+                    days_ahead,
+                    older_than_hours,
+                    batch_size,
+                    result,
+                )
+            finally:
+                connection.execute(text("RESET lock_timeout"))
+                connection.execute(select(func.pg_advisory_unlock(lock_id)))
+
+        result.duration_seconds = round(time.perf_counter() - started_at, 3)
+        logger.info(
+            f"Pending image partition maintenance finished: "
+            f"{result.partitions_created} partitions created, "
+            f"{result.partitions_dropped} dropped with {result.rows_expired} rows, "
+            f"{result.objects_deleted} objects deleted "
+            f"({result.objects_retained} still referenced, {result.objects_failed} failed) "
+            f"in {result.duration_seconds}s"
+        )
+        return result
+
+    def _iter_reconcile_pages(self, prefixes: list[str], page_size: int):
+        for prefix in sorted({prefix.strip("/") for prefix in prefixes} - {""}):
+            yield from self.s3_client.iter_file_pages(
+                prefix=f"{prefix}/",
+                page_size=page_size,
+                bucket_name=S3_PUBLIC_BUCKET_NAME,
+            )
+
+    def reconcile_storage(
+        self,
+        db: Session,
+        min_age_hours: int,
+        page_size: int,
+        prefixes: list[str],
+        dry_run: bool = True,
+    ) -> StorageReconciliationResult:
+        started_at = time.perf_counter()
+        cutoff_time = datetime.now(timezone.utc) - timedelta(hours=min_age_hours)
+        result = StorageReconciliationResult(dry_run=dry_run)
+
+        for objects in self._iter_reconcile_pages(prefixes, page_size):
+            result.pages += 1
+            result.objects_scanned += len(objects)
+
+            candidate_keys = []
+            for s3_object in objects:
+                if s3_object["LastModified"] >= cutoff_time:
+                    result.objects_too_recent += 1
+                else:
+                    candidate_keys.append(s3_object["Key"])
+            if not candidate_keys:
+                continue
+
+            if not dry_run:
+                self.upload_service.lock_image_keys(db, candidate_keys)
+            urls_by_key = {
+                file_key: (get_public_image_url(file_key), get_s3_image_url(file_key))
+                for file_key in candidate_keys
+            }
+            reference_counts = self.upload_service.get_image_reference_counts(
+                db, [image_url for urls in urls_by_key.values() for image_url in urls]
+            )
+
+            unreferenced_keys = [
+                file_key
+                for file_key, urls in urls_by_key.items()
+                if not any(reference_counts[image_url] for image_url in urls)
+            ]
+            result.objects_referenced += len(candidate_keys) - len(unreferenced_keys)
+
+            if dry_run:
+                db.rollback()
+                result.objects_deleted += len(unreferenced_keys)
+                continue
+
+            deleted_keys = self.s3_client.delete_files_sync(
+                unreferenced_keys, bucket_name=S3_PUBLIC_BUCKET_NAME
+            )
+            db.rollback()
+            result.objects_deleted += len(deleted_keys)
+            result.objects_failed += len(unreferenced_keys) - len(deleted_keys)
+
+        result.duration_seconds = round(time.perf_counter() - started_at, 3)
+        logger.info(
+            f"Storage reconciliation finished{' (dry run)' if dry_run else ''}: "
+            f"{result.objects_scanned} objects scanned in {result.pages} pages, "
+            f"{result.objects_deleted} unreferenced objects deleted, "
+            f"{result.objects_referenced} referenced, "
+            f"{result.objects_too_recent} too recent, {result.objects_failed} failed "
+            f"in {result.duration_seconds}s"
+        )
+        return result
@@ -1,18 +1,58 @@
-from typing import Optional
+import asyncio
+import io
+import math
+from datetime import datetime, timedelta, timezone
+from typing import AsyncIterator, Optional
 from uuid import UUID, uuid4
 
 from fastapi import HTTPException
-from sqlmodel import Session
+from sqlalchemy import func, text
+from sqlalchemy.dialects.postgresql import insert
+from sqlmodel import Session, select
 
+from src.common.config import settings
 from src.common.constants import S3_PUBLIC_BUCKET_NAME
+from src.common.logger import logger
+from src.common.utils.image_metadata import (
+    get_image_metadata,
+    read_image_dimensions,
+    read_image_metadata,
+    sniff_image_content_type,
+)
 from src.common.utils.s3_url import get_public_image_url
-from src.database.postgres.models.db_models import PendingImage
-from src.database.s3.s3_client import S3Client
+from src.database.postgres.models.db_models import (
+    Business,
+    BusinessImage,
+    Market,
+    MarketImage,
+    PendingImage,
+    ReviewImage,
+    UploadSession,
+    UploadSessionPart,
+    UploadSessionStatus,
+)
+from src.database.s3.s3_client import S3_MIN_PART_SIZE_BYTES, S3Client
 from src.module.upload.schema.upload_schema import (
     BatchImageUploadResponse,
     ImageUploadResponse,
+    PresignedUploadRequest,
+    PresignedUploadResponse,
+    UploadSessionCreateRequest,
+    UploadSessionResponse,
 )
 
+IMAGE_HEADER_READ_BYTES = 64 * 1024
+IMAGE_EXTENSIONS = {"image/jpeg": "jpg", "image/jpg": "jpg", "image/png": "png"}
+
+IMAGE_KEY_LOCK_QUERY = text("""
+    SELECT pg_advisory_xact_lock(lock_id)
+    FROM (
+        SELECT DISTINCT hashtext(file_key) AS lock_id
+        FROM unnest(CAST(:file_keys AS text[])) AS file_key
+    ) AS image_keys
+    ORDER BY lock_id
+""")
+
 
 class UploadService:
     def __init__(self, s3_client: S3Client):
@@ -21,10 +61,41 @@ class UploadService:
         self.allowed_extensions = ["jpg", "jpeg", "png"]
 
     def _validate_image_file(self, file, filename: Optional[str] = None) -> str:
-        if (
-            not file.content_type
-            or file.content_type.lower() not in self.allowed_content_types
-        ):
+        self._validate_image(file.content_type, filename, file.size)
+        return self._validate_image_content(file.file, filename)
+
+    def _validate_image_content(self, file, filename: Optional[str] = None) -> str:
+        content_type = sniff_image_content_type(file)
+        if content_type is None:
+            raise HTTPException(
+                status_code=400,
+                detail=f"File {filename or 'unknown'}: Content is not a valid JPEG or PNG image",
+            )
+
+        dimensions = read_image_dimensions(file)
+        if not dimensions or not all(dimensions):
+            raise HTTPException(
+                status_code=400,
+                detail=f"File {filename or 'unknown'}: Could not read image dimensions",
+            )
+
+        width, height = dimensions
+        if width * height > settings.UPLOAD_MAX_IMAGE_PIXELS:
+            raise HTTPException(
+                status_code=400,
+                detail=f"File {filename or 'unknown'}: Image of {width}x{height} exceeds the maximum of {settings.UPLOAD_MAX_IMAGE_PIXELS} pixels",
+            )
+
+        return content_type
+
+    def _validate_image(
+        self,
+        content_type: Optional[str],
+        filename: Optional[str] = None,
+        size: Optional[int] = None,
+        max_size: int = settings.UPLOAD_MAX_IMAGE_BYTES,
+    ) -> str:
+        if not content_type or content_type.lower() not in self.allowed_content_types:
             raise HTTPException(
                 status_code=400,
                 detail=f"File {filename or 'unknown'}: Only JPEG and PNG images are allowed",
@@ -39,38 +110,143 @@ class UploadService:
                 detail=f"File {filename or 'unknown'}: Must have a .jpg, .jpeg, or .png extension",
             )
 
+        if size is not None and size > max_size:
+            raise HTTPException(
+                status_code=413,
+                detail=f"File {filename or 'unknown'}: Must be at most {max_size} bytes",
+            )
+
         return file_extension
 
-    async def upload_single_image(
-        self,
-        file,
-        entity_type: str,
-        user_id: UUID,
-        db: Session,
+    async def _read_image(
+        self, file, entity_type: str, content_type: str
     ) -> ImageUploadResponse:
-        self._validate_image_file(file, file.filename)
+        metadata = await asyncio.to_thread(
+            read_image_metadata, file.file, settings.UPLOAD_MAX_IMAGE_BYTES
+        )
+        if metadata["byte_size"] > settings.UPLOAD_MAX_IMAGE_BYTES:
+            raise HTTPException(
+                status_code=413,
+                detail=f"File {file.filename}: Must be at most {settings.UPLOAD_MAX_IMAGE_BYTES} bytes",
+            )
 
-        file_extension = (
-            file.filename.split(".")[-1].lower() if "." in file.filename else "jpg"
+        content_hash = metadata.pop("sha256")
+        file_key = f"{entity_type}/{content_hash}.{IMAGE_EXTENSIONS[content_type]}"
+        return ImageUploadResponse(
+            url=get_public_image_url(file_key), key=file_key, **metadata
         )
-        file_key = f"{entity_type}/{uuid4()}.{file_extension}"
+
+    async def _upload_image(
+        self, file, uploaded_image: ImageUploadResponse, content_type: str
+    ) -> bool:
+        if await self.s3_client.file_exists(
+            uploaded_image.key, bucket_name=S3_PUBLIC_BUCKET_NAME
+        ):
+            return False
 
         await self.s3_client.upload_file(
             file.file,
-            file_key,
-            content_type=file.content_type,
+            uploaded_image.key,
+            content_type=content_type,
             bucket_name=S3_PUBLIC_BUCKET_NAME,
+            max_size=settings.UPLOAD_MAX_IMAGE_BYTES,
         )
+        return True
 
-        image_url = get_public_image_url(file_key)
+    def _build_pending_image(
+        self, user_id: UUID, uploaded_image: ImageUploadResponse
+    ) -> PendingImage:
+        return PendingImage(
+            user_id=user_id,
+            image_url=uploaded_image.url,
+            s3_key=uploaded_image.key,
+            width=uploaded_image.width,
+            height=uploaded_image.height,
+            byte_size=uploaded_image.byte_size,
+        )
 
-        pending_image = PendingImage(
-            user_id=user_id, image_url=image_url, s3_key=file_key
+    def lock_image_keys(self, db: Session, file_keys: list[str]) -> None:
+        if file_keys:
+            db.exec(IMAGE_KEY_LOCK_QUERY, params={"file_keys": list(file_keys)})
+
+    def get_image_reference_counts(
+        self, db: Session, image_urls: list[str]
+    ) -> dict[str, int]:
+        reference_counts = dict.fromkeys(image_urls, 0)
+        if not image_urls:
+            return reference_counts
+
+        for column in (
+            MarketImage.image_url,
+            BusinessImage.image_url,
+            ReviewImage.image_url,
+            PendingImage.image_url,
+            Market.logo_url,
+            Business.logo_url,
+        ):
+            rows = db.exec(
+                select(column, func.count())
+                .where(column.in_(image_urls))
+                .group_by(column)
+            ).all()
+            for image_url, count in rows:
+                reference_counts[image_url] += count
+
+        return reference_counts
+
+    async def _cleanup_uploaded_images(self, db: Session, file_keys: list[str]) -> None:
+        if not file_keys:
+            return
+
+        try:
+            await asyncio.to_thread(self.lock_image_keys, db, file_keys)
+            urls_by_key = {
+                file_key: get_public_image_url(file_key) for file_key in file_keys
+            }
+            reference_counts = self.get_image_reference_counts(
+                db, list(urls_by_key.values())
+            )
+            file_keys = [
+                file_key
+                for file_key, image_url in urls_by_key.items()
+                if reference_counts[image_url] == 0
+            ]
+            if not file_keys:
+                return
+
+            deleted_keys = await self.s3_client.delete_files(
+                file_keys, bucket_name=S3_PUBLIC_BUCKET_NAME
+            )
+        except Exception as e:
+            logger.error(f"Failed to clean up uploaded images {file_keys}: {str(e)}")
+            return
+        finally:
+            db.rollback()
+
+        if len(deleted_keys) != len(file_keys):
+            logger.error(
+                f"Failed to clean up uploaded images {sorted(set(file_keys) - set(deleted_keys))}"
+            )
+
+    async def upload_single_image(
+        self,
+        file,
+        entity_type: str,
+        user_id: UUID,
+        db: Session,
+    ) -> ImageUploadResponse:
+        content_type = await asyncio.to_thread(
+            self._validate_image_file, file, file.filename
         )
-        db.add(pending_image)
+
+        uploaded_image = await self._read_image(file, entity_type, content_type)
+
+        await asyncio.to_thread(self.lock_image_keys, db, [uploaded_image.key])
+        await self._upload_image(file, uploaded_image, content_type)
+        db.add(self._build_pending_image(user_id, uploaded_image))
         db.commit()
 
-        return ImageUploadResponse(url=image_url, key=file_key)
+        return uploaded_image
 
     async def upload_multiple_images(
         self,
@@ -89,42 +265,466 @@ class UploadService:
                 detail=f"Maximum {max_files} images can be uploaded at once",
             )
 
-        uploaded_images = []
+        content_types = [
+            await asyncio.to_thread(self._validate_image_file, file, file.filename)
+            for file in files
+        ]
 
-        try:
-            for file in files:
-                self._validate_image_file(file, file.filename)
+        uploaded_images = await asyncio.gather(
+            *(
+                self._read_image(file, entity_type, content_type)
+                for file, content_type in zip(files, content_types)
+            )
+        )
 
-                file_extension = (
-                    file.filename.split(".")[-1].lower()
-                    if "." in file.filename
-                    else "jpg"
-                )
-                file_key = f"{entity_type}/{uuid4()}.{file_extension}"
+        await asyncio.to_thread(
+            self.lock_image_keys,
+            db,
+            [uploaded_image.key for uploaded_image in uploaded_images],
+        )
 
-                await self.s3_client.upload_file(
-                    file.file,
-                    file_key,
-                    content_type=file.content_type,
-                    bucket_name=S3_PUBLIC_BUCKET_NAME,
-                )
+        semaphore = asyncio.Semaphore(settings.S3_UPLOAD_CONCURRENCY)
 
-                image_url = get_public_image_url(file_key)
+        async def upload(
+            file, uploaded_image: ImageUploadResponse, content_type: str
+        ) -> bool:
+            async with semaphore:
+                return await self._upload_image(file, uploaded_image, content_type)
 
-                pending_image = PendingImage(
-                    user_id=user_id, image_url=image_url, s3_key=file_key
+        results = await asyncio.gather(
+            *(
+                upload(file, uploaded_image, content_type)
+                for file, uploaded_image, content_type in zip(
+                    files, uploaded_images, content_types
                 )
-                db.add(pending_image)
+            ),
+            return_exceptions=True,
+        )
+
+        created_keys = [
+            uploaded_image.key
+            for uploaded_image, result in zip(uploaded_images, results)
+            if result is True
+        ]
+        errors = [result for result in results if isinstance(result, BaseException)]
 
-                uploaded_images.append(ImageUploadResponse(url=image_url, key=file_key))
+        if errors:
+            await self._cleanup_uploaded_images(db, created_keys)
+            if isinstance(errors[0], HTTPException):
+                raise errors[0]
+            raise HTTPException(
+                status_code=500,
+                detail=f"Failed to upload images: {str(errors[0])}",
+            )
 
+        try:
+            for uploaded_image in uploaded_images:
+                db.add(self._build_pending_image(user_id, uploaded_image))
             db.commit()
-        except HTTPException:
-            raise
         except Exception as e:
+            db.rollback()
+            await self._cleanup_uploaded_images(db, created_keys)
             raise HTTPException(
                 status_code=500,
                 detail=f"Failed to upload images: {str(e)}",
             )
 
-        return BatchImageUploadResponse(images=uploaded_images)
+        return BatchImageUploadResponse(images=list(uploaded_images))
+
+    def create_presigned_upload(
+        self, request: PresignedUploadRequest, user_id: UUID, db: Session
+    ) -> PresignedUploadResponse:
+        file_extension = self._validate_image(
+            request.content_type, request.filename, request.size
+        )
+        content_type = request.content_type.lower()
+        file_key = f"{request.entity_type}/{uuid4()}.{file_extension}"
+        expires_in = settings.UPLOAD_PRESIGNED_URL_EXPIRES_SECONDS
+
+        upload_url = self.s3_client.generate_presigned_upload_url(
+            file_key,
+            content_type,
+            request.size,
+            expires_in,
+            bucket_name=S3_PUBLIC_BUCKET_NAME,
+        )
+        image_url = get_public_image_url(file_key)
+
+        pending_image = PendingImage(
+            user_id=user_id, image_url=image_url, s3_key=file_key
+        )
+        db.add(pending_image)
+        db.commit()
+
+        return PresignedUploadResponse(
+            upload_url=upload_url,
+            headers={"Content-Type": content_type},
+            url=image_url,
+            key=file_key,
+            expires_in=expires_in,
+        )
+
+    async def complete_presigned_upload(
+        self, file_key: str, user_id: UUID, db: Session
+    ) -> ImageUploadResponse:
+        pending_image = db.exec(
+            select(PendingImage).where(
+                PendingImage.s3_key == file_key, PendingImage.user_id == user_id
+            )
+        ).first()
+        if not pending_image:
+            raise HTTPException(status_code=404, detail="Pending upload not found")
+
+        metadata = await self.s3_client.get_file_metadata(
+            file_key, bucket_name=S3_PUBLIC_BUCKET_NAME
+        )
+        if metadata is None:
+            raise HTTPException(
+                status_code=400, detail="Image has not been uploaded to storage yet"
+            )
+
+        content_type = (metadata.get("ContentType") or "").lower()
+        content_length = metadata.get("ContentLength") or 0
+        if (
+            content_type not in self.allowed_content_types
+            or content_length <= 0
+            or content_length > settings.UPLOAD_MAX_IMAGE_BYTES
+        ):
+            db.delete(pending_image)
+            db.commit()
+            await self._cleanup_uploaded_images(db, [file_key])
+            raise HTTPException(
+                status_code=400,
+                detail="Uploaded image does not match the allowed type or size",
+            )
+
+        header = await self.s3_client.download_file_range(
+            file_key,
+            0,
+            IMAGE_HEADER_READ_BYTES - 1,
+            bucket_name=S3_PUBLIC_BUCKET_NAME,
+        )
+        header_file = io.BytesIO(header)
+        try:
+            sniffed_content_type = self._validate_image_content(header_file, file_key)
+            if IMAGE_EXTENSIONS[sniffed_content_type] != IMAGE_EXTENSIONS[content_type]:
+                raise HTTPException(
+                    status_code=400,
+                    detail="Uploaded image content does not match its content type",
+                )
+        except HTTPException:
+            db.delete(pending_image)
+            db.commit()
+            await self._cleanup_uploaded_images(db, [file_key])
+            raise
+
+        pending_image.width, pending_image.height = read_image_dimensions(header_file)
+        pending_image.byte_size = content_length
+        db.add(pending_image)
+        db.commit()
+
+        return ImageUploadResponse(
+            url=pending_image.image_url,
+            key=file_key,
+            **get_image_metadata(pending_image),
+        )
+
+    def _get_upload_session(
+        self, session_id: UUID, user_id: UUID, db: Session
+    ) -> UploadSession:
+        upload_session = db.get(UploadSession, session_id)
+        if not upload_session or upload_session.user_id != user_id:
+            raise HTTPException(status_code=404, detail="Upload session not found")
+        return upload_session
+
+    def _get_active_upload_session(
+        self,
+        session_id: UUID,
+        user_id: UUID,
+        db: Session,
+        statuses: tuple[UploadSessionStatus, ...] = (UploadSessionStatus.active,),
+    ) -> UploadSession:
+        upload_session = self._get_upload_session(session_id, user_id, db)
+        if upload_session.status not in statuses:
+            raise HTTPException(
+                status_code=409,
+                detail=f"Upload session is {upload_session.status.value}",
+            )
+        if upload_session.expires_at <= datetime.now(timezone.utc):
+            raise HTTPException(status_code=410, detail="Upload session has expired")
+        return upload_session
+
+    def _get_upload_session_parts(
+        self, upload_session: UploadSession, db: Session
+    ) -> list[UploadSessionPart]:
+        return db.exec(
+            select(UploadSessionPart)
+            .where(UploadSessionPart.session_id == upload_session.id)
+            .order_by(UploadSessionPart.part_number.asc())
+        ).all()
+
+    def _build_upload_session_response(
+        self, upload_session: UploadSession, db: Session
+    ) -> UploadSessionResponse:
+        parts = self._get_upload_session_parts(upload_session, db)
+        uploaded_parts = [part.part_number for part in parts]
+        part_count = math.ceil(upload_session.total_bytes / upload_session.chunk_bytes)
+        missing_parts = sorted(set(range(1, part_count + 1)) - set(uploaded_parts))
+
+        return UploadSessionResponse(
+            id=upload_session.id,
+            key=upload_session.s3_key,
+            url=get_public_image_url(upload_session.s3_key),
+            status=upload_session.status,
+            chunk_size=upload_session.chunk_bytes,
+            total_bytes=upload_session.total_bytes,
+            bytes_received=sum(part.byte_size for part in parts),
+            uploaded_parts=uploaded_parts,
+            next_offset=(
+                (missing_parts[0] - 1) * upload_session.chunk_bytes
+                if missing_parts
+                else None
+            ),
+            expires_at=upload_session.expires_at,
+        )
+
+    async def _read_upload_chunk(
+        self, stream: AsyncIterator[bytes], expected_size: int
+    ) -> bytes:
+        body = bytearray()
+        async for data in stream:
+            body.extend(data)
+            if len(body) > expected_size:
+                raise HTTPException(
+                    status_code=413,
+                    detail=f"Chunk must be exactly {expected_size} bytes",
+                )
+        if len(body) != expected_size:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Chunk must be exactly {expected_size} bytes",
+            )
+        return bytes(body)
+
+    async def create_upload_session(
+        self, request: UploadSessionCreateRequest, user_id: UUID, db: Session
+    ) -> UploadSessionResponse:
+        file_extension = self._validate_image(
+            request.content_type,
+            request.filename,
+            request.size,
+            max_size=settings.UPLOAD_SESSION_MAX_IMAGE_BYTES,
+        )
+        content_type = request.content_type.lower()
+        file_key = f"{request.entity_type}/{uuid4()}.{file_extension}"
+
+        upload_id = await self.s3_client.create_multipart_upload(
+            file_key, content_type, bucket_name=S3_PUBLIC_BUCKET_NAME
+        )
+
+        upload_session = UploadSession(
+            user_id=user_id,
+            entity_type=request.entity_type,
+            filename=request.filename,
+            content_type=content_type,
+            s3_key=file_key,
+            s3_upload_id=upload_id,
+            total_bytes=request.size,
+            chunk_bytes=max(
+                settings.UPLOAD_SESSION_CHUNK_BYTES, S3_MIN_PART_SIZE_BYTES
+            ),
+            expires_at=datetime.now(timezone.utc)
+            + timedelta(seconds=settings.UPLOAD_SESSION_EXPIRES_SECONDS),
+        )
+        db.add(upload_session)
+        db.commit()
+        db.refresh(upload_session)
+
+        return self._build_upload_session_response(upload_session, db)
+
+    def get_upload_session(
+        self, session_id: UUID, user_id: UUID, db: Session
+    ) -> UploadSessionResponse:
+        upload_session = self._get_upload_session(session_id, user_id, db)
+        return self._build_upload_session_response(upload_session, db)
+
+    async def upload_session_chunk(
+        self,
+        session_id: UUID,
+        offset: int,
+        stream: AsyncIterator[bytes],
+        user_id: UUID,
+        db: Session,
+    ) -> UploadSessionResponse:
+        upload_session = self._get_active_upload_session(session_id, user_id, db)
+
+        if offset < 0 or offset >= upload_session.total_bytes:
+            raise HTTPException(
+                status_code=400, detail="Offset is outside of the upload"
+            )
+        if offset % upload_session.chunk_bytes != 0:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Offset must be a multiple of {upload_session.chunk_bytes} bytes",
+            )
+
+        expected_size = min(
+            upload_session.chunk_bytes, upload_session.total_bytes - offset
+        )
+        body = await self._read_upload_chunk(stream, expected_size)
+
+        if offset == 0:
+            header_file = io.BytesIO(body)
+            try:
+                sniffed_content_type = self._validate_image_content(
+                    header_file, upload_session.filename
+                )
+                if (
+                    IMAGE_EXTENSIONS[sniffed_content_type]
+                    != IMAGE_EXTENSIONS[upload_session.content_type]
+                ):
+                    raise HTTPException(
+                        status_code=400,
+                        detail="Uploaded image content does not match its content type",
+                    )
+            except HTTPException:
+                await self.s3_client.abort_multipart_upload(
+                    upload_session.s3_key,
+                    upload_session.s3_upload_id,
+                    bucket_name=S3_PUBLIC_BUCKET_NAME,
+                )
+                upload_session.status = UploadSessionStatus.aborted
+                db.add(upload_session)
+                db.commit()
+                raise
+
+            upload_session.width, upload_session.height = read_image_dimensions(
+                header_file
+            )
+            db.add(upload_session)
+
+        part_number = offset // upload_session.chunk_bytes + 1
+        etag = await self.s3_client.upload_part(
+            upload_session.s3_key,
+            upload_session.s3_upload_id,
+            part_number,
+            body,
+            bucket_name=S3_PUBLIC_BUCKET_NAME,
+        )
+
+        db.exec(
+            insert(UploadSessionPart)
+            .values(
+                session_id=upload_session.id,
+                part_number=part_number,
+                etag=etag,
+                byte_size=len(body),
+            )
+            .on_conflict_do_update(
+                index_elements=["session_id", "part_number"],
+                set_={"etag": etag, "byte_size": len(body)},
+            )
+        )
+        db.commit()
+        db.refresh(upload_session)
+
+        return self._build_upload_session_response(upload_session, db)
+
+    async def _complete_multipart_upload_session(
+        self, upload_session: UploadSession, db: Session
+    ) -> None:
+        parts = self._get_upload_session_parts(upload_session, db)
+        part_count = math.ceil(upload_session.total_bytes / upload_session.chunk_bytes)
+        missing_count = part_count - len(parts)
+        if missing_count > 0:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Upload is missing {missing_count} chunk(s)",
+            )
+
+        try:
+            await self.s3_client.complete_multipart_upload(
+                upload_session.s3_key,
+                upload_session.s3_upload_id,
+                [{"ETag": part.etag, "PartNumber": part.part_number} for part in parts],
+                bucket_name=S3_PUBLIC_BUCKET_NAME,
+            )
+        except HTTPException as e:
+            if e.status_code != 404 or not await self.s3_client.file_exists(
+                upload_session.s3_key, bucket_name=S3_PUBLIC_BUCKET_NAME
+            ):
+                raise
+
+        upload_session.status = UploadSessionStatus.completing
+        db.add(upload_session)
+        db.commit()
+
+    async def complete_upload_session(
+        self, session_id: UUID, user_id: UUID, db: Session
+    ) -> ImageUploadResponse:
+        upload_session = self._get_active_upload_session(
+            session_id,
+            user_id,
+            db,
+            statuses=(UploadSessionStatus.active, UploadSessionStatus.completing),
+        )
+        if upload_session.status == UploadSessionStatus.active:
+            await self._complete_multipart_upload_session(upload_session, db)
+
+        staging_key = upload_session.s3_key
+        content_hash = await self.s3_client.compute_file_sha256(
+            staging_key, bucket_name=S3_PUBLIC_BUCKET_NAME
+        )
+        file_key = (
+            f"{upload_session.entity_type}/{content_hash}."
+            f"{IMAGE_EXTENSIONS[upload_session.content_type]}"
+        )
+
+        await asyncio.to_thread(self.lock_image_keys, db, [file_key])
+        if not await self.s3_client.file_exists(
+            file_key, bucket_name=S3_PUBLIC_BUCKET_NAME
+        ):
+            await self.s3_client.copy_file(
+                staging_key, file_key, bucket_name=S3_PUBLIC_BUCKET_NAME
+            )
+
+        uploaded_image = ImageUploadResponse(
+            url=get_public_image_url(file_key),
+            key=file_key,
+            width=upload_session.width,
+            height=upload_session.height,
+            byte_size=upload_session.total_bytes,
+        )
+        upload_session.s3_key = file_key
+        upload_session.status = UploadSessionStatus.completed
+        db.add(upload_session)
+        db.add(self._build_pending_image(user_id, uploaded_image))
+        db.commit()
+
+        try:
+            await self.s3_client.delete_file(
+                staging_key, bucket_name=S3_PUBLIC_BUCKET_NAME
+            )
+        except HTTPException as e:
+            logger.warning(f"Failed to delete staged upload {staging_key}: {e.detail}")
+
+        return uploaded_image
+
+    async def abort_upload_session(
+        self, session_id: UUID, user_id: UUID, db: Session
+    ) -> None:
+        upload_session = self._get_upload_session(session_id, user_id, db)
+        if upload_session.status != UploadSessionStatus.active:
+            raise HTTPException(
+                status_code=409,
+                detail=f"Upload session is {upload_session.status.value}",
+            )
+
+        await self.s3_client.abort_multipart_upload(
+            upload_session.s3_key,
+            upload_session.s3_upload_id,
+            bucket_name=S3_PUBLIC_BUCKET_NAME,
+        )
+        upload_session.status = UploadSessionStatus.aborted
+        db.add(upload_session)
+        db.commit()
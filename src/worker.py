@@ -0,0 +1,141 @@
+import argparse
+import signal
+import threading
+
+from sqlmodel import Session
+
+from src.common.config import settings
+from src.common.logger import logger, setup_logging
+from src.database.dependency.db_dependency import postgres_client, s3_client
+from src.downstream.http.dependency import http_client_registry
+from src.downstream.resend.dependency import resend_email_client
+from src.downstream.supabase.dependency import supabase_admin_client
+from src.module.application.service.email_outbox_service import EmailOutboxService
+from src.module.application.service.email_service import ApplicationEmailService
+from src.module.upload.service.image_cleanup_service import ImageCleanupService
+from src.module.upload.service.upload_service import UploadService
+
+
+class Worker:
+    def __init__(self):
+        self.stop_event = threading.Event()
+
+    @property
+    def running(self) -> bool:
+        return not self.stop_event.is_set()
+
+    def stop(self, signum, frame) -> None:
+        logger.info(f"Received signal {signum}, shutting down worker")
+        self.stop_event.set()
+
+    def run_email_outbox(self, once: bool = False) -> None:
+        email_service = ApplicationEmailService(
+            resend_email_client, supabase_admin_client
+        )
+        outbox_service = EmailOutboxService(email_service)
+
+        logger.info("Email outbox worker started")
+        while self.running:
+            try:
+                with Session(postgres_client.engine) as db:
+                    processed = outbox_service.process_batch(
+                        db, settings.EMAIL_OUTBOX_BATCH_SIZE
+                    )
+            except Exception as e:
+                logger.error(f"Email outbox worker iteration failed: {str(e)}")
+                processed = 0
+
+            if processed < settings.EMAIL_OUTBOX_BATCH_SIZE:
+                if once:
+                    break
+                self.stop_event.wait(settings.EMAIL_OUTBOX_POLL_INTERVAL_SECONDS)
+
+        logger.info("Email outbox worker stopped")
+
+    def run_image_gc(self, once: bool = False) -> None:
+        cleanup_service = ImageCleanupService(s3_client, UploadService(s3_client))
+
+        logger.info("Image garbage collector started")
+        while self.running:
+            try:
+                with Session(postgres_client.engine) as db:
+                    cleanup_service.maintain_pending_image_partitions(
+                        db,
+                        settings.PENDING_IMAGES_PARTITION_DAYS_AHEAD,
+                        settings.IMAGE_GC_ORPHAN_AGE_HOURS,
+                        settings.IMAGE_GC_BATCH_SIZE,
+                    )
+                    cleanup_service.collect_orphaned_images(
+                        db,
+                        settings.IMAGE_GC_ORPHAN_AGE_HOURS,
+                        settings.IMAGE_GC_BATCH_SIZE,
+                    )
+                    cleanup_service.collect_expired_upload_sessions(
+                        db, settings.IMAGE_GC_BATCH_SIZE
+                    )
+            except Exception as e:
+                logger.error(f"Image garbage collection failed: {str(e)}")
+
+            if once:
+                break
+
+            self.stop_event.wait(settings.IMAGE_GC_INTERVAL_SECONDS)
+
+        logger.info("Image garbage collector stopped")
+
+    def run_storage_reconcile(self, once: bool = False, dry_run: bool = True) -> None:
+        cleanup_service = ImageCleanupService(s3_client, UploadService(s3_client))
+
+        logger.info("Storage reconciliation started")
+        while self.running:
+            try:
+                with Session(postgres_client.engine) as db:
+                    cleanup_service.reconcile_storage(
+                        db,
+                        settings.STORAGE_RECONCILE_MIN_AGE_HOURS,
+                        settings.STORAGE_RECONCILE_PAGE_SIZE,
+                        settings.STORAGE_RECONCILE_PREFIXES,
+                        dry_run=dry_run,
+                    )
+            except Exception as e:
+                logger.error(f"Storage reconciliation failed: {str(e)}")
+
+            if once:
+                break
+
+            self.stop_event.wait(settings.STORAGE_RECONCILE_INTERVAL_SECONDS)
+
+        logger.info("Storage reconciliation stopped")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Monkeybun background worker")
+    parser.add_argument(
+        "job",
+        nargs="?",
+        default="email-outbox",
+        choices=["email-outbox", "image-gc", "storage-reconcile"],
+    )
+    parser.add_argument("--once", action="store_true")
+    parser.add_argument("--delete", action="store_true")
+    args = parser.parse_args()
+
+    setup_logging()
+
+    worker = Worker()
+    signal.signal(signal.SIGTERM, worker.stop)
+    signal.signal(signal.SIGINT, worker.stop)
+
+    try:
+        if args.job == "email-outbox":
+            worker.run_email_outbox(once=args.once)
+        elif args.job == "image-gc":
+            worker.run_image_gc(once=args.once)
+        elif args.job == "storage-reconcile":
+            worker.run_storage_reconcile(once=args.once, dry_run=not args.delete)
+    finally:
+        http_client_registry.close()
+
+
+if __name__ == "__main__":
+    main()